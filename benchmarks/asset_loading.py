@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.assets import AssetRegistry
+from platformer_game.asset_loader import AssetLoader
+from platformer_game.atlas import TextureAtlas
+
+
+def load_session(registry: AssetRegistry) -> float:
+    # Everything Game and LevelEditor ask the registry for when a level opens
+    start = time.perf_counter()
+
+    registry.preload()
+
+    return (time.perf_counter() - start) * 1000
+
+
+def prefetch_session(registry: AssetRegistry, workers: int) -> tuple[float, float, int, float]:
+    # Menu frames at 60 fps update the loader until it is idle, then a level opens
+    loader = AssetLoader(workers)
+
+    start = time.perf_counter()
+    registry.prefetch(loader)
+    submit_ms = (time.perf_counter() - start) * 1000
+
+    frames = 0
+    max_update_ms = submit_ms
+
+    while not loader.idle:
+        time.sleep(1 / 60)
+
+        update_start = time.perf_counter()
+        # LevelSelection puts the assets together on the frame the loader becomes idle
+        if loader.update():
+            registry.preload()
+
+        max_update_ms = max(max_update_ms, (time.perf_counter() - update_start) * 1000)
+        frames += 1
+
+    open_ms = load_session(registry)
+    loader.shutdown()
+
+    return submit_ms, max_update_ms, frames, open_ms
+
+
+def main() -> None:
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+
+    runs = 20
+
+    print(f"{'atlas cache':>11} {'sync ms':>8} {'workers':>8} {'main thread max ms':>19} {'menu frames':>12} {'open ms':>8}")
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        # An absolute cache folder keeps the one next to the assets untouched
+        TextureAtlas.cache_folder = cache_path
+
+        for cached in (False, True):
+            sync_ms = []
+            prefetch = {1: [], 4: []}
+
+            for _ in range(runs):
+                for workers in prefetch:
+                    if not cached:
+                        for filename in os.listdir(cache_path):
+                            os.remove(os.path.join(cache_path, filename))
+
+                    prefetch[workers].append(prefetch_session(AssetRegistry("Assets"), workers))
+
+                if not cached:
+                    for filename in os.listdir(cache_path):
+                        os.remove(os.path.join(cache_path, filename))
+
+                sync_ms.append(load_session(AssetRegistry("Assets")))
+
+            for workers, results in prefetch.items():
+                print(
+                    f"{'warm' if cached else 'cold':>11} {sorted(sync_ms)[runs // 2]:>8.2f} {workers:>8} "
+                    f"{sorted(r[1] for r in results)[runs // 2]:>19.2f} {sorted(r[2] for r in results)[runs // 2]:>12} "
+                    f"{sorted(r[3] for r in results)[runs // 2]:>8.2f}"
+                )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platformer_game.tilemap import TileMap
+from platformer_game.bullet import BulletSystem
+from platformer_game.game import Game
+
+
+class ObjectBullet:
+    # What a bullet used to be: one Python object updated on its own
+
+    def __init__(self, pos: tuple[float, float], x_vel: float, y_vel: float, max_duration: int = 240):
+        self.x, self.y = pos
+        self.x_vel = x_vel
+        self.y_vel = y_vel
+        self.max_duration = max_duration
+        self.frame: int = 0
+
+
+def spawn_args(tilemap: TileMap, n: int) -> list[tuple]:
+    player_coord = tilemap.player["coord"]
+    args = []
+
+    for _ in range(n):
+        angle = random.random() * 2 * math.pi
+        pos = (player_coord[0] + random.uniform(-600, 600), player_coord[1] + random.uniform(-300, 300))
+        args.append((pos, math.cos(angle) * 5, math.sin(angle) * 5))
+
+    return args
+
+
+def run_objects(tilemap: TileMap, args: list[tuple], frames: int) -> int:
+    grid = tilemap.collision_grid
+    bullets = [ObjectBullet(*arg) for arg in args]
+
+    for _ in range(frames):
+        for bullet in bullets[:]:
+            bullet.x += bullet.x_vel
+            bullet.y += bullet.y_vel
+            bullet.frame += 1
+
+            if bullet.frame > bullet.max_duration:
+                bullets.remove(bullet)
+                continue
+
+            if grid.is_solid((int(bullet.x // grid.tilesize), int(bullet.y // grid.tilesize))):
+                bullets.remove(bullet)
+
+    return len(bullets)
+
+
+def run_system(tilemap: TileMap, args: list[tuple], frames: int) -> int:
+    bullets = BulletSystem(None)
+
+    for arg in args:
+        bullets.spawn(*arg, None)
+
+    for _ in range(frames):
+        bullets.update(1)
+        bullets.alive[:bullets.count] &= ~bullets.tile_hits(tilemap.collision_grid)
+        bullets.compact()
+
+    return len(bullets)
+
+
+def main() -> None:
+    random.seed(0)
+
+    tilemap = TileMap(None, {}, 36)
+    tilemap.load_tiles(os.path.join("Levels", "Demo levels", "lvl3.json"))
+    tilemap.build_collision_grid(Game.collision_tiles)
+
+    frames = 60
+
+    print(f"{'bullets':>8} {'objects ms/frame':>17} {'arrays ms/frame':>16} {'speedup':>8}")
+
+    for n in (100, 1000, 5000, 20000):
+        args = spawn_args(tilemap, n)
+
+        start = time.perf_counter()
+        objects_left = run_objects(tilemap, args, frames)
+        objects_ms = (time.perf_counter() - start) / frames * 1000
+
+        start = time.perf_counter()
+        system_left = run_system(tilemap, args, frames)
+        system_ms = (time.perf_counter() - start) / frames * 1000
+
+        assert objects_left == system_left
+
+        print(f"{n:>8} {objects_ms:>17.3f} {system_ms:>16.3f} {objects_ms / system_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
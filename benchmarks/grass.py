@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.grass_blade import GrassBlade
+
+
+TILESIZE: int = 36
+
+
+class TileMapStub:
+    tilesize: int = TILESIZE
+
+
+class GameStub:
+    tilemap = TileMapStub
+
+
+class SurfaceBlade:
+    # What a blade used to be: its own tilesize x tilesize surface, rotated every frame
+
+    def __init__(self, pos: tuple[int, int]):
+        self.x, self.y = pos
+
+        self.original_surf = pygame.Surface((TILESIZE, TILESIZE))
+        pygame.draw.polygon(
+            self.original_surf,
+            random.choice(GrassBlade.grass_colors),
+            [
+                (TILESIZE // 2 - 3, TILESIZE // 2 + 3),
+                (TILESIZE // 2 + 3, TILESIZE // 2 + 3),
+                (TILESIZE // 2 + random.randint(-3, 3), random.randint(0, 5)),
+            ]
+        )
+        self.original_surf.set_colorkey("black")
+        self.surf = self.original_surf.copy()
+
+    def update_angle(self, source_pos: tuple[int, int]) -> None:
+        dist = math.dist(source_pos, (self.x, self.y))
+        angle = 40 * int(max((TILESIZE - dist), 0)) / TILESIZE * (-1 if source_pos[0] < self.x else 1)
+
+        self.surf = pygame.transform.rotate(self.original_surf, angle)
+        self.surf.set_colorkey("black")
+
+    def draw(self, display: pygame.Surface) -> None:
+        display.blit(self.surf, self.surf.get_rect(center=(self.x, self.y)))
+
+
+def surface_bytes(surfaces) -> int:
+    return sum(surf.get_width() * surf.get_height() * surf.get_bytesize() for surf in surfaces)
+
+
+def main() -> None:
+    random.seed(0)
+    pygame.init()
+    display = pygame.Surface((640, 360))
+
+    frames = 60
+
+    print(f"{'blades':>7} {'surfaces KB':>12} {'prototypes KB':>14} {'rotate ms/frame':>16} {'frames ms/frame':>16}")
+
+    for blade_count in (100, 1000, 10000):
+        positions = [(random.randint(0, 640), 300) for _ in range(blade_count)]
+
+        surface_blades = [SurfaceBlade(pos) for pos in positions]
+        blades = [GrassBlade(display, GameStub, pos) for pos in positions]
+
+        # The player walks across every blade
+        sources = [(x * 640 // frames, 300) for x in range(frames)]
+
+        start = time.perf_counter()
+        for source_pos in sources:
+            for blade in surface_blades:
+                blade.update_angle(source_pos)
+                blade.draw(display)
+        rotate_ms = (time.perf_counter() - start) / frames * 1000
+
+        # Prototype frames are rendered on first use, warm them up first
+        for source_pos in sources:
+            for blade in blades:
+                blade.update_angle(source_pos)
+
+        start = time.perf_counter()
+        for source_pos in sources:
+            for blade in blades:
+                blade.update_angle(source_pos)
+                blade.draw()
+        index_ms = (time.perf_counter() - start) / frames * 1000
+
+        old_bytes = surface_bytes(blade.original_surf for blade in surface_blades) + surface_bytes(blade.surf for blade in surface_blades)
+        new_bytes = surface_bytes(
+            frame[0] for prototype in GrassBlade.prototypes for frame in prototype.frames if frame is not None
+        ) + surface_bytes(prototype.original_surf for prototype in GrassBlade.prototypes)
+
+        print(f"{blade_count:>7} {old_bytes / 1024:>12.0f} {new_bytes / 1024:>14.0f} {rotate_ms:>16.3f} {index_ms:>16.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
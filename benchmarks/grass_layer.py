@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.camera import Camera
+from platformer_game.grass_blade import GrassBlade
+from platformer_game.grass_layer import GrassLayer
+
+
+TILESIZE: int = 36
+
+
+class TileMapStub:
+    tilesize: int = TILESIZE
+
+
+class GameStub:
+    tilemap = TileMapStub
+
+
+def build_grass(display: pygame.Surface, tile_count: int) -> dict[tuple[int, int], list[GrassBlade]]:
+    # One long strip of grass tiles, 6 rows high
+    grasses: dict[tuple[int, int], list[GrassBlade]] = {}
+
+    for n in range(tile_count):
+        i, j = n // 6, 10 + n % 6
+        grasses[(i, j)] = [
+            GrassBlade(display, GameStub, (i * TILESIZE + random.randint(3, TILESIZE - 3), (j + 1) * TILESIZE))
+            for _ in range(random.randint(4, 10))
+        ]
+
+    return grasses
+
+
+def main() -> None:
+    random.seed(0)
+    pygame.init()
+    display = pygame.Surface((640, 360))
+
+    frames = 120
+
+    print(f"{'grass tiles':>11} {'blades':>7} {'draw all ms/frame':>18} {'layer ms/frame':>15} {'bakes':>6}")
+
+    for tile_count in (100, 1000, 10000):
+        grasses = build_grass(display, tile_count)
+
+        layer = GrassLayer(display, TILESIZE)
+        for indexes, blades in grasses.items():
+            layer.add_tile(indexes, blades)
+
+        # The player runs right along the strip, bending the grass around it
+        path = [(40 + frame * 4, 14) for frame in range(frames)]
+
+        def walk(draw) -> float:
+            start = time.perf_counter()
+
+            for x, j in path:
+                Camera.offset_x = x - display.get_width() // 2
+                Camera.offset_y = j * TILESIZE - display.get_height() // 2
+
+                draw((x // TILESIZE, j), (x, (j + 1) * TILESIZE))
+
+            return (time.perf_counter() - start) / frames * 1000
+
+        def draw_all(current_index: tuple[int, int], source_pos: tuple[int, int]) -> None:
+            for index_offset in GrassLayer.bend_offsets:
+                for grass_blade in grasses.get((current_index[0] + index_offset[0], current_index[1] + index_offset[1]), []):
+                    grass_blade.update_angle(source_pos)
+
+            for blades in grasses.values():
+                for grass_blade in blades:
+                    grass_blade.draw()
+
+        def draw_layer(current_index: tuple[int, int], source_pos: tuple[int, int]) -> None:
+            layer.update(current_index, source_pos)
+            layer.draw()
+
+        all_ms = walk(draw_all)
+        layer_ms = walk(draw_layer)
+
+        blade_count = sum(len(blades) for blades in grasses.values())
+        print(f"{tile_count:>11} {blade_count:>7} {all_ms:>18.3f} {layer_ms:>15.3f} {layer.bakes:>6}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.entity import Entity
+from platformer_game.hud import HUD
+
+
+def draw_lifebar(surface: pygame.Surface, rect: pygame.Rect, hp: int, max_hp: int) -> None:
+    # What Entity.draw_lifebar used to do for every entity, every frame
+    hp_ratio = hp / max_hp
+
+    background_surf = pygame.Surface((50, 10))
+    background_surf.fill((100, 100, 100))
+
+    ratio_surf = pygame.Surface((46 * hp_ratio, 6))
+    ratio_surf.fill(Entity.lifebar_gradient(hp_ratio))
+
+    background_surf.blit(ratio_surf, (2, 2))
+    surface.blit(background_surf, (rect.centerx - 25, rect.top - 20))
+
+
+def main() -> None:
+    random.seed(0)
+    pygame.init()
+    display = pygame.Surface((640, 360))
+
+    frames = 120
+
+    print(f"{'entities':>9} {'direct ms/frame':>16} {'hud ms/frame':>13}")
+
+    for entity_count in (10, 100, 1000):
+        entities = [
+            (pygame.Rect(random.randrange(640), random.randrange(360), 18, 36), random.randint(1, 3), 3)
+            for _ in range(entity_count)
+        ]
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for rect, hp, max_hp in entities:
+                draw_lifebar(display, rect, hp, max_hp)
+        direct_ms = (time.perf_counter() - start) / frames * 1000
+
+        hud = HUD(display, Entity.lifebar_gradient)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for rect, hp, max_hp in entities:
+                hud.add_lifebar(rect, hp, max_hp)
+            hud.draw()
+        hud_ms = (time.perf_counter() - start) / frames * 1000
+
+        print(f"{entity_count:>9} {direct_ms:>16.3f} {hud_ms:>13.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
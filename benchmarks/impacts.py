@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.impact import ImpactSystem
+
+
+class GameStub:
+    game_speed: float = 1
+
+
+class ObjectImpact:
+    # What an impact used to be: one Python object updated and drawn on its own
+
+    def __init__(self, surface: pygame.Surface, pos: tuple[float, float], size: float, base_size: float, angle: float, speed: float, dissipation: float, color):
+        self.surface = surface
+        self.x, self.y = pos
+        self.size = size
+        self.base_size = base_size
+        self.speed = speed
+        self.dissipation = dissipation
+        self.color = color
+
+        self.x_comp = math.cos(angle)
+        self.y_comp = math.sin(angle)
+        self.base_x_comp = math.cos(angle + math.pi / 2)
+        self.base_y_comp = math.sin(angle + math.pi / 2)
+
+    def update(self) -> None:
+        self.x += self.x_comp * self.speed
+        self.y += self.y_comp * self.speed
+        self.base_size = max(self.base_size - self.dissipation, 0)
+        self.size += self.dissipation
+
+    def draw(self) -> None:
+        pygame.draw.polygon(self.surface, self.color, [
+            (self.x + self.x_comp * self.size, self.y + self.y_comp * self.size),
+            (self.x + self.base_x_comp * self.base_size, self.y + self.base_y_comp * self.base_size),
+            (self.x - self.base_x_comp * self.base_size, self.y - self.base_y_comp * self.base_size)
+        ])
+
+
+def burst(n: int) -> tuple[tuple[float, float], list, list, list, list]:
+    pos = (random.uniform(0, 640), random.uniform(0, 360))
+    sizes = [random.randint(4, 5) for _ in range(n)]
+    base_sizes = [random.random() * 2 for _ in range(n)]
+    angles = [random.random() * 2 * math.pi for _ in range(n)]
+    speeds = [random.uniform(0.5, 3) for _ in range(n)]
+
+    return pos, sizes, base_sizes, angles, speeds
+
+
+def run_objects(surface: pygame.Surface, bursts: list, frames: int, per_frame: int) -> int:
+    impacts: list[ObjectImpact] = []
+
+    for frame in range(frames):
+        for pos, sizes, base_sizes, angles, speeds in bursts[frame * per_frame:(frame + 1) * per_frame]:
+            for size, base_size, angle, speed in zip(sizes, base_sizes, angles, speeds):
+                impacts.append(ObjectImpact(surface, pos, size, base_size, angle, speed, 0.05, (150, 0, 0)))
+
+        for impact in impacts[:]:
+            impact.update()
+            impact.draw()
+
+            if impact.base_size <= 0:
+                impacts.remove(impact)
+
+    return len(impacts)
+
+
+def run_system(surface: pygame.Surface, bursts: list, frames: int, per_frame: int, max_impacts: int) -> int:
+    impacts = ImpactSystem(surface, GameStub, max_impacts)
+
+    for frame in range(frames):
+        for pos, sizes, base_sizes, angles, speeds in bursts[frame * per_frame:(frame + 1) * per_frame]:
+            impacts.spawn(pos, sizes, base_sizes, angles, speeds, dissipation=0.05, color=(150, 0, 0))
+
+        impacts.update(1)
+        impacts.draw()
+        impacts.compact()
+
+    return len(impacts)
+
+
+def main() -> None:
+    random.seed(0)
+    pygame.init()
+    surface = pygame.Surface((640, 360))
+
+    frames = 120
+
+    print(f"{'hits/frame':>10} {'objects ms/frame':>17} {'system ms/frame':>16} {'live (objects)':>15} {'live (system)':>14}")
+
+    for per_frame in (1, 5, 20):
+        bursts = [burst(5) for _ in range(frames * per_frame)]
+
+        start = time.perf_counter()
+        objects_live = run_objects(surface, bursts, frames, per_frame)
+        objects_ms = (time.perf_counter() - start) / frames * 1000
+
+        start = time.perf_counter()
+        system_live = run_system(surface, bursts, frames, per_frame, ImpactSystem.max_impacts)
+        system_ms = (time.perf_counter() - start) / frames * 1000
+
+        print(f"{per_frame:>10} {objects_ms:>17.3f} {system_ms:>16.3f} {objects_live:>15} {system_live:>14}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
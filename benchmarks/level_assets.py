@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.assets import AssetRegistry
+from platformer_game.asset_manifest import AssetManifest
+from platformer_game.tilemap import TileMap
+
+
+def full_manifest(asset_path: str) -> AssetManifest:
+    # What loading every asset regardless of the level used to put together
+    return AssetManifest(
+        tuple(sorted(os.listdir(os.path.join(asset_path, "Tile_assets")))),
+        tuple(sorted(os.listdir(os.path.join(asset_path, "Characters")))),
+        tuple(sorted(os.path.splitext(filename)[0] for filename in os.listdir(os.path.join(asset_path, "Weapons")))),
+        tuple(sorted(os.path.splitext(filename)[0] for filename in os.listdir(os.path.join(asset_path, "Pickups"))))
+    )
+
+
+def surfaces(assets) -> list[pygame.Surface]:
+    if isinstance(assets, pygame.Surface):
+        return [assets]
+
+    found: list[pygame.Surface] = []
+    for value in (assets.values() if isinstance(assets, dict) else assets):
+        found.extend(surfaces(value))
+
+    return found
+
+
+def load(manifest: AssetManifest) -> tuple[float, int, int]:
+    # A registry that has only decoded the atlas, as it is once the menu preloaded it
+    registry = AssetRegistry("Assets")
+    registry.atlas()
+
+    start = time.perf_counter()
+    level_assets = registry.level_assets(manifest)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # Atlas frames share the sheet pixels, only images decoded on their own hold pixels of their own
+    level_surfaces = surfaces(level_assets)
+    own_bytes = sum(surf.get_width() * surf.get_height() * surf.get_bytesize() for surf in level_surfaces if surf.get_parent() is None)
+
+    return load_ms, len(level_surfaces), own_bytes
+
+
+def main() -> None:
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+
+    runs = 200
+
+    manifests = {"everything": full_manifest("Assets")}
+
+    for level_path in (
+        os.path.join("Levels", "Demo levels", "lvl3.json"),
+        os.path.join("Levels", "Level_set_test", "pickup_test.json"),
+        os.path.join("Levels", "Level_set_test", "oob_test.json")
+    ):
+        tilemap = TileMap(None, assets={})
+        tilemap.load_tiles(level_path)
+        manifests[os.path.splitext(os.path.basename(level_path))[0]] = tilemap.asset_manifest
+
+    print(f"{'manifest':>12} {'load ms':>8} {'surfaces':>9} {'own pixel bytes':>16}")
+
+    # Interleaved so every manifest sees the same cache and clock conditions
+    results: dict[str, list[tuple[float, int, int]]] = {name: [] for name in manifests}
+
+    for _ in range(runs):
+        for name, manifest in manifests.items():
+            results[name].append(load(manifest))
+
+    for name, manifest_results in results.items():
+        print(f"{name:>12} {statistics.median(r[0] for r in manifest_results):>8.3f} {manifest_results[0][1]:>9} {manifest_results[0][2]:>16}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import sys
+import glob
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platformer_game.tilemap import TileMap
+from platformer_game.level_format import BINARY_LEVEL_EXTENSION
+
+
+def time_load(tilemap: TileMap, filepath: str, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        tilemap.load_tiles(filepath)
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    tilemap = TileMap(None, {}, 36)
+
+    print(f"{'level':<40} {'json KB':>8} {'bin KB':>8} {'json ms':>8} {'bin ms':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for json_path in sorted(glob.glob(os.path.join("Levels", "*", "*.json"))):
+            tilemap.load_tiles(json_path)
+            binary_path = os.path.join(tmp_dir, os.path.basename(json_path) + BINARY_LEVEL_EXTENSION)
+            tilemap.save_tiles(binary_path)
+
+            print(
+                f"{json_path:<40} "
+                f"{os.path.getsize(json_path) / 1024:>8.1f} "
+                f"{os.path.getsize(binary_path) / 1024:>8.1f} "
+                f"{time_load(tilemap, json_path):>8.2f} "
+                f"{time_load(tilemap, binary_path):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import random
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game import Game, LevelEditor
+
+
+def open_level(window: pygame.Surface, level_path: str) -> float:
+    # What a click in LevelSelection costs until the first frame is on screen
+    random.seed(0)
+
+    start = time.perf_counter()
+    game = Game(None, window, level_path)
+
+    render_frame = game.render_frame
+
+    def first_render_frame() -> None:
+        game.game_loop = False
+        render_frame()
+
+    game.render_frame = first_render_frame
+    game.run()
+
+    return (time.perf_counter() - start) * 1000
+
+
+def open_editor(window: pygame.Surface, level_path: str) -> float:
+    start = time.perf_counter()
+    LevelEditor(None, window, level_path)
+
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    pygame.init()
+    window = pygame.display.set_mode((1280, 720))
+
+    Game.fps = 0
+
+    # The first open decodes the assets, the next ones are reported as a median
+    opens = 30
+
+    print(f"{'level':>12} {'first open ms':>14} {'next opens ms':>14} {'editor first ms':>16} {'editor next ms':>15}")
+
+    for level_path in (os.path.join("Levels", "Demo levels", "lvl3.json"), os.path.join("Levels", "Level_set_test", "pickup_test.json")):
+        times = [open_level(window, level_path) for _ in range(opens)]
+        editor_times = [open_editor(window, level_path) for _ in range(opens)]
+
+        level_name = os.path.splitext(os.path.basename(level_path))[0]
+
+        print(
+            f"{level_name:>12} {times[0]:>14.2f} {statistics.median(times[1:]):>14.2f} "
+            f"{editor_times[0]:>16.2f} {statistics.median(editor_times[1:]):>15.2f}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platformer_game.tilemap import TileMap
+from platformer_game.tile_store import TileStore, CHUNK_SIZE
+
+
+def build_large_level(filepath: str, source_path: str, copies_x: int, copies_y: int) -> int:
+    tilemap = TileMap(None, {}, 36)
+    tilemap.load_tiles(source_path)
+
+    source_chunks = tilemap.tiles.chunks
+    span_x = max(ci for ci, _ in source_chunks) - min(ci for ci, _ in source_chunks) + 1
+    span_y = max(cj for _, cj in source_chunks) - min(cj for _, cj in source_chunks) + 1
+
+    tiles = TileStore()
+    tiles.palette = list(tilemap.tiles.palette)
+    tiles.palette_indexes = dict(tilemap.tiles.palette_indexes)
+
+    for x in range(copies_x):
+        for y in range(copies_y):
+            for (ci, cj), chunk in source_chunks.items():
+                tiles.chunks[(ci + x * span_x, cj + y * span_y)] = chunk
+
+    tilemap.tiles = tiles
+    tilemap.save_tiles(filepath)
+
+    return len(tiles)
+
+
+def pan_camera(tilemap: TileMap, steps: int) -> None:
+    # Sweeps a 1920x1080 view (4x2 chunks at 36px tiles) across the level
+    for step in range(steps):
+        start_ci = step // 4
+
+        if tilemap.tiles.streamed:
+            tilemap.stream_chunks(start_ci, start_ci + 4, 0, 2)
+
+        tilemap.get_tile_type((start_ci * CHUNK_SIZE, 10))
+
+
+def measure(filepath: str, stream: bool) -> tuple[float, float]:
+    TileMap.stream_threshold = 0 if stream else 1 << 62
+
+    start = time.perf_counter()
+    tilemap = TileMap(None, {}, 36)
+    tilemap.load_tiles(filepath)
+    open_time = (time.perf_counter() - start) * 1000
+    if tilemap.tiles.streamed:
+        tilemap.tiles.close()
+
+    tracemalloc.start()
+    tilemap = TileMap(None, {}, 36)
+    tilemap.load_tiles(filepath)
+    pan_camera(tilemap, 2000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return open_time, peak / (1024 * 1024)
+
+
+def main() -> None:
+    source_path = os.path.join("Levels", "Level_set_2", "mario_map.json")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for copies_x, copies_y in [(10, 1), (100, 1), (100, 10)]:
+            filepath = os.path.join(tmp_dir, f"large_{copies_x}x{copies_y}.plvl")
+            tile_count = build_large_level(filepath, source_path, copies_x, copies_y)
+            size = os.path.getsize(filepath) / (1024 * 1024)
+
+            print(f"{copies_x}x{copies_y} mario_map: {tile_count} tiles, {size:.1f} MB")
+            for stream in (False, True):
+                open_time, peak = measure(filepath, stream)
+                print(f"    {'streamed' if stream else 'full    '} open {open_time:9.1f} ms, peak python memory {peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import os
+import sys
+import time
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.assets import AssetRegistry
+from platformer_game.atlas import TextureAtlas
+from platformer_game.pixel_cache import PixelCache
+
+
+def image_paths(asset_path: str) -> list[str]:
+    paths: list[str] = []
+
+    for root, folders, filenames in os.walk(asset_path):
+        folders[:] = [folder for folder in folders if not folder.startswith(".")]
+        paths.extend(os.path.join(root, filename) for filename in filenames if filename.endswith(".png"))
+
+    return sorted(paths)
+
+
+def decode_all(paths: list[str], cache: PixelCache | None) -> float:
+    start = time.perf_counter()
+
+    for path in paths:
+        surf = cache.load(path) if cache is not None else None
+
+        if surf is None:
+            surf = pygame.image.load(path)
+
+        surf.convert()
+
+    return (time.perf_counter() - start) * 1000
+
+
+def startup(cache_path: str | None) -> float:
+    # A launch that opens a level right away, decoding through the registry
+    registry = AssetRegistry("Assets")
+
+    start = time.perf_counter()
+
+    if cache_path is not None:
+        registry.enable_pixel_cache(cache_path)
+
+    registry.preload()
+
+    return (time.perf_counter() - start) * 1000
+
+
+def clear(folder: str) -> None:
+    for filename in os.listdir(folder):
+        os.remove(os.path.join(folder, filename))
+
+
+def main() -> None:
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+
+    runs = 30
+    paths = image_paths("Assets")
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        cache_path = os.path.join(tmp_path, "pixels")
+        atlas_path = os.path.join(tmp_path, "atlas")
+        os.makedirs(atlas_path)
+
+        cache = PixelCache(cache_path)
+        sizes: dict[str, tuple[int, int]] = {}
+
+        for path in paths:
+            surf = pygame.image.load(path).convert()
+            cache.store(path, surf)
+            sizes[path] = surf.get_size()
+
+        # Sprites and tiles are tiny, the few large images are reported apart
+        large = [path for path in paths if sizes[path][0] * sizes[path][1] > 256 * 256]
+        groups = {"sprites": [path for path in paths if path not in large], "large": large}
+
+        print(f"{'files':>8} {'count':>6} {'decode + convert ms':>20} {'mmap + convert ms':>18}")
+
+        for name, group in groups.items():
+            decoded = [decode_all(group, None) for _ in range(runs)]
+            mapped = [decode_all(group, PixelCache(cache_path)) for _ in range(runs)]
+
+            print(f"{name:>8} {len(group):>6} {statistics.median(decoded):>20.2f} {statistics.median(mapped):>18.2f}")
+
+        # An absolute cache folder keeps the ones next to the assets untouched
+        TextureAtlas.cache_folder = atlas_path
+
+        print(f"\n{'atlas cache':>11} {'no pixel cache ms':>18} {'pixel cache ms':>15}")
+
+        for atlas_cached in (False, True):
+            results = {False: [], True: []}
+
+            for _ in range(runs):
+                for pixel_cached in results:
+                    if not atlas_cached:
+                        clear(atlas_path)
+
+                    results[pixel_cached].append(startup(cache_path if pixel_cached else None))
+
+            print(
+                f"{'warm' if atlas_cached else 'cold':>11} {statistics.median(results[False]):>18.2f} "
+                f"{statistics.median(results[True]):>15.2f}"
+            )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
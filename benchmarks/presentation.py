@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+# SDL's software renderer runs headless, set SDL_RENDER_DRIVER to compare against a GPU renderer
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+import pygame
+
+from platformer_game import Game
+from platformer_game.presentation import set_presenter
+
+
+def run_frames(presentation: str, window_size: tuple[int, int], level_path: str, frames: int) -> tuple[float, int | None]:
+    random.seed(0)
+
+    if presentation == "software":
+        pygame.display.set_mode(window_size)
+
+    presenter = set_presenter(presentation, window_size)
+
+    game = Game(None, presenter.window, level_path)
+    played = 0
+
+    present = presenter.present
+
+    def counted_present() -> None:
+        nonlocal played
+        played += 1
+
+        if played >= frames:
+            game.game_loop = False
+
+        present()
+
+    presenter.present = counted_present
+
+    start = time.perf_counter()
+    game.run()
+
+    return (time.perf_counter() - start) / frames * 1000, getattr(presenter, "uploads", None)
+
+
+def main() -> None:
+    pygame.init()
+
+    level_path = os.path.join("Levels", "Demo levels", "lvl3.json")
+    frames = 300
+
+    Game.fps = 0
+
+    print(f"render driver: {os.environ['SDL_RENDER_DRIVER']}")
+    print(f"{'window':>10} {'software ms/frame':>18} {'renderer ms/frame':>18} {'textures':>9}")
+
+    for window_size in ((1280, 720), (1920, 1080)):
+        software_ms, _ = run_frames("software", window_size, level_path, frames)
+        renderer_ms, uploads = run_frames("renderer", window_size, level_path, frames)
+
+        print(f"{window_size[0]:>5}x{window_size[1]:<4} {software_ms:>18.2f} {renderer_ms:>18.2f} {uploads:>9}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
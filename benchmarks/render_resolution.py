@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game import Game
+
+
+def run_frames(window: pygame.Surface, level_path: str, frames: int) -> float:
+    random.seed(0)
+
+    game = Game(None, window, level_path)
+    played = 0
+
+    real_update = pygame.display.update
+
+    def update(*args) -> None:
+        nonlocal played
+        played += 1
+
+        if played >= frames:
+            game.game_loop = False
+
+    pygame.display.update = update
+
+    try:
+        start = time.perf_counter()
+        game.run()
+        return (time.perf_counter() - start) / frames * 1000
+    finally:
+        pygame.display.update = real_update
+
+
+def main() -> None:
+    pygame.init()
+
+    level_path = os.path.join("Levels", "Demo levels", "lvl3.json")
+    frames = 300
+
+    Game.fps = 0
+
+    print(f"{'window':>10} {'scale':>6} {'display':>9} {'ms/frame':>9}")
+
+    for window_size in ((1280, 720), (1366, 768), (1920, 1080), (2560, 1440)):
+        window = pygame.display.set_mode(window_size)
+
+        for render_scale in (1, 2, 3):
+            Game.render_scale = render_scale
+            ms = run_frames(window, level_path, frames)
+
+            display_size = (window_size[0] // render_scale, window_size[1] // render_scale)
+            print(f"{window_size[0]:>5}x{window_size[1]:<4} {render_scale:>6} {display_size[0]:>4}x{display_size[1]:<4} {ms:>9.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
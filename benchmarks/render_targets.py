@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.render_targets import RenderTargetPool, AllocationCounter
+
+
+def frame_end_allocating(display: pygame.Surface, window: pygame.Surface, shade_alpha: int) -> None:
+    # What Game.run used to do at the end of every frame
+    shade_surf = pygame.Surface(window.get_size())
+    shade_surf.set_alpha(shade_alpha)
+    display.blit(shade_surf, (0, 0))
+
+    window.blit(pygame.transform.scale(display, window.get_size()), (0, 0))
+
+
+def frame_end_pooled(display: pygame.Surface, window: pygame.Surface, shade_alpha: int, pool: RenderTargetPool) -> None:
+    if shade_alpha > 0:
+        shade_surf = pool.get("shade", display.get_size())
+        shade_surf.set_alpha(shade_alpha)
+        display.blit(shade_surf, (0, 0))
+
+    scaled_surf = pool.get("scaled", window.get_size())
+    pygame.transform.scale(display, scaled_surf.get_size(), scaled_surf)
+    window.blit(scaled_surf, (0, 0))
+
+
+def main() -> None:
+    pygame.init()
+
+    frames = 300
+
+    print(f"{'window':>10} {'shade':>6} {'allocating ms':>14} {'pooled ms':>10} {'allocs/frame':>13} {'pooled allocs/frame':>20}")
+
+    for window_size in ((1280, 720), (1920, 1080)):
+        window = pygame.Surface(window_size)
+        display = pygame.Surface((window_size[0] // 2, window_size[1] // 2))
+
+        for shade_alpha in (0, 128):
+            counter = AllocationCounter()
+            counter.install()
+
+            start = time.perf_counter()
+            for _ in range(frames):
+                frame_end_allocating(display, window, shade_alpha)
+            allocating_ms = (time.perf_counter() - start) / frames * 1000
+            allocating_count = counter.reset()
+
+            pool = RenderTargetPool()
+            frame_end_pooled(display, window, shade_alpha, pool)
+            counter.reset()
+
+            start = time.perf_counter()
+            for _ in range(frames):
+                frame_end_pooled(display, window, shade_alpha, pool)
+            pooled_ms = (time.perf_counter() - start) / frames * 1000
+            pooled_count = counter.reset()
+
+            counter.uninstall()
+
+            print(
+                f"{window_size[0]}x{window_size[1]:<5} {shade_alpha:>6} {allocating_ms:>14.3f} {pooled_ms:>10.3f} "
+                f"{allocating_count / frames:>13.1f} {pooled_count / frames:>20.1f}"
+            )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
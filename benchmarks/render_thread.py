@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game import Game
+
+
+def run_frames(window: pygame.Surface, level_path: str, frames: int, threaded: bool) -> tuple[float, tuple[float, float, float] | None]:
+    random.seed(0)
+
+    Game.threaded_rendering = threaded
+
+    game = Game(None, window, level_path)
+    played = 0
+    stats = None
+
+    render_frame = game.render_frame
+
+    def counted_render_frame() -> None:
+        nonlocal played, stats
+        played += 1
+
+        if played >= frames:
+            game.game_loop = False
+
+            # The render thread is stopped when run returns, read it while it is still there
+            if game.render_thread is not None:
+                thread = game.render_thread
+                stats = (thread.render_time / thread.frames * 1000, thread.wait_time / thread.frames * 1000, thread.overlap())
+
+        render_frame()
+
+    game.render_frame = counted_render_frame
+
+    start = time.perf_counter()
+    game.run()
+
+    return (time.perf_counter() - start) / frames * 1000, stats
+
+
+def main() -> None:
+    pygame.init()
+
+    frames = 400
+
+    Game.fps = 0
+
+    print(f"{'level':>6} {'window':>10} {'sync ms':>8} {'thread ms':>10} {'render ms':>10} {'wait ms':>8} {'overlap':>8}")
+
+    for level_name in ("lvl2", "lvl3"):
+        level_path = os.path.join("Levels", "Demo levels", f"{level_name}.json")
+
+        for window_size in ((1280, 720), (1920, 1080)):
+            window = pygame.display.set_mode(window_size)
+
+            sync_ms, _ = run_frames(window, level_path, frames, False)
+            threaded_ms, (render_ms, wait_ms, overlap) = run_frames(window, level_path, frames, True)
+
+            print(
+                f"{level_name:>6} {window_size[0]:>5}x{window_size[1]:<4} {sync_ms:>8.2f} {threaded_ms:>10.2f} "
+                f"{render_ms:>10.2f} {wait_ms:>8.2f} {overlap:>8.0%}"
+            )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.game import Game
+
+
+def time_call(function, repeat: int = 50) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    pygame.init()
+    window = pygame.display.set_mode((1280, 720))
+
+    level_path = os.path.join("Levels", "Demo levels", "lvl3.json")
+    game = Game(None, window, level_path)
+
+    print(f"load_level({level_path}): {time_call(lambda: game.load_level(level_path)):.2f} ms")
+    print(f"restore_level(): {time_call(game.restore_level):.2f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
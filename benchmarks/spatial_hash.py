@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from platformer_game.spatial_hash import SpatialHash
+
+
+WORLD_SIZE: tuple[int, int] = (4000, 1500)
+ENTITY_SIZE: tuple[int, int] = (18, 36)
+
+
+def make_rects(n: int) -> list[pygame.Rect]:
+    return [
+        pygame.Rect(random.randrange(WORLD_SIZE[0]), random.randrange(WORLD_SIZE[1]), *ENTITY_SIZE)
+        for _ in range(n)
+    ]
+
+
+def make_points(n: int) -> list[tuple[float, float]]:
+    return [(random.uniform(0, WORLD_SIZE[0]), random.uniform(0, WORLD_SIZE[1])) for _ in range(n)]
+
+
+def brute_force(rects: list[pygame.Rect], points: list[tuple[float, float]]) -> int:
+    hits = 0
+
+    for point in points:
+        for rect in rects:
+            if rect.collidepoint(point):
+                hits += 1
+                break
+
+    return hits
+
+
+def hashed(rects: list[pygame.Rect], points: list[tuple[float, float]]) -> int:
+    spatial_hash = SpatialHash(72)
+
+    # Rebuilt every tick, like Game.manage_bullets does
+    for rect in rects:
+        spatial_hash.insert(rect, rect)
+
+    hits = 0
+
+    for point in points:
+        if spatial_hash.query_point(point):
+            hits += 1
+
+    return hits
+
+
+def time_call(function, *args, repeat: int = 5) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main() -> None:
+    random.seed(0)
+
+    print(f"{'enemies':>8} {'bullets':>8} {'brute ms':>10} {'hash ms':>10} {'speedup':>8}")
+
+    for enemy_count, bullet_count in [(20, 100), (100, 1000), (300, 2000), (500, 5000), (1000, 10000)]:
+        rects = make_rects(enemy_count)
+        points = make_points(bullet_count)
+
+        brute_ms, brute_hits = time_call(brute_force, rects, points)
+        hash_ms, hash_hits = time_call(hashed, rects, points)
+
+        assert brute_hits == hash_hits
+
+        print(f"{enemy_count:>8} {bullet_count:>8} {brute_ms:>10.2f} {hash_ms:>10.2f} {brute_ms / hash_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game import Game
+from platformer_game.camera import Camera
+from platformer_game.draw_list import DrawList
+from platformer_game.sprite_batch import SpriteBatch
+
+
+def count_calls(function) -> int:
+    # Python and builtin calls made while function runs
+    calls = 0
+
+    def profile(frame, event, arg) -> None:
+        nonlocal calls
+        if event in ("call", "c_call"):
+            calls += 1
+
+    sys.setprofile(profile)
+    function()
+    sys.setprofile(None)
+
+    return calls
+
+
+def draw_direct(draw_list: DrawList, sprites: list[tuple[pygame.Surface, tuple[float, float]]]) -> None:
+    # What draw_tiles, the grass layer and pickups did for every sprite
+    for surf, pos in sprites:
+        draw_list.blit(surf, Camera.convert_pos(pos))
+
+
+def draw_batched(batch: SpriteBatch, sprites: list[tuple[pygame.Surface, tuple[float, float]]]) -> None:
+    batch.extend(sprites)
+    batch.flush()
+
+
+def game_sprites(level_path: str, frames: int) -> tuple[float, float]:
+    # Sprites and flushes per frame going through the game's batches
+    random.seed(0)
+
+    window = pygame.display.set_mode((1280, 720))
+    game = Game(None, window, level_path)
+    batches = [game.tilemap.batch, game.grass_layer.batch, game.cloud_batch, game.pickup_batch]
+
+    played = 0
+    render_frame = game.render_frame
+
+    def counted_render_frame() -> None:
+        nonlocal played
+        played += 1
+
+        if played >= frames:
+            game.game_loop = False
+
+        render_frame()
+
+    game.render_frame = counted_render_frame
+    game.run()
+
+    return sum(batch.submitted for batch in batches) / frames, sum(batch.flushes for batch in batches) / frames
+
+
+def main() -> None:
+    random.seed(0)
+    pygame.init()
+
+    frames = 200
+    sprite_surf = pygame.Surface((16, 16))
+
+    print(f"{'sprites':>8} {'direct calls':>13} {'batch calls':>12} {'direct ms':>10} {'batch ms':>9}")
+
+    for sprite_count in (10, 100, 1000):
+        sprites = [(sprite_surf, (random.uniform(0, 640), random.uniform(0, 360))) for _ in range(sprite_count)]
+
+        draw_list = DrawList(pygame.Surface((640, 360)))
+        batch = SpriteBatch(draw_list)
+
+        direct_calls = count_calls(lambda: draw_direct(draw_list, sprites))
+        draw_list.swap()
+        batch_calls = count_calls(lambda: draw_batched(batch, sprites))
+        draw_list.swap()
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            draw_direct(draw_list, sprites)
+            draw_list.execute(draw_list.swap())
+        direct_ms = (time.perf_counter() - start) / frames * 1000
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            draw_batched(batch, sprites)
+            draw_list.execute(draw_list.swap())
+        batch_ms = (time.perf_counter() - start) / frames * 1000
+
+        print(f"{sprite_count:>8} {direct_calls:>13} {batch_calls:>12} {direct_ms:>10.3f} {batch_ms:>9.3f}")
+
+    Game.fps = 0
+    Game.adaptive_quality = False
+
+    print()
+    print(f"{'level':>6} {'sprites/frame':>14} {'flushes/frame':>14} {'blit calls saved':>17}")
+
+    for level_name in ("lvl2", "lvl3"):
+        sprites, flushes = game_sprites(os.path.join("Levels", "Demo levels", f"{level_name}.json"), 400)
+
+        # Every sprite used to be its own blit call, a batch is one blits call
+        print(f"{level_name:>6} {sprites:>14.1f} {flushes:>14.1f} {sprites - flushes:>17.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from platformer_game.transform_cache import TransformCache
+from platformer_game.utils import load_folder
+
+
+def main() -> None:
+    random.seed(0)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    character_frames = load_folder(os.path.join("Assets", "Characters", "Enemy", "Walking"), colorkey=(255, 255, 255))
+    weapon = pygame.image.load(os.path.join("Assets", "Weapons", "ar.png")).convert()
+
+    frames = 120
+
+    print(f"{'entities':>9} {'transform ms/frame':>19} {'cached ms/frame':>16} {'hit rate':>9}")
+
+    for entity_count in (10, 100, 500):
+        # Each entity walks with its own animation frame and slowly turns its aim
+        entities = [
+            (random.randrange(len(character_frames)), random.random() < 0.5, random.uniform(-180, 180))
+            for _ in range(entity_count)
+        ]
+
+        def frame_poses(frame: int):
+            for frame_offset, flip, aim in entities:
+                angle = aim + frame * 0.5
+                yield character_frames[(frame + frame_offset) // 5 % len(character_frames)], flip, math.cos(math.radians(angle)) < 0, (angle + 90) % 180 - 90
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            for character_frame, flip, aim_flip, aim_angle in frame_poses(frame):
+                surf = pygame.transform.flip(character_frame, flip, False)
+                surf.set_colorkey("white")
+
+                surf = pygame.transform.flip(weapon, aim_flip, False)
+                surf.set_colorkey("white")
+                surf = pygame.transform.rotozoom(surf, aim_angle, 0.3)
+                surf.set_colorkey("black")
+        transform_ms = (time.perf_counter() - start) / frames * 1000
+
+        cache = TransformCache()
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            for character_frame, flip, aim_flip, aim_angle in frame_poses(frame):
+                cache.flipped(character_frame, flip, colorkey="white")
+                cache.rotozoomed(cache.flipped(weapon, aim_flip, colorkey="white"), aim_angle, 0.3, colorkey="black")
+        cached_ms = (time.perf_counter() - start) / frames * 1000
+
+        print(f"{entity_count:>9} {transform_ms:>19.3f} {cached_ms:>16.3f} {cache.stats()['hit_rate']:>9.1%}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
+import os
+import sys
+import logging
+
 from platformer_game import LevelSelection
 
 
 def main() -> None:
-    level_selection = LevelSelection(folderpath="Levels")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+
+    # python main.py --renderer presents frames through SDL's Renderer instead of software blits
+    presentation = "renderer" if "--renderer" in sys.argv[1:] else "software"
+
+    # python main.py --pixel-cache keeps decoded assets on disk so the next launches skip decoding
+    pixel_cache_path = os.path.join("Assets", ".pixels") if "--pixel-cache" in sys.argv[1:] else None
+
+    level_selection = LevelSelection(folderpath="Levels", presentation=presentation, pixel_cache_path=pixel_cache_path)
 
     level_selection.run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,85 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+
+import pygame
+
+
+logger = logging.getLogger(__name__)
+
+
+class AssetLoader:
+
+    def __init__(self, max_workers: int | None = None):
+        # Decoding releases the GIL, converting to the display format stays on the main thread
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="asset"
+        )
+
+        # Files being decoded, and converted surfaces waiting to be taken, keyed by absolute path
+        self.pending: dict[str, Future] = {}
+        self.loaded: dict[str, pygame.Surface] = {}
+
+        self.done: int = 0
+        self.total: int = 0
+
+        # Called as callback(done, total) on the main thread every time a file is ready
+        self.progress_callbacks: list = []
+
+    @property
+    def idle(self) -> bool:
+        return not self.pending
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 1
+
+    def submit(self, paths: list[str], decode=pygame.image.load) -> None:
+        # decode(path) runs on a worker and gives an unconverted surface
+        for path in paths:
+            path = os.path.abspath(path)
+
+            if path in self.pending or path in self.loaded:
+                continue
+
+            self.pending[path] = self.executor.submit(decode, path)
+            self.total += 1
+
+    def finish(self, path: str) -> None:
+        future = self.pending.pop(path)
+
+        try:
+            self.loaded[path] = future.result().convert()
+        except (pygame.error, OSError) as e:
+            # Left to the regular load, which raises where the asset is actually needed
+            logger.warning("Could not decode %s in the background: %s", path, e)
+
+        self.done += 1
+
+        for callback in self.progress_callbacks:
+            callback(self.done, self.total)
+
+    def update(self) -> bool:
+        # Converts what the workers finished, returns True once nothing is left to decode
+        for path in [path for path, future in self.pending.items() if future.done()]:
+            self.finish(path)
+
+        return self.idle
+
+    def take(self, path: str) -> pygame.Surface | None:
+        # The converted surface of a submitted file, waiting for its decode if needed
+        path = os.path.abspath(path)
+
+        if path in self.pending:
+            self.finish(path)
+
+        return self.loaded.pop(path, None)
+
+    def wait(self) -> None:
+        for path in list(self.pending):
+            self.finish(path)
+
+    def shutdown(self) -> None:
+        self.wait()
+        self.executor.shutdown()
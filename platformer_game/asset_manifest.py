@@ -0,0 +1,81 @@
+import logging
+from typing import NamedTuple, Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+class AssetManifest(NamedTuple):
+    # Names within each asset group a level needs, tile types, characters, weapons and pickups
+    tiles: tuple[str, ...] = ()
+    characters: tuple[str, ...] = ()
+    weapons: tuple[str, ...] = ()
+    pickups: tuple[str, ...] = ()
+
+    @classmethod
+    def from_tilemap(cls, tilemap) -> "AssetManifest":
+        characters = {"Player"}
+        weapons: set[str] = set()
+        pickups: set[str] = set()
+
+        if tilemap.enemies:
+            characters.add("Enemy")
+
+        # Same tile_metadata conventions LevelSnapshot reads spawns from
+        for metadata in tilemap.tile_metadata.values():
+            text: str = metadata["text"]
+
+            if text.startswith("enemy_weapon") or text.startswith("weapon___"):
+                weapons.add(text.split("___")[-1])
+
+            if text.startswith("pickup___"):
+                pickups.add(text.split("___")[-1])
+
+        # Enemies are given a pistol when no weapon is set on their tile
+        if tilemap.enemies:
+            weapons.add("pistol")
+
+        return cls(
+            tuple(sorted(set(tilemap.tiles.palette))),
+            tuple(sorted(characters)),
+            tuple(sorted(weapons)),
+            tuple(sorted(pickups))
+        )
+
+    @classmethod
+    def from_dict(cls, manifest_obj: dict) -> "AssetManifest":
+        return cls(*(tuple(manifest_obj.get(group, ())) for group in cls._fields))
+
+    def to_dict(self) -> dict[str, list[str]]:
+        return {group: list(names) for group, names in self._asdict().items()}
+
+
+class AssetGroup(dict):
+
+    def __init__(self, name: str, load: Callable[[str], object]):
+        super().__init__()
+
+        self.name = name
+        self.load = load
+
+    def preload(self, names) -> None:
+        for name in names:
+            if name in self: continue
+
+            try:
+                self[name] = self.load(name)
+            except FileNotFoundError:
+                # Looked up again, and reported, where the level actually uses it
+                logger.warning("The level manifest lists %s %s, which has no asset", self.name, name)
+
+    def __missing__(self, name: str):
+        # Anything the manifest did not list is still loaded, the first time it is needed
+        try:
+            value = self.load(name)
+        except FileNotFoundError:
+            raise KeyError(name)
+
+        logger.info("Loading %s %s, which is not in the level manifest", self.name, name)
+        self[name] = value
+
+        return value
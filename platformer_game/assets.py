@@ -0,0 +1,235 @@
+import os
+import logging
+
+import pygame
+
+from .atlas import TextureAtlas
+from .asset_loader import AssetLoader
+from .pixel_cache import PixelCache
+from .asset_manifest import AssetManifest, AssetGroup
+
+
+logger = logging.getLogger(__name__)
+
+
+class AssetRegistry:
+
+    # One registry per process, Game and LevelEditor sessions share its surfaces and must not modify them
+    instance: "AssetRegistry | None" = None
+
+    # Entries put together from other entries, dropped whenever anything else is
+    derived: set[tuple] = {("tiles",)}
+
+    # Decoded ahead of time by prefetch, besides the atlas, relative to the asset folder
+    prefetch_folders: list[str] = ["Weapons", "Pickups", os.path.join("Other", "Clouds")]
+    prefetch_files: list[str] = [os.path.join("Other", "grass.png")]
+
+    def __init__(self, asset_path: str = "Assets"):
+        self.asset_path = asset_path
+
+        # Decoded assets keyed by what was asked for, with the modification times of the files
+        # and folders they were read from
+        self.entries: dict[tuple, object] = {}
+        self.sources: dict[tuple, dict[str, int]] = {}
+
+        self.loads: int = 0
+
+        # Hands over images decoded in the background, anything it does not have is loaded here
+        self.loader: AssetLoader | None = None
+
+        # Decoded pixels kept on disk between launches, off unless enable_pixel_cache is called
+        self.pixel_cache: PixelCache | None = None
+
+    @classmethod
+    def get(cls, asset_path: str = "Assets") -> "AssetRegistry":
+        if cls.instance is None or cls.instance.asset_path != asset_path:
+            cls.instance = cls(asset_path)
+
+        return cls.instance
+
+    def cached(self, key: tuple, load, sources):
+        # sources(entry) gives the modification times of the files and folders the entry was read from
+        entry = self.entries.get(key, None)
+
+        if entry is None:
+            entry = load()
+
+            self.entries[key] = entry
+            self.sources[key] = sources(entry)
+            self.loads += 1
+
+        return entry
+
+    def preload(self) -> None:
+        # Puts together what every session asks for, meant for an idle frame once the loader is done.
+        # The rest depends on the level and is put together from its manifest when it opens
+        self.atlas()
+        self.folder(os.path.join(self.asset_path, "Other", "Clouds"))
+        self.image(os.path.join(self.asset_path, "Other", "grass.png"), colorkey="black")
+
+    @staticmethod
+    def mtimes(paths) -> dict[str, int]:
+        return {path: os.stat(path).st_mtime_ns for path in paths}
+
+    def enable_pixel_cache(self, cache_path: str) -> None:
+        # Needs the display to be set, the cached pixels are checked against its format
+        self.pixel_cache = PixelCache(cache_path)
+
+    def decode(self, path: str) -> pygame.Surface:
+        # Safe to run on the loader threads
+        surf = self.pixel_cache.load(path) if self.pixel_cache is not None else None
+
+        return surf if surf is not None else pygame.image.load(path)
+
+    def load_image(self, path: str) -> pygame.Surface:
+        surf = self.loader.take(path) if self.loader is not None else None
+
+        if surf is None:
+            surf = self.decode(path).convert()
+
+        if self.pixel_cache is not None:
+            self.pixel_cache.store(path, surf)
+
+        return surf
+
+    def prefetch(self, loader: AssetLoader) -> None:
+        # Starts decoding whatever a session will need that is not cached yet
+        self.loader = loader
+
+        cached = {os.path.abspath(source) for sources in self.sources.values() for source in sources}
+
+        paths = [] if ("atlas",) in self.entries else TextureAtlas.image_paths(self.asset_path)
+
+        for folder in self.prefetch_folders:
+            folderpath = os.path.join(self.asset_path, folder)
+            paths.extend(os.path.join(folderpath, filename) for filename in os.listdir(folderpath))
+
+        paths.extend(os.path.join(self.asset_path, path) for path in self.prefetch_files)
+
+        loader.submit([path for path in paths if os.path.abspath(path) not in cached], self.decode)
+
+    def atlas(self) -> TextureAtlas:
+        return self.cached(("atlas",), lambda: TextureAtlas.load(self.asset_path, self.load_image), self.atlas_sources)
+
+    def atlas_sources(self, atlas: TextureAtlas, group: str | None = None) -> dict[str, int]:
+        # Reuses the scan the atlas did to check its cache, only the folders are looked at again
+        # so a file added to one is noticed
+        groups = list(atlas.sources) if group is None else [group]
+        folders = [os.path.join(self.asset_path, group) for group in groups]
+
+        sources = self.mtimes(folders)
+
+        for group, folder in zip(groups, folders):
+            sources.update((os.path.join(folder, filename), mtime) for filename, mtime in atlas.sources[group].items())
+
+        return sources
+
+    def image(self, path: str, colorkey=None, convert: bool = True) -> pygame.Surface:
+        def load() -> pygame.Surface:
+            surf = self.load_image(path) if convert else pygame.image.load(path)
+
+            if colorkey is not None:
+                surf.set_colorkey(colorkey)
+
+            return surf
+
+        return self.cached(("image", path, colorkey, convert), load, lambda surf: self.mtimes([path]))
+
+    def folder(self, folderpath: str, colorkey=(0, 0, 0)) -> list[pygame.Surface]:
+        group = TextureAtlas.group_key(self.asset_path, folderpath)
+
+        # Folders packed in the atlas are served from it, any other is decoded file by file
+        if group in self.atlas().groups:
+            return self.cached(
+                ("folder", folderpath, colorkey),
+                lambda: self.atlas().load_folder(folderpath, colorkey),
+                lambda images: self.atlas_sources(self.atlas(), group)
+            )
+
+        def load() -> list[pygame.Surface]:
+            images: list[pygame.Surface] = []
+
+            for filename in os.listdir(folderpath):
+                surf = self.load_image(os.path.join(folderpath, filename))
+                surf.set_colorkey(colorkey)
+
+                images.append(surf)
+
+            return images
+
+        return self.cached(
+            ("folder", folderpath, colorkey),
+            load,
+            lambda images: self.mtimes([folderpath] + [os.path.join(folderpath, filename) for filename in os.listdir(folderpath)])
+        )
+
+    def tile_assets(self) -> dict[str, list[pygame.Surface]]:
+        return self.cached(
+            ("tiles",),
+            lambda: self.atlas().load_tile_assets(os.path.join(self.asset_path, "Tile_assets")),
+            lambda tile_assets: {}
+        )
+
+    def tile_frames(self, tile_type: str) -> list[pygame.Surface]:
+        return self.folder(os.path.join(self.asset_path, "Tile_assets", tile_type))
+
+    def character_animations(self, character: str) -> dict[str, list[pygame.Surface]]:
+        character_path = os.path.join(self.asset_path, "Characters", character)
+
+        if not os.path.isdir(character_path):
+            raise FileNotFoundError(character_path)
+
+        return {
+            animation: self.folder(os.path.join(character_path, animation), colorkey=(255, 255, 255))
+            for animation in os.listdir(character_path)
+        }
+
+    def level_assets(self, manifest: AssetManifest) -> dict[str, AssetGroup]:
+        # Only what the level lists is put together up front, the groups load anything else on first use
+        level_assets = {
+            "tiles": AssetGroup("tile type", self.tile_frames),
+            "characters": AssetGroup("character", self.character_animations),
+            "weapons": AssetGroup("weapon", lambda weapon: self.image(os.path.join(self.asset_path, "Weapons", weapon + ".png"))),
+            "pickups": AssetGroup("pickup", lambda pickup: self.image(os.path.join(self.asset_path, "Pickups", pickup + ".png")))
+        }
+
+        for group, names in manifest._asdict().items():
+            level_assets[group].preload(names)
+
+        return level_assets
+
+    def invalidate(self, path: str | None = None) -> None:
+        # Drops every entry read from path (a file or a folder), everything when no path is given
+        if path is None:
+            self.entries.clear()
+            self.sources.clear()
+            return
+
+        path = os.path.abspath(path)
+
+        stale = [
+            key for key, sources in self.sources.items()
+            if any(source == path or source.startswith(path + os.sep) for source in map(os.path.abspath, sources))
+        ]
+
+        if stale:
+            stale.extend(self.derived)
+
+        for key in stale:
+            self.entries.pop(key, None)
+            self.sources.pop(key, None)
+
+    def invalidate_changed(self) -> int:
+        # Drops the entries whose files changed on disk since they were decoded
+        changed = {
+            source for sources in self.sources.values() for source, mtime in sources.items()
+            if not os.path.exists(source) or os.stat(source).st_mtime_ns != mtime
+        }
+
+        for source in changed:
+            self.invalidate(source)
+
+        if changed:
+            logger.info("Reloading assets, %d file(s) changed on disk", len(changed))
+
+        return len(changed)
@@ -0,0 +1,243 @@
+import os
+import json
+import math
+import logging
+
+import pygame
+
+from .utils import load_tile_assets, load_folder
+
+
+logger = logging.getLogger(__name__)
+
+ATLAS_VERSION: int = 1
+
+
+class TextureAtlas:
+
+    # Frames are packed in shelves of a roughly square sheet, a sheet is started once the previous one is full
+    sheet_size: int = 1024
+    padding: int = 1
+
+    # Image folders packed, relative to the asset folder
+    folders: list[str] = ["Tile_assets", "Characters"]
+
+    # Written next to the assets on first run, rebuilt whenever a source image changes
+    cache_folder: str = ".atlas"
+    index_name: str = "index.json"
+
+    def __init__(
+            self,
+            asset_path: str,
+            sheets: list[pygame.Surface],
+            groups: dict[str, list[tuple[int, pygame.Rect]]],
+            sources: dict[str, dict[str, int]]
+        ):
+        self.asset_path = asset_path
+        self.sheets = sheets
+
+        # Frames of every image folder, keyed by its path relative to asset_path, in listdir order
+        self.groups = groups
+
+        # Modification times of the source images the sheets were packed from
+        self.sources = sources
+
+    @classmethod
+    def load(cls, asset_path: str, load_image=None) -> "TextureAtlas":
+        # load_image(path) returns a converted surface, it lets a loader hand over images it already decoded
+        if load_image is None:
+            load_image = lambda path: pygame.image.load(path).convert()
+
+        cache_path = os.path.join(asset_path, cls.cache_folder)
+        index, sources = cls.fresh_index(asset_path)
+
+        if index is not None:
+            sheets = [load_image(os.path.join(cache_path, name)) for name in index["sheets"]]
+        else:
+            index, sheets = cls.build(asset_path, sources, load_image)
+            cls.write_index(cache_path, index, sheets)
+
+        groups = {
+            group: [(sheet, pygame.Rect(x, y, w, h)) for _, _, sheet, x, y, w, h in frames]
+            for group, frames in index["groups"].items()
+        }
+
+        return cls(asset_path, sheets, groups, sources)
+
+    @classmethod
+    def fresh_index(cls, asset_path: str) -> tuple[dict | None, dict[str, dict[str, int]]]:
+        sources = cls.scan(asset_path, cls.folders)
+        index = cls.read_index(os.path.join(asset_path, cls.cache_folder))
+
+        if index is None or cls.index_sources(index) != sources:
+            return None, sources
+
+        return index, sources
+
+    @classmethod
+    def image_paths(cls, asset_path: str) -> list[str]:
+        # The files load will decode, the sheets when the cache is fresh, every source image otherwise
+        index, sources = cls.fresh_index(asset_path)
+
+        if index is not None:
+            return [os.path.join(asset_path, cls.cache_folder, name) for name in index["sheets"]]
+
+        return [os.path.join(asset_path, group, filename) for group, files in sources.items() for filename in files]
+
+    @staticmethod
+    def group_key(asset_path: str, folderpath: str) -> str:
+        return os.path.relpath(folderpath, asset_path).replace(os.sep, "/")
+
+    @classmethod
+    def scan(cls, asset_path: str, folders: list[str]) -> dict[str, dict[str, int]]:
+        # Image files of every folder under the given ones, with their modification times
+        sources: dict[str, dict[str, int]] = {}
+        pending = [os.path.join(asset_path, folder) for folder in folders]
+
+        while pending:
+            folderpath = pending.pop(0)
+            files: dict[str, int] = {}
+
+            with os.scandir(folderpath) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    else:
+                        files[entry.name] = entry.stat().st_mtime_ns
+
+            if files:
+                sources[cls.group_key(asset_path, folderpath)] = files
+
+        return sources
+
+    @staticmethod
+    def index_sources(index: dict) -> dict[str, dict[str, int]]:
+        return {
+            group: {filename: mtime for filename, mtime, *_ in frames}
+            for group, frames in index["groups"].items()
+        }
+
+    @classmethod
+    def read_index(cls, cache_path: str) -> dict | None:
+        try:
+            with open(os.path.join(cache_path, cls.index_name)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if index.get("version") != ATLAS_VERSION:
+            return None
+
+        if not all(os.path.exists(os.path.join(cache_path, name)) for name in index["sheets"]):
+            return None
+
+        return index
+
+    @classmethod
+    def write_index(cls, cache_path: str, index: dict, sheets: list[pygame.Surface]) -> None:
+        try:
+            os.makedirs(cache_path, exist_ok=True)
+
+            for name, sheet in zip(index["sheets"], sheets):
+                pygame.image.save(sheet, os.path.join(cache_path, name))
+
+            # The index goes last, a half written cache is never picked up
+            tmp_path = os.path.join(cache_path, cls.index_name + ".tmp")
+
+            with open(tmp_path, "w") as f:
+                json.dump(index, f)
+
+            os.replace(tmp_path, os.path.join(cache_path, cls.index_name))
+
+        except OSError as e:
+            logger.warning("Could not write the texture atlas cache in %s: %s", cache_path, e)
+
+    @classmethod
+    def build(cls, asset_path: str, sources: dict[str, dict[str, int]], load_image) -> tuple[dict, list[pygame.Surface]]:
+        images: list[tuple[str, str, pygame.Surface]] = []
+
+        for group, files in sources.items():
+            for filename in files:
+                images.append((group, filename, load_image(os.path.join(asset_path, group, filename))))
+
+        # Shelf packing, tallest frames first so shelves waste little height
+        order = sorted(range(len(images)), key=lambda i: -images[i][2].get_height())
+
+        area = sum((surf.get_width() + cls.padding) * (surf.get_height() + cls.padding) for _, _, surf in images)
+        sheet_width = max([min(cls.sheet_size, math.ceil(math.sqrt(area)))] + [surf.get_width() for _, _, surf in images])
+
+        placements: list[tuple[int, int, int] | None] = [None] * len(images)
+        sheet_sizes: list[list[int]] = []
+
+        sheet = -1
+        x = y = shelf_height = 0
+
+        for i in order:
+            w, h = images[i][2].get_size()
+
+            if sheet >= 0 and x + w > sheet_width:
+                x = 0
+                y += shelf_height + cls.padding
+                shelf_height = 0
+
+            if sheet < 0 or y + h > max(cls.sheet_size, h):
+                sheet += 1
+                sheet_sizes.append([0, 0])
+                x = y = shelf_height = 0
+
+            placements[i] = (sheet, x, y)
+            sheet_sizes[sheet][0] = max(sheet_sizes[sheet][0], x + w)
+            sheet_sizes[sheet][1] = max(sheet_sizes[sheet][1], y + h)
+
+            x += w + cls.padding
+            shelf_height = max(shelf_height, h)
+
+        sheets = [pygame.Surface(size) for size in sheet_sizes]
+        groups: dict[str, list[list]] = {group: [] for group in sources}
+
+        for (group, filename, surf), (sheet, x, y) in zip(images, placements):
+            sheets[sheet].blit(surf, (x, y))
+            groups[group].append([filename, sources[group][filename], sheet, x, y, surf.get_width(), surf.get_height()])
+
+        index = {
+            "version": ATLAS_VERSION,
+            # Uncompressed, loading a sheet is a single copy rather than an inflate
+            "sheets": [f"sheet_{n}.bmp" for n in range(len(sheets))],
+            "groups": groups
+        }
+
+        logger.info("Packed %d frames into %d atlas sheet(s)", len(images), len(sheets))
+
+        return index, sheets
+
+    def frames(self, group: str, colorkey=(0, 0, 0)) -> list[pygame.Surface]:
+        frames: list[pygame.Surface] = []
+
+        for sheet, rect in self.groups[group]:
+            surf = self.sheets[sheet].subsurface(rect)
+            surf.set_colorkey(colorkey)
+            frames.append(surf)
+
+        return frames
+
+    def load_folder(self, folderpath: str, colorkey=(0, 0, 0)) -> list[pygame.Surface]:
+        group = self.group_key(self.asset_path, folderpath)
+
+        # Folders that were not packed are loaded image by image
+        if group not in self.groups:
+            return load_folder(folderpath, colorkey)
+
+        return self.frames(group, colorkey)
+
+    def load_tile_assets(self, tile_assets_folder: str, colorkey=(0, 0, 0)) -> dict[str, list[pygame.Surface]]:
+        parent = self.group_key(self.asset_path, tile_assets_folder)
+        tile_assets: dict[str, list[pygame.Surface]] = {}
+
+        for group in self.groups:
+            if group.rpartition("/")[0] == parent:
+                tile_assets[group.rpartition("/")[2]] = self.frames(group, colorkey)
+
+        if not tile_assets:
+            return load_tile_assets(tile_assets_folder, colorkey)
+
+        return tile_assets
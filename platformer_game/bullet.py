@@ -1,50 +1,179 @@
+import numpy as np
 import pygame
 
 from .camera import Camera
+from .collision_grid import CollisionGrid
+from .render_queue import LAYER_BULLETS
+from .spatial_hash import SpatialHash
+from .tile_store import CHUNK_SHIFT, CHUNK_MASK, CHUNK_CELLS
 
 
-class Bullet(Camera):
+# Keeps packed chunk coordinates positive
+CHUNK_KEY_BIAS: int = 1 << 30
 
-    def __init__(self, pos: tuple[float, float], x_vel: float, y_vel: float, game, owner, max_duration: int = 240):
-        super().__init__()
 
-        self.x, self.y = pos
-        self.x_vel = x_vel
-        self.y_vel = y_vel
+class BulletSystem(Camera):
+
+    radius: int = 2
+
+    def __init__(self, game, capacity: int = 256):
+        super().__init__()
 
         self.game = game
 
-        self.owner = owner
+        self.count: int = 0
 
-        self.max_duration = max_duration
-        self.frame: int = 0
+        # One slot per bullet, only the first self.count slots are in use
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.x_vel = np.zeros(capacity, dtype=np.float64)
+        self.y_vel = np.zeros(capacity, dtype=np.float64)
+        self.frames = np.zeros(capacity, dtype=np.int32)
+        self.max_durations = np.zeros(capacity, dtype=np.int32)
+        self.owners = np.empty(capacity, dtype=object)
 
-    @property
-    def active(self) -> bool:
-        return self.frame <= self.max_duration
+        self.alive = np.zeros(capacity, dtype=bool)
 
-    def current_index(self) -> tuple[int, int]:
-        return int(self.x // self.game.tilemap.tilesize), int(self.y // self.game.tilemap.tilesize)
-        
-    def draw(self) -> None:
-        pygame.draw.circle(
-            self.game.display,
-            "yellow",
-            self.convert_pos((self.x, self.y)),
-            2
-        )
-        pygame.draw.circle(
-            self.game.display,
-            "black",
-            self.convert_pos((self.x, self.y)),
-            2,
-            1
+        self.sprite: pygame.Surface = self.render_sprite()
+
+    @classmethod
+    def render_sprite(cls) -> pygame.Surface:
+        size = cls.radius * 2 + 1
+
+        sprite = pygame.Surface((size, size))
+        sprite.set_colorkey((0, 0, 255))
+        sprite.fill((0, 0, 255))
+
+        pygame.draw.circle(sprite, "yellow", (cls.radius, cls.radius), cls.radius)
+        pygame.draw.circle(sprite, "black", (cls.radius, cls.radius), cls.radius, 1)
+
+        return sprite
+
+    def __len__(self) -> int:
+        return self.count
+
+    def grow(self) -> None:
+        capacity = len(self.x) * 2
+
+        for name in ("x", "y", "x_vel", "y_vel", "frames", "max_durations", "owners", "alive"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype) if array.dtype != object else np.empty(capacity, dtype=object)
+            grown[:self.count] = array[:self.count]
+            setattr(self, name, grown)
+
+    def spawn(self, pos: tuple[float, float], x_vel: float, y_vel: float, owner, max_duration: int = 240) -> None:
+        if self.count == len(self.x):
+            self.grow()
+
+        n = self.count
+
+        self.x[n], self.y[n] = pos
+        self.x_vel[n] = x_vel
+        self.y_vel[n] = y_vel
+        self.frames[n] = 0
+        self.max_durations[n] = max_duration
+        self.owners[n] = owner
+        self.alive[n] = True
+
+        self.count += 1
+
+    def clear(self) -> None:
+        self.owners[:self.count] = None
+        self.count = 0
+
+    def pos(self, n: int) -> tuple[float, float]:
+        return float(self.x[n]), float(self.y[n])
+
+    def reflect(self, n: int, owner) -> None:
+        self.owners[n] = owner
+        self.x_vel[n] *= -2
+        self.y_vel[n] *= -2
+
+    def kill(self, n: int) -> None:
+        self.alive[n] = False
+
+    def update(self, game_speed: float) -> None:
+        n = self.count
+
+        self.x[:n] += self.x_vel[:n] * game_speed
+        self.y[:n] += self.y_vel[:n] * game_speed
+        self.frames[:n] += 1
+
+        self.alive[:n] = self.frames[:n] <= self.max_durations[:n]
+
+    def tile_hits(self, collision_grid: CollisionGrid) -> np.ndarray:
+        n = self.count
+
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+
+        i = np.floor_divide(self.x[:n], collision_grid.tilesize).astype(np.int64)
+        j = np.floor_divide(self.y[:n], collision_grid.tilesize).astype(np.int64)
+
+        cells = ((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)
+        keys = (((i >> CHUNK_SHIFT) + CHUNK_KEY_BIAS) << 32) | ((j >> CHUNK_SHIFT) + CHUNK_KEY_BIAS)
+
+        # One lookup table row per chunk the bullets are in, rather than one lookup per bullet
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+        table = np.zeros((len(unique_keys), CHUNK_CELLS), dtype=np.uint8)
+
+        for k, key in enumerate(unique_keys.tolist()):
+            solid = collision_grid.get_cells(((key >> 32) - CHUNK_KEY_BIAS, (key & 0xFFFFFFFF) - CHUNK_KEY_BIAS))
+
+            if solid is not None:
+                table[k] = np.frombuffer(solid, dtype=np.uint8)
+
+        hits = table[inverse.reshape(-1), cells] == 1
+
+        return hits & self.alive[:n]
+
+    def in_cells(self, spatial_hash: SpatialHash) -> np.ndarray:
+        n = self.count
+
+        if n == 0 or not spatial_hash.cells:
+            return np.zeros(n, dtype=bool)
+
+        cell_x = np.floor_divide(self.x[:n], spatial_hash.cell_size).astype(np.int64)
+        cell_y = np.floor_divide(self.y[:n], spatial_hash.cell_size).astype(np.int64)
+
+        occupied = np.array([(x << 32) + y for x, y in spatial_hash.cells], dtype=np.int64)
+
+        return np.isin((cell_x << 32) + cell_y, occupied) & self.alive[:n]
+
+    def in_rect(self, rect: pygame.Rect) -> np.ndarray:
+        n = self.count
+
+        return (
+            (self.x[:n] >= rect.left) & (self.x[:n] < rect.right) &
+            (self.y[:n] >= rect.top) & (self.y[:n] < rect.bottom) &
+            self.alive[:n]
         )
 
-    def update(self) -> None:
-        if self.active:
-            self.x += self.x_vel * self.game.game_speed
-            self.y += self.y_vel * self.game.game_speed
+    def owned_by(self, owner) -> np.ndarray:
+        return np.fromiter((bullet_owner is owner for bullet_owner in self.owners[:self.count]), dtype=bool, count=self.count)
+
+    def compact(self) -> None:
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        m = len(keep)
+
+        if m == n: return
+
+        for array in (self.x, self.y, self.x_vel, self.y_vel, self.frames, self.max_durations, self.owners):
+            array[:m] = array[keep]
+
+        self.alive[:m] = True
+        self.owners[m:n] = None
+        self.count = m
+
+    def draw(self) -> None:
+        n = self.count
+
+        if n == 0: return
 
-            self.frame += 1
+        left = (self.x[:n] - Camera.offset_x + Camera.shake_x - self.radius).astype(np.int64).tolist()
+        top = (self.y[:n] - Camera.offset_y + Camera.shake_y - self.radius).astype(np.int64).tolist()
 
+        sprite = self.sprite
+        self.game.render_queue.layer(LAYER_BULLETS).blits([(sprite, pos) for pos in zip(left, top)], doreturn=False)
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class ChunkSurfaceCache:
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+
+        self.surfaces: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self.used_bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def surface_bytes(surf: pygame.Surface) -> int:
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def get(self, key: tuple[int, int]) -> pygame.Surface | None:
+        surf = self.surfaces.get(key, None)
+
+        if surf is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.surfaces.move_to_end(key)
+
+        return surf
+
+    def put(self, key: tuple[int, int], surf: pygame.Surface) -> None:
+        self.invalidate(key)
+
+        self.surfaces[key] = surf
+        self.used_bytes += self.surface_bytes(surf)
+
+        # Evict least recently drawn chunks, but always keep the one just rendered
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted_surf = self.surfaces.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(evicted_surf)
+
+    def invalidate(self, key: tuple[int, int]) -> None:
+        surf = self.surfaces.pop(key, None)
+
+        if surf is not None:
+            self.used_bytes -= self.surface_bytes(surf)
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self.used_bytes = 0
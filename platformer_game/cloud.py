@@ -18,7 +18,11 @@ class Cloud(Camera):
         self.x += self.speed
 
 
-    def draw(self) -> None:
+    def screen_pos(self) -> tuple[int, int]:
+        # Clouds wrap around the surface and move with their own parallax, not with the camera
         x = int(self.x - self.offset_x * self.depth) % (self.surface.get_width() + self.surf.get_width()) - self.surf.get_width()
         y = int(self.y - self.offset_y * self.depth) % (self.surface.get_height() + self.surf.get_height()) - self.surf.get_height()
-        self.surface.blit(self.surf, (x, y))
\ No newline at end of file
+        return x, y
+
+    def draw(self) -> None:
+        self.surface.blit(self.surf, self.screen_pos())
@@ -0,0 +1,153 @@
+import pygame
+
+from .tile_store import TileStore, CHUNK_SHIFT, CHUNK_MASK, CHUNK_SIZE, chunk_key
+
+
+class CollisionGrid:
+
+    def __init__(self, tiles: TileStore, solid_types: set[str], tilesize: int):
+        self.tiles = tiles
+        self.solid_types = solid_types
+        self.tilesize = tilesize
+
+        # Per chunk: one 0/1 byte per cell and one CHUNK_SIZE bits mask per row
+        self.cells: dict[tuple[int, int], bytes] = {}
+        self.rows: dict[tuple[int, int], list[int]] = {}
+
+        self.solid_table: bytes = bytes(256)
+        self.palette_size: int = -1
+
+        # Streamed stores build chunk masks lazily, as chunks get decoded
+        if not self.tiles.streamed:
+            self.build()
+
+    def update_solid_table(self) -> None:
+        if self.palette_size == len(self.tiles.palette): return
+
+        self.palette_size = len(self.tiles.palette)
+
+        table = bytearray(256)
+        for palette_index, tile_type in enumerate(self.tiles.palette):
+            table[palette_index + 1] = tile_type in self.solid_types
+
+        self.solid_table = bytes(table)
+
+    def build(self) -> None:
+        self.cells.clear()
+        self.rows.clear()
+
+        for key in self.tiles.chunks:
+            self.build_chunk(key)
+
+    def build_chunk(self, key: tuple[int, int]) -> None:
+        chunk = self.tiles.chunks.get(key, None)
+
+        if chunk is None:
+            self.cells.pop(key, None)
+            self.rows.pop(key, None)
+            return
+
+        self.update_solid_table()
+
+        cells = bytes(chunk.types.translate(self.solid_table))
+
+        rows: list[int] = []
+        for y in range(CHUNK_SIZE):
+            row_bits = 0
+            for x in range(CHUNK_SIZE):
+                if cells[(y << CHUNK_SHIFT) | x]:
+                    row_bits |= 1 << x
+            rows.append(row_bits)
+
+        self.cells[key] = cells
+        self.rows[key] = rows
+
+    def update_tile(self, indexes: tuple[int, int]) -> None:
+        self.build_chunk(chunk_key(indexes[0], indexes[1]))
+
+    def forget_chunk(self, key: tuple[int, int]) -> None:
+        self.cells.pop(key, None)
+        self.rows.pop(key, None)
+
+    def get_cells(self, key: tuple[int, int]) -> bytes | None:
+        cells = self.cells.get(key, None)
+
+        if cells is None and self.tiles.streamed and key in self.tiles.chunks:
+            self.build_chunk(key)
+            cells = self.cells.get(key, None)
+
+        return cells
+
+    def get_rows(self, key: tuple[int, int]) -> list[int] | None:
+        rows = self.rows.get(key, None)
+
+        if rows is None and self.tiles.streamed and key in self.tiles.chunks:
+            self.build_chunk(key)
+            rows = self.rows.get(key, None)
+
+        return rows
+
+    def is_solid(self, indexes: tuple[int, int]) -> bool:
+        i, j = indexes
+        cells = self.get_cells((i >> CHUNK_SHIFT, j >> CHUNK_SHIFT))
+
+        if cells is None:
+            return False
+
+        return cells[((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)] == 1
+
+    def row_bits(self, j: int, i0: int, i1: int) -> int:
+        # Bit k is set when the cell (i0 + k, j) is solid
+        bits = 0
+        cj = j >> CHUNK_SHIFT
+        y = j & CHUNK_MASK
+
+        for ci in range(i0 >> CHUNK_SHIFT, (i1 >> CHUNK_SHIFT) + 1):
+            rows = self.get_rows((ci, cj))
+
+            if rows is None or not rows[y]:
+                continue
+
+            shift = (ci << CHUNK_SHIFT) - i0
+            bits |= rows[y] << shift if shift >= 0 else rows[y] >> -shift
+
+        return bits & ((1 << (i1 - i0 + 1)) - 1)
+
+    def rect_indexes(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        return (
+            rect.left // self.tilesize,
+            (rect.right - 1) // self.tilesize,
+            rect.top // self.tilesize,
+            (rect.bottom - 1) // self.tilesize
+        )
+
+    def resolve_vertical(self, rect: pygame.Rect, y_vel: float) -> int | None:
+        # Returns the tile edge the rect has to be snapped to, the solid row nearest to where it came from
+        i0, i1, j0, j1 = self.rect_indexes(rect)
+
+        if y_vel > 0:
+            for j in range(j0, j1 + 1):
+                if self.row_bits(j, i0, i1):
+                    return j * self.tilesize
+        else:
+            for j in range(j1, j0 - 1, -1):
+                if self.row_bits(j, i0, i1):
+                    return (j + 1) * self.tilesize
+
+        return None
+
+    def resolve_horizontal(self, rect: pygame.Rect, x_vel: float) -> int | None:
+        i0, i1, j0, j1 = self.rect_indexes(rect)
+
+        bits = 0
+        for j in range(j0, j1 + 1):
+            bits |= self.row_bits(j, i0, i1)
+
+        if not bits:
+            return None
+
+        # Lowest solid column when moving right, highest when moving left
+        if x_vel > 0:
+            return (i0 + (bits & -bits).bit_length() - 1) * self.tilesize
+
+        return (i0 + bits.bit_length()) * self.tilesize
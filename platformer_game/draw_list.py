@@ -0,0 +1,160 @@
+import time
+import queue
+import threading
+
+import pygame
+
+
+class DrawList:
+
+    def __init__(self, target):
+        # The surface (or texture layer) the commands are replayed on
+        self.target = target
+
+        # Commands of the frame being simulated, and the list handed to the renderer on the previous swap
+        self.commands: list[tuple] = []
+        self.spare: list[tuple] = []
+
+    def get_size(self) -> tuple[int, int]:
+        return self.target.get_size()
+
+    def get_width(self) -> int:
+        return self.target.get_width()
+
+    def get_height(self) -> int:
+        return self.target.get_height()
+
+    def blit(self, source: pygame.Surface, dest: tuple[float, float]) -> None:
+        # Consecutive blits are replayed as one Surface.blits call
+        if self.commands and self.commands[-1][0] == "blits":
+            self.commands[-1][1].append((source, dest))
+        else:
+            self.commands.append(("blits", [(source, dest)]))
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> None:
+        if self.commands and self.commands[-1][0] == "blits":
+            self.commands[-1][1].extend(blit_sequence)
+        else:
+            self.commands.append(("blits", list(blit_sequence)))
+
+    def blit_alpha(self, source: pygame.Surface, dest: tuple[float, float], alpha: int) -> None:
+        # The alpha is set when the blit is replayed, so a surface reused every frame keeps the right one
+        self.commands.append(("blit_alpha", source, dest, alpha))
+
+    def fill(self, color) -> None:
+        self.commands.append(("fill", color))
+
+    def line(self, color, start_pos: tuple[float, float], end_pos: tuple[float, float], width: int = 1) -> None:
+        self.commands.append(("line", color, start_pos, end_pos, width))
+
+    def polygons(self, polygons: list[tuple]) -> None:
+        self.commands.append(("polygons", polygons))
+
+    def swap(self) -> list[tuple]:
+        commands = self.commands
+
+        self.commands = self.spare
+        self.commands.clear()
+        self.spare = commands
+
+        return commands
+
+    def execute(self, commands: list[tuple]) -> None:
+        target = self.target
+        fblits = getattr(target, "fblits", None)
+
+        for command in commands:
+            kind = command[0]
+
+            if kind == "blits":
+                if fblits is not None:
+                    fblits(command[1])
+                else:
+                    target.blits(command[1], doreturn=False)
+
+            elif kind == "blit_alpha":
+                command[1].set_alpha(command[3])
+                target.blit(command[1], command[2])
+
+            elif kind == "fill":
+                target.fill(command[1])
+
+            elif kind == "line":
+                pygame.draw.line(target, command[1], command[2], command[3], width=command[4])
+
+            elif kind == "polygons":
+                for color, points in command[1]:
+                    pygame.draw.polygon(target, color, points)
+
+
+class RenderThread:
+
+    def __init__(self):
+        self.jobs: queue.Queue = queue.Queue(maxsize=1)
+
+        self.idle = threading.Event()
+        self.idle.set()
+
+        # Seconds spent replaying commands, and seconds the game waited for a frame to be done
+        self.render_time: float = 0
+        self.wait_time: float = 0
+        self.frames: int = 0
+
+        # What made the render thread stop, if a job failed
+        self.error: BaseException | None = None
+
+        self.thread = threading.Thread(target=self.work, name="render", daemon=True)
+        self.thread.start()
+
+    def work(self) -> None:
+        try:
+            while True:
+                job = self.jobs.get()
+
+                if job is None:
+                    return
+
+                start = time.perf_counter()
+
+                for draw_list, commands in job:
+                    draw_list.execute(commands)
+
+                self.render_time += time.perf_counter() - start
+                self.frames += 1
+
+                self.idle.set()
+
+        except BaseException as e:
+            # Raised again by wait() on the main thread, which would otherwise wait forever
+            self.error = e
+
+        finally:
+            self.idle.set()
+
+    def submit(self, job: list[tuple[DrawList, list[tuple]]]) -> None:
+        self.idle.clear()
+        self.jobs.put(job)
+
+    def wait(self) -> None:
+        start = time.perf_counter()
+
+        # Nothing submitted after a failure is ever rendered, so the error is raised before waiting too
+        if self.error is None:
+            self.idle.wait()
+
+        self.wait_time += time.perf_counter() - start
+
+        if self.error is not None:
+            raise self.error
+
+    def overlap(self) -> float:
+        # Share of the render work done while the game was simulating the next frame
+        if self.render_time == 0:
+            return 0
+
+        return max(self.render_time - self.wait_time, 0) / self.render_time
+
+    def stop(self) -> None:
+        self.wait()
+        self.jobs.put(None)
+        self.thread.join()
@@ -4,7 +4,6 @@ import random
 import pygame
 
 from .entity import Entity
-from .bullet import Bullet
 from .weapon import Pistol
 
 class Enemy(Entity):
@@ -58,16 +57,13 @@ class Enemy(Entity):
 
             start_pos = self.rect.center
 
-            new_bullet = Bullet(
+            self.game.bullets.spawn(
                 (start_pos[0] + self.x_comp * 10, start_pos[1] + self.y_comp * 10),
                 self.x_comp * 5,
                 self.y_comp * 5,
-                self.game,
                 self
             )
 
-            self.game.bullets.append(new_bullet)
-
     def manage_aim(self) -> None:
         character_center = self.rect.center
         player_pos = self.game.player.rect.center
@@ -111,11 +107,8 @@ class Enemy(Entity):
             if abs(x_increment) >= x_diff and abs(y_increment) >= y_diff:
                 return True
             
-            tile = self.game.tilemap.get_tile(indexes)
-
-            if tile is not None:
-                if tile["tile_type"] in self.game.collision_tiles:
-                    return False
+            if self.game.tilemap.collision_grid.is_solid(indexes):
+                return False
                 
             
 
@@ -179,8 +172,7 @@ class Enemy(Entity):
         #     self.convert_pos((start_pos[0] + self.x_comp * 100, start_pos[1] + self.y_comp * 100))
         # )
 
-        pygame.draw.line(
-            self.surface,
+        self.surface.line(
             "black",
             self.convert_pos(start_pos),
             self.convert_pos((start_pos[0] + self.x_comp * 10, start_pos[1] + self.y_comp * 10)),
@@ -191,19 +183,8 @@ class Enemy(Entity):
         if self.weapon is not None:
             angle = -math.degrees(math.atan2(self.y_comp, self.x_comp))
             surf: pygame.Surface = self.game.assets["weapons"][self.weapon.weapon_name]
-            surf = pygame.transform.flip(
-                surf,
-                self.x_comp < 0,
-                False
-            )
-            surf.set_colorkey("white")
-            surf = pygame.transform.rotozoom(
-                surf,
-                (angle + 90) % 180 - 90,
-                0.3
-            )
-            
-            surf.set_colorkey("black")
+            surf = self.game.transform_cache.flipped(surf, self.x_comp < 0, colorkey="white")
+            surf = self.game.transform_cache.rotozoomed(surf, (angle + 90) % 180 - 90, 0.3, colorkey="black")
 
             self.surface.blit(
                 surf,
@@ -211,13 +192,18 @@ class Enemy(Entity):
             )
 
 
+    def draw(self):
+        if self.alive:
+            self.draw_aim()
+
+        super().draw()
+
     def update(self):
         if self.alive:
             # self.shoot_cooldown = max(self.shoot_cooldown - 1, 0)
             self.manage_status()
             self.manage_aim()
             self.manage_ai()
-            self.draw_aim()
             super().update()
 
         # print(self.player_spotted)
@@ -69,12 +69,12 @@ class Entity(Camera):
         
         if self.weapon is not None:
             self.weapon.set_owner(None)
-            surf = pygame.transform.rotozoom(
+            surf = self.game.transform_cache.rotozoomed(
                 self.game.assets["weapons"][self.weapon.weapon_name],
                 0,
-                0.4
+                0.4,
+                colorkey="black"
             )
-            surf.set_colorkey("black")
             pickup = PickUp(
                 self.game,
                 self.rect.center,
@@ -129,7 +129,7 @@ class Entity(Camera):
             "top": False
         }
 
-        surrounding_tiles = self.get_surrounding_tiles()
+        collision_grid = self.game.tilemap.collision_grid
 
         self.airtime += 1
 
@@ -143,15 +143,15 @@ class Entity(Camera):
                 # Vertical movement
         self.y += self.y_vel * self.game.game_speed
         self.rect.midbottom = (self.x, self.y)
-        collided_tile, collided_tile_rect = self.collide_tile(surrounding_tiles)
+        collided_edge = collision_grid.resolve_vertical(self.rect, self.y_vel)
 
-        if collided_tile is not None:
+        if collided_edge is not None:
             if self.y_vel > 0:
-                self.rect.bottom = collided_tile_rect.top
+                self.rect.bottom = collided_edge
                 self.collisions["bottom"] = True
                 self.airtime = 0
             else:
-                self.rect.top = collided_tile_rect.bottom
+                self.rect.top = collided_edge
                 self.collisions["top"] = True
 
             self.y_vel = 0
@@ -160,45 +160,17 @@ class Entity(Camera):
         # Horizontal movement
         self.x += self.x_vel * self.game.game_speed
         self.rect.midbottom = (self.x, self.y)
-        collided_tile, collided_tile_rect = self.collide_tile(surrounding_tiles)
+        collided_edge = collision_grid.resolve_horizontal(self.rect, self.x_vel)
 
-        if collided_tile is not None:
+        if collided_edge is not None:
             if self.x_vel > 0:
-                self.rect.right = collided_tile_rect.left
+                self.rect.right = collided_edge
             else:
-                self.rect.left = collided_tile_rect.right
+                self.rect.left = collided_edge
 
             self.x_vel = 0
             self.x, self.y = self.rect.midbottom
 
-
-    def collide_tile(self, tiles: list[dict]) -> tuple[dict, pygame.Rect] | None:
-        for tile in tiles:
-            if tile["tile_type"] in self.game.collision_tiles:
-                indexes = tile["indexes"]
-                tile_rect = pygame.Rect(
-                        indexes[0] * self.game.tilemap.tilesize,
-                        indexes[1] * self.game.tilemap.tilesize,
-                        self.game.tilemap.tilesize,
-                        self.game.tilemap.tilesize,
-                    ) 
-                if self.rect.colliderect(tile_rect):
-                      
-                    return tile, tile_rect
-                
-        return None, None
-
-    def get_surrounding_tiles(self) -> list[dict]:
-        current_index = self.get_current_index()
-        tiles: list[dict] = []
-        for index_offset in self.game.tilemap.offset_corners + [(0, 0)] + [(-1, -2), (0, -2), (1, -2)]:
-            neighbors_indexes = (current_index[0] + index_offset[0], current_index[1] + index_offset[1])
-            tile = self.game.tilemap.get_tile(neighbors_indexes)
-            if tile is not None:
-                tiles.append(tile)
-
-        return tiles
-
     def get_current_index(self) -> tuple[int, int]:
         return int(self.x // self.game.tilemap.tilesize), int(self.y // self.game.tilemap.tilesize)
 
@@ -214,25 +186,7 @@ class Entity(Camera):
         pass
 
     def draw_lifebar(self) -> None:
-        hp_ratio = self.hp / self.max_hp
-
-        lifebar_lenght = 50
-
-        background_surf = pygame.Surface((lifebar_lenght, 10))
-        background_surf.fill((100, 100, 100))
-
-        ratio_surf_lenght = (lifebar_lenght - 4) * hp_ratio
-
-        ratio_surf = pygame.Surface((ratio_surf_lenght, 6))
-        bar_color = self.lifebar_gradient(hp_ratio)
-        # print(self.hp, self.max_hp, hp_ratio, bar_color)
-        ratio_surf.fill(bar_color)
-
-        background_surf.blit(ratio_surf, (2, 2))
-        
-        pos = (self.rect.centerx - lifebar_lenght // 2, self.rect.top - 20)
-
-        self.surface.blit(background_surf, self.convert_pos(pos))
+        self.game.hud.add_lifebar(self.rect, self.hp, self.max_hp)
 
 
     def update_surf(self) -> None:
@@ -240,9 +194,11 @@ class Entity(Camera):
         if self.animation is not None:
             self.animation.update()
 
-        self.surf = self.animation.current_image if self.animation is not None else pygame.Surface((30, 64))
-        self.surf = pygame.transform.flip(self.surf, self.flip, False)
-        self.surf.set_colorkey("white")
+        if self.animation is not None:
+            self.surf = self.game.transform_cache.flipped(self.animation.current_image, self.flip, colorkey="white")
+        else:
+            self.surf = pygame.transform.flip(pygame.Surface((30, 64)), self.flip, False)
+            self.surf.set_colorkey("white")
         self.rect = self.surf.get_rect(midbottom=(self.x, self.y))
         # print(self.surf)
     def jump(self) -> None:
@@ -1,21 +1,53 @@
 import os
 import random
 import math
+import time
+import logging
 
+import numpy as np
 import pygame
 
 from .camera import Camera
 from .tilemap import TileMap
-from .utils import load_tile_assets, load_folder, squared_distance
+from .utils import squared_distance
+from .assets import AssetRegistry
+from .asset_manifest import AssetManifest, AssetGroup
 from .player import Player
 from .animation import Animation
-from .bullet import Bullet
+from .bullet import BulletSystem
 from .enemy import Enemy
-from .impact import Impact
+from .impact import ImpactSystem
 from .grass_blade import GrassBlade
+from .grass_layer import GrassLayer
 from .cloud import Cloud
 from .weapon import Weapon, AR, Pistol
 from .pick_up import PickUp
+from .level_snapshot import LevelSnapshot
+from .spatial_hash import SpatialHash
+from .transform_cache import TransformCache
+from .hud import HUD
+from .render_targets import RenderTargetPool, AllocationCounter
+from .grass_blade import GrassPrototype
+from .quality import QualityGovernor
+from .presentation import get_presenter
+from .draw_list import RenderThread
+from .sprite_batch import SpriteBatch
+from .render_queue import (
+    RenderQueue,
+    LAYER_SKY,
+    LAYER_CLOUDS,
+    LAYER_SHADE,
+    LAYER_ENTITIES,
+    LAYER_IMPACTS,
+    LAYER_GRASS,
+    LAYER_PICKUPS,
+    LAYER_TILES,
+    LAYER_HUD
+)
+
+
+logger = logging.getLogger(__name__)
+
 
 class Game:
 
@@ -28,6 +60,18 @@ class Game:
 
     game_shade: float = 1
 
+    # The level is rendered at window size // render_scale and scaled up by that integer factor
+    render_scale: int = 2
+
+    # Steps quality tiers down when frames run over the fps budget, and back up when there is headroom
+    adaptive_quality: bool = True
+
+    # Draw commands of a frame are replayed on a render thread while the next frame is simulated
+    threaded_rendering: bool = False
+
+    # Counts surface allocations and asserts there are none in steady-state frames
+    debug_allocations: bool = False
+
     gravity: float = 0.4
 
     weapons: dict[str, type[Weapon]] = {
@@ -35,6 +79,17 @@ class Game:
         "ar": AR
     }
 
+    # Frame duration and looping of every character animation, by "character/animation"
+    animation_specs: dict[str, tuple[int, bool]] = {
+        "Player/Idle": (30, True),
+        "Player/Walking": (5, True),
+        "Player/Jumping": (20, False),
+        "Player/Crouching": (60, True),
+        "Enemy/Idle": (30, True),
+        "Enemy/Walking": (5, True),
+        "Enemy/Jumping": (20, False),
+    }
+
     def __init__(self, level_selection, window: pygame.Surface, level_path: str):
 
         self.level_selection = level_selection
@@ -43,55 +98,71 @@ class Game:
 
         self.level_path = level_path
 
-        self.display = pygame.Surface(self.window.get_size())
+        self.presenter = get_presenter()
 
-        self.disp_size = self.display.get_size()
+        self.create_display(self.render_scale)
+
+        # Sprites are submitted per layer during the render pass and flushed in layer order
+        self.render_queue: RenderQueue = RenderQueue(self.display, self.top_layer)
+
+        self.render_thread: RenderThread | None = None
+
+        self.quality: QualityGovernor = QualityGovernor(self.fps or self.max_fps)
 
         self.clock = pygame.time.Clock()
 
         self.game_loop: bool = True
 
+        # Filled in by load_assets once the level manifest says what is needed
         self.assets = {}
 
-        self.load_assets("Assets")
-
-        self.animations: dict[str, Animation] = {
-            "Player/Idle": Animation(self.assets["characters"]["Player"]["Idle"], 30, True),
-            "Player/Walking": Animation(self.assets["characters"]["Player"]["Walking"], 5, True),
-            "Player/Jumping": Animation(self.assets["characters"]["Player"]["Jumping"], 20, False),
-            "Player/Crouching": Animation(self.assets["characters"]["Player"]["Crouching"], 60, True),
-            "Enemy/Idle": Animation(self.assets["characters"]["Enemy"]["Idle"], 30, True),
-            "Enemy/Walking": Animation(self.assets["characters"]["Enemy"]["Walking"], 5, True),
-            "Enemy/Jumping": Animation(self.assets["characters"]["Enemy"]["Jumping"], 20, False),
-        }
-        
-        self.tilemap = TileMap(self.display, assets=self.assets, tilesize=36)
+        self.transform_cache: TransformCache = TransformCache()
+
+        self.hud: HUD = HUD(self.render_queue.layer(LAYER_HUD), Player.lifebar_gradient)
+
+        self.render_targets: RenderTargetPool = RenderTargetPool()
+        self.allocation_counter: AllocationCounter | None = None
+
+        self.animations: AssetGroup = AssetGroup("animation", self.load_animation)
 
-        self.tilemap.load_tiles(self.level_path)
+        self.tilemap = TileMap(self.render_queue.layer(LAYER_TILES), assets=self.assets, tilesize=36)
+
+        self.snapshot: LevelSnapshot = None
         self.player: Player = None
 
         # self.player = Player(self.display, self.tilemap.player["coord"], self, self.animations["Player/Idle"].copy())
         
-        self.bullets: list[Bullet] = []
+        self.bullets: BulletSystem = BulletSystem(self)
         
         self.enemies: list[Enemy] = []
-        self.grasses: dict[str, list[GrassBlade]] = {}
+        self.grass_layer: GrassLayer = GrassLayer(self.render_queue.layer(LAYER_GRASS), self.tilemap.tilesize)
 
         self.weapon_pickups: list[PickUp] = []
         self.pickups: list[PickUp] = []
+        self.pickup_batch: SpriteBatch = SpriteBatch(self.render_queue.layer(LAYER_PICKUPS))
+
+        self.impacts: ImpactSystem = ImpactSystem(self.render_queue.layer(LAYER_IMPACTS), self)
 
-        self.impacts: list[Impact] = []
+        self.entity_hash: SpatialHash = SpatialHash(self.tilemap.tilesize * 2)
+        self.pickup_hash: SpatialHash = SpatialHash(self.tilemap.tilesize * 2)
 
         self.in_level_transition: bool = False
         self.level_transition_frames: int = 0
 
+        # Transition overlay of the frame being simulated, and of the frame the render thread is drawing
+        self.transition_frames: int | None = None
+        self.rendering_transition_frames: int | None = None
+
         self.clouds: list[Cloud] = []
+        self.cloud_batch: SpriteBatch = SpriteBatch(self.render_queue.layer(LAYER_CLOUDS))
 
-        cloud_surfs = load_folder("Assets/Other/Clouds")
+        cloud_surfs = AssetRegistry.get().folder(os.path.join("Assets", "Other", "Clouds"))
 
-        for _ in range(20):
+        # Clouds wrap around the display, so 5 of them keep the sky as busy as the 20 that used to
+        # be spread over a display four times larger than what was shown
+        for _ in range(5):
             cloud = Cloud(
-                self.display,
+                self.render_queue.layer(LAYER_CLOUDS),
                 random.choice(cloud_surfs),
                 (random.randint(0, self.display.get_width()), random.randint(0, self.display.get_height())),
                 depth=0.03 + random.random() * 0.50,
@@ -108,115 +179,97 @@ class Game:
 
     def load_level(self, level_path: str) -> None:
         self.tilemap.load_tiles(level_path)
+        self.load_assets("Assets", self.tilemap.asset_manifest)
 
-        self.player = Player(self.display, self.tilemap.player["coord"], self, self.animations["Player/Idle"].copy())
-        
-        Camera.offset_x = self.player.rect.centerx - self.tilemap.surface.get_width() // 4
-        Camera.offset_y = self.player.rect.centery - self.tilemap.surface.get_height() // 4
-        self.bullets.clear()
-
-        self.enemies.clear()
-
-        for tile_key, enemy in self.tilemap.enemies.items():
-            enemy = Enemy(self.display, enemy["coord"], self, self.animations["Enemy/Idle"].copy())
-            
-            metadata = self.tilemap.tile_metadata.get(tile_key, None)
-
-            if metadata is not None:
-                if metadata["text"].startswith("enemy_weapon"):
-                    weapon_name = metadata["text"].split("___")[-1]
-
-                    enemy_weapon = self.weapons[weapon_name](self, enemy)
+        self.tilemap.build_collision_grid(self.collision_tiles)
 
-                    enemy.set_weapon(enemy_weapon)
+        self.snapshot = LevelSnapshot.from_tilemap(level_path, self.tilemap)
 
-            self.enemies.append(enemy)
+        # Grass blades are only shaped once per level, restoring the level just straightens them
+        self.grass_layer.clear()
 
-        self.grasses: dict[str, list[GrassBlade]] = {}
-
-        for tile_key, grass_obj in self.tilemap.grasses.items():
-            x, y = grass_obj["coord"]
-            self.grasses[tile_key] = []
-            for _ in range(random.randint(4, 10)):
+        for tile_key, (x, y) in self.snapshot.grasses:
+            grass_blades: list[GrassBlade] = []
+            for _ in range(max(1, round(random.randint(4, 10) * self.quality.tier.grass_density))):
                 grass_blade = GrassBlade(
-                    self.display,
+                    self.render_queue.layer(LAYER_GRASS),
                     self,
                     (
                         x + random.randint(3, self.tilemap.tilesize - 3),
                         y + self.tilemap.tilesize
                     )
                 )
-                self.grasses[tile_key].append(grass_blade)
+                grass_blades.append(grass_blade)
 
-        # print(self.grasses)
+            self.grass_layer.add_tile(tuple(map(int, tile_key.split(";"))), grass_blades)
 
-        self.weapon_pickups.clear()
-        self.pickups.clear()
+        self.pickup_surfs: dict[tuple[str, str], pygame.Surface] = {}
 
-        for metadata in self.tilemap.tile_metadata.values():
-            if metadata["text"].startswith("weapon___"):
-                weapon_name = metadata["text"].split("___")[-1]
-                weapon = self.weapons[weapon_name](self, None)
-                weapon_surf = pygame.transform.rotozoom(self.assets["weapons"][weapon_name], 0, 0.4)
+        for pickup_spawn in self.snapshot.pickups:
+            if pickup_spawn.kind == "weapon":
+                pickup_surf = self.transform_cache.rotozoomed(self.assets["weapons"][pickup_spawn.name], 0, 0.4, colorkey="black")
+            elif pickup_spawn.name == "health":
+                pickup_surf = self.transform_cache.rotozoomed(self.assets["pickups"][pickup_spawn.name], 0, 0.8, colorkey="black")
+            else:
+                continue
 
-                weapon_surf.set_colorkey("black")
+            self.pickup_surfs[(pickup_spawn.kind, pickup_spawn.name)] = pickup_surf
 
-                pickup = PickUp(
-                    self,
-                    (metadata["indexes"][0] * self.tilemap.tilesize, metadata["indexes"][1] * self.tilemap.tilesize),
-                    weapon_surf
-                )
+        self.restore_level()
 
-                pickup.content = weapon
+    def restore_level(self) -> None:
+        self.player = Player(self.render_queue.layer(LAYER_ENTITIES), self.snapshot.player_coord, self, self.animations["Player/Idle"].copy())
+        
+        Camera.offset_x = self.player.rect.centerx - self.tilemap.surface.get_width() // 2
+        Camera.offset_y = self.player.rect.centery - self.tilemap.surface.get_height() // 2
+        self.bullets.clear()
 
-                self.weapon_pickups.append(pickup)
+        self.enemies.clear()
 
-            if metadata["text"].startswith("pickup___"):
-                pickup_name = metadata["text"].split("___")[-1]
+        for enemy_spawn in self.snapshot.enemies:
+            enemy = Enemy(self.render_queue.layer(LAYER_ENTITIES), enemy_spawn.coord, self, self.animations["Enemy/Idle"].copy())
 
-                if pickup_name == "health":
-                    pickup_surf = pygame.transform.rotozoom(self.assets["pickups"][pickup_name], 0, 0.8)
-                    pickup_surf.set_colorkey("black")
-                    pickup = PickUp(
-                        self,
-                        (metadata["indexes"][0] * self.tilemap.tilesize, metadata["indexes"][1] * self.tilemap.tilesize),
-                        pickup_surf
-                    )
-                    pickup.content = {
-                        "type": "health",
-                        "amount": 1
-                    }
+            if enemy_spawn.weapon_name is not None:
+                enemy.set_weapon(self.weapons[enemy_spawn.weapon_name](self, enemy))
 
-                    self.pickups.append(pickup)
+            self.enemies.append(enemy)
 
-        self.impacts.clear()
+        self.grass_layer.reset()
 
-    def load_assets(self, asset_path: str) -> None:
-        self.assets = {}
+        self.weapon_pickups.clear()
+        self.pickups.clear()
 
-        self.assets["tiles"] = load_tile_assets(os.path.join(asset_path, "Tile_assets"))
+        for pickup_spawn in self.snapshot.pickups:
+            pickup_surf = self.pickup_surfs.get((pickup_spawn.kind, pickup_spawn.name), None)
 
-        self.assets["characters"] = {}
-        self.assets["weapons"] = {}
-        self.assets["pickups"] = {}
+            if pickup_surf is None:
+                continue
 
-        for character in os.listdir(os.path.join(asset_path, "Characters")):
-            self.assets["characters"][character] = {}
-            for animation in os.listdir(os.path.join(asset_path, "Characters", character)):
-                self.assets["characters"][character][animation] = load_folder(
-                    os.path.join(asset_path, "Characters", character, animation),
-                    colorkey=(255, 255, 255)
-                )
+            pickup = PickUp(self, pickup_spawn.pos, pickup_surf)
 
-        for weapon in os.listdir(os.path.join(asset_path, "Weapons")):
-            self.assets["weapons"][weapon.split(".")[0]] = pygame.image.load(
-                os.path.join(asset_path, "Weapons", weapon)
-            ).convert()
+            if pickup_spawn.kind == "weapon":
+                pickup.content = self.weapons[pickup_spawn.name](self, None)
+                self.weapon_pickups.append(pickup)
+            else:
+                pickup.content = {
+                    "type": "health",
+                    "amount": 1
+                }
+                self.pickups.append(pickup)
 
-        for pickup in os.listdir(os.path.join(asset_path, "Pickups")):
-            self.assets["pickups"][pickup.split(".")[0]] = pygame.image.load(
-                os.path.join(asset_path, "Pickups", pickup)
-            ).convert()
+        self.impacts.clear()
+
+    def load_assets(self, asset_path: str, manifest: AssetManifest) -> None:
+        # Decoded once per process and shared between sessions, only the groups the level lists
+        # are put together now
+        self.assets.update(AssetRegistry.get(asset_path).level_assets(manifest))
+
+        self.animations.preload(name for name in self.animation_specs if name.split("/")[0] in manifest.characters)
+
+    def load_animation(self, name: str) -> Animation:
+        character, animation = name.split("/")
+
+        return Animation(self.assets["characters"][character][animation], *self.animation_specs[name])
 
 
     def manage_player_controls(self, key_pressed, all_events) -> None:
@@ -245,64 +298,71 @@ class Game:
             self.player.shoot()
 
     def manage_bullets(self) -> None:
-        for bullet in self.bullets[:]:
-            bullet.update()
-            
-            if not bullet.active:
-                self.bullets.remove(bullet)
-                continue
+        self.entity_hash.clear()
+        self.entity_hash.insert(self.player, self.player.rect)
 
-            collided_tile = self.tilemap.get_tile(bullet.current_index())
+        for enemy in self.enemies:
+            self.entity_hash.insert(enemy, enemy.rect)
 
-            # Check Bullet hit tile
-            if collided_tile is not None:
-                if collided_tile["tile_type"] in self.collision_tiles:
-                    self.bullets.remove(bullet)
+        bullets = self.bullets
+        bullets.update(self.game_speed)
 
-                    self.spawn_impacts(
-                        5, 
-                        (bullet.x, bullet.y), 
-                        (6, 12), 
-                        (0, 2), 
-                        (255, 255, 150),
-                        speed=(0.5, 3)
-                    )
-                    continue
+        hit_tiles = bullets.tile_hits(self.tilemap.collision_grid)
+
+        # Only bullets that may touch an entity are checked one by one
+        player_owned = bullets.owned_by(self.player)
+        near_player = bullets.in_rect(self.player.rect.inflate(self.player.blocking_radius * 2, self.player.blocking_radius * 2))
+        candidates = (player_owned & bullets.in_cells(self.entity_hash)) | (~player_owned & near_player)
+
+        for n in np.flatnonzero(hit_tiles | candidates).tolist():
+            bullet_pos = bullets.pos(n)
+
+            # Check Bullet hit tile
+            if hit_tiles[n]:
+                bullets.kill(n)
+
+                self.spawn_impacts(
+                    5, 
+                    bullet_pos, 
+                    (6, 12), 
+                    (0, 2), 
+                    (255, 255, 150),
+                    speed=(0.5, 3)
+                )
+                continue
             
             # Check Bullet hit enemy
-            if bullet.owner == self.player:
-                for enemy in self.enemies[:]:
-                    if enemy.rect.collidepoint((bullet.x, bullet.y)):
+            if player_owned[n]:
+                for enemy in self.entity_hash.query_point(bullet_pos):
+                    if enemy is not self.player:
                         enemy.get_hit(1)
                         self.spawn_impacts(
                             5, 
-                            (bullet.x, bullet.y), 
+                            bullet_pos, 
                             (4, 5), 
                             (0, 2), 
                             (150, 0, 0),
                             dissipation=0.4,
                             speed=(0.5, 3)
                         )
-                        self.bullets.remove(bullet)
+                        bullets.kill(n)
                         break
             else:
 
                 # Player block or parry
-                if self.player.status == "Crouching":
+                if self.player.status == "Crouching" and self.player in self.entity_hash.query_radius(bullet_pos, self.player.blocking_radius):
                     
                     # Bullet hit shield
-                    bullet_squared_dist = squared_distance(self.player.rect.center, (bullet.x, bullet.y))
+                    bullet_squared_dist = squared_distance(self.player.rect.center, bullet_pos)
                     if bullet_squared_dist < pow(self.player.blocking_radius, 2):
                         if self.player.parry_state:
-                            bullet.owner = self.player
-                            bullet.x_vel *= -2
-                            bullet.y_vel *= -2
+                            bullets.reflect(n, self.player)
                             self.set_game_speed(0.05)
                             self.set_game_shade(0.05)
                             Camera.shake_screen(15)
                             self.spawn_impacts(
                                 10, 
-                                (bullet.x, bullet.y), 
+                                bullet_pos, 
                                 (10, 20), 
                                 (2, 4), 
                                 (100, 100, 255),
@@ -310,10 +370,10 @@ class Game:
                                 speed=(2, 3)
                             )
                         else:
-                            self.bullets.remove(bullet)
+                            bullets.kill(n)
                             self.spawn_impacts(
                                 5, 
-                                (bullet.x, bullet.y), 
+                                bullet_pos, 
                                 (5, 10), 
                                 (1, 2), 
                                 (100, 100, 255),
@@ -323,13 +383,13 @@ class Game:
                             continue
 
                 # Check bullet hit player
-                if self.player.rect.collidepoint((bullet.x, bullet.y)):
-                    self.bullets.remove(bullet)
+                if self.player in self.entity_hash.query_point(bullet_pos):
+                    bullets.kill(n)
                     self.player.get_hit(1)
                     Camera.shake_screen(10)
                     self.spawn_impacts(
                             5, 
-                            (bullet.x, bullet.y), 
+                            bullet_pos, 
                             (4, 5), 
                             (0, 2), 
                             (150, 0, 0),
@@ -337,9 +397,7 @@ class Game:
                             speed=(0.5, 3)
                         )
 
-                    
-
-            bullet.draw()
+        bullets.compact()
 
     def spawn_impacts(self,
                     n: int,
@@ -349,89 +407,83 @@ class Game:
                     color="white",
                     speed: tuple[float, float] = (1, 1),
                     dissipation: float = 0.2
-                ) -> list[Impact]:
+                ) -> None:
+        sizes: list[int] = []
+        base_sizes: list[float] = []
+        angles: list[float] = []
+        speeds: list[float] = []
+
+        n = max(1, round(n * self.quality.tier.impact_ratio))
+
         for _ in range(n):
             
-            impact_speed = speed[0] + random.random() * (speed[1] - speed[0])
-
-            new_impact = Impact(
-                self.display,
-                (pos),
-                random.randint(*size_range),
-                base_size_range[0] + random.random() * (base_size_range[1] - base_size_range[0]),
-                random.random() * 2 * math.pi,
-                self,
-                color=color,
-                speed=impact_speed,
-                dissipation=dissipation
-            )
-            self.impacts.append(new_impact)
+            speeds.append(speed[0] + random.random() * (speed[1] - speed[0]))
+            sizes.append(random.randint(*size_range))
+            base_sizes.append(base_size_range[0] + random.random() * (base_size_range[1] - base_size_range[0]))
+            angles.append(random.random() * 2 * math.pi)
+
+        self.impacts.spawn(pos, sizes, base_sizes, angles, speeds, dissipation=dissipation, color=color)
 
     def manage_enemies(self) -> None:
         for enemy in self.enemies[:]:
             enemy.update()
-            enemy.draw()
 
             if not enemy.alive:
                 self.enemies.remove(enemy)
 
     def manage_impacts(self) -> None:
-        for impact in self.impacts[:]:
-            impact.update() 
-            impact.draw()
-
-            if not impact.active:
-                self.impacts.remove(impact)
+        # Impacts that died last frame were still drawn, they are dropped before moving the others
+        self.impacts.compact()
+        self.impacts.update(self.game_speed)
 
     def manage_grasses(self) -> None:
-        current_index = self.player.get_current_index()
-        for index_offset in self.tilemap.offset_corners + [(0, 0)] + [(-1, -2), (0, -2), (1, -2)]:
-            neighbors_indexes = (current_index[0] + index_offset[0], current_index[1] + index_offset[1])
-            tile_key = self.tilemap.get_tile_key(neighbors_indexes)
-
-            for grass_blade in  self.grasses.get(tile_key, []):
-                grass_blade.update_angle(self.player.rect.midbottom)
+        self.grass_layer.update(self.player.get_current_index(), self.player.rect.midbottom)
 
     def manage_pickup(self) -> None:
-        for pickup in self.weapon_pickups[:]:
-            pickup.update()
-            
-            if self.player.rect.colliderect(pickup.rect) and self.player.weapon is None and pickup.pickup_frame == 0:
-                self.weapon_pickups.remove(pickup)
-                if self.player.weapon is not None:
-                    
-                    self.player.drop_weapon()
-                    
+        self.pickup_hash.clear()
 
-                self.player.set_weapon(pickup.content)
-               
-            if not pickup.active:
-                self.weapon_pickups.remove(pickup)
-                
-        for pickup in self.pickups[:]:
+        for pickup in self.weapon_pickups + self.pickups:
             pickup.update()
+            self.pickup_hash.insert(pickup, pickup.rect)
 
-            if self.player.rect.colliderect(pickup.rect):
+        for pickup in self.pickup_hash.query_rect(self.player.rect):
+            if isinstance(pickup.content, Weapon):
+                if self.player.weapon is None and pickup.pickup_frame == 0:
+                    self.weapon_pickups.remove(pickup)
+                    self.player.set_weapon(pickup.content)
+            else:
                 if pickup.content["type"] == "health":
                     self.player.heal(pickup.content.get("amont", 1))
                 self.pickups.remove(pickup)
+
+        for pickup in self.weapon_pickups[:]:
+            if not pickup.active:
+                self.weapon_pickups.remove(pickup)
         
         
     def draw_pickups(self) -> None:
-        for pickup in self.weapon_pickups + self.pickups:
-            pickup.draw()
+        self.pickup_batch.extend((pickup.surf, pickup.rect.topleft) for pickup in self.weapon_pickups)
+        self.pickup_batch.extend((pickup.surf, pickup.rect.topleft) for pickup in self.pickups)
+
+        self.pickup_batch.flush()
 
     def draw_grasses(self) -> None:
-        for grass_tile in self.grasses.values():
-            for grass_blade in grass_tile:
-                grass_blade.draw()
+        self.grass_layer.draw()
 
     def update_clouds(self) -> None:
-        for cloud in self.clouds:
+        for cloud in self.clouds[:self.quality.tier.clouds]:
             cloud.update_pos()
-            cloud.draw()
             # print(cloud.x, cloud.y)
 
+    def draw_clouds(self) -> None:
+        self.cloud_batch.extend((cloud.surf, cloud.screen_pos()) for cloud in self.clouds[:self.quality.tier.clouds])
+
+        self.cloud_batch.flush(camera=False)
+
+    def draw_enemies(self) -> None:
+        for enemy in self.enemies:
+            enemy.draw()
+
     def manage_game_over(self) -> None:
         if len(self.enemies) == 0 and not self.in_level_transition:
             self.level_transition_frames = -60
@@ -442,6 +494,8 @@ class Game:
             self.in_level_transition = True
 
     def manage_and_draw_level_transition(self) -> None:
+        self.transition_frames = None
+
         if not self.in_level_transition: return
 
         self.level_transition_frames = self.level_transition_frames + 1
@@ -451,19 +505,24 @@ class Game:
             self.level_transition_frames = -60
 
         if self.level_transition_frames == 0:
-            self.load_level(self.level_path)
+            self.restore_level()
 
-        surf = pygame.Surface(self.window.get_size())
+        # Drawn when the frame is presented, which is one frame later with the render thread
+        self.transition_frames = self.level_transition_frames
+
+    def draw_level_transition(self, transition_frames: int) -> None:
+        surf = self.render_targets.get("transition", self.window.get_size())
+        surf.fill("black")
         pygame.draw.circle(
             surf,
             "red",
             (surf.get_width() // 2, surf.get_height() // 2),
-            (abs(self.level_transition_frames) / 60) * max(surf.get_size())
+            (abs(transition_frames) / 60) * max(surf.get_size())
         )
-        # print((abs(self.level_transition_frames) / 60) * max(surf.get_size()))
+        # print((abs(transition_frames) / 60) * max(surf.get_size()))
         surf.set_colorkey("red")
 
-        self.window.blit(surf, (0, 0))
+        self.presenter.draw_overlay(surf)
 
     @classmethod
     def set_game_speed(cls, game_speed: float = 1) -> None:
@@ -483,14 +542,127 @@ class Game:
         cls.game_shade = min(cls.game_shade + 0.02, 1)
     
 
+    def create_display(self, render_scale: int) -> None:
+        self.render_scale = render_scale
+
+        self.display = pygame.Surface((self.window.get_width() // render_scale, self.window.get_height() // render_scale))
+
+        self.disp_size = self.display.get_size()
+
+        # Tiles and HUD are drawn on top of everything else, through the renderer when there is one
+        self.top_layer = self.presenter.top_layer(self.display)
+
+    def set_render_scale(self, render_scale: int) -> None:
+        if self.render_thread is not None:
+            self.render_thread.wait()
+
+        self.create_display(render_scale)
+
+        self.render_queue.set_targets(self.display, self.top_layer)
+
+    def update_quality(self, frame_ms: float) -> None:
+        if not self.quality.update(frame_ms): return
+
+        render_scale = Game.render_scale + self.quality.tier.extra_render_scale
+
+        if render_scale != self.render_scale:
+            self.set_render_scale(render_scale)
+
+    def render_frame(self) -> None:
+        if self.render_thread is None:
+            RenderQueue.execute(self.render_queue.swap())
+
+            self.presenter.present_view(self.display, self.render_scale, self.top_layer)
+
+            if self.transition_frames is not None:
+                self.draw_level_transition(self.transition_frames)
+
+            return
+
+        # The previous frame is presented and this one is handed to the render thread
+        self.render_thread.wait()
+
+        job = self.render_queue.swap()
+
+        self.presenter.present_view(self.display, self.render_scale, self.top_layer)
+
+        if self.rendering_transition_frames is not None:
+            self.draw_level_transition(self.rendering_transition_frames)
+
+        self.render_thread.submit(job)
+        self.rendering_transition_frames = self.transition_frames
+
+    def render(self, mouse_pos: tuple[float, float]) -> None:
+        # Nothing is simulated from here on, every layer gets its sprites in the order they are drawn
+        self.render_queue.layer(LAYER_SKY).fill((100, 200, 255))
+
+        self.draw_clouds()
+
+        shade_alpha = int(255 * (1 - self.game_shade))
+
+        if shade_alpha > 0:
+            shade_surf = self.render_targets.get("shade", self.display.get_size())
+
+            self.render_queue.layer(LAYER_SHADE).blit_alpha(shade_surf, (0, 0), shade_alpha)
+
+        self.player.draw()
+        self.draw_enemies()
+
+        self.bullets.draw()
+        self.impacts.draw()
+
+        self.draw_grasses()
+        self.draw_pickups()
+
+        self.tilemap.draw_tiles()
+
+        self.hud.add_cursor((int(mouse_pos[0]), int(mouse_pos[1])))
+        self.hud.draw()
+
+    def window_to_display(self, pos: tuple[int, int]) -> tuple[float, float]:
+        return pos[0] / self.render_scale, pos[1] / self.render_scale
+
+    def cache_work(self) -> tuple[int, ...]:
+        # Changes whenever a cache had to render something, those frames are allowed to allocate
+        return (
+            self.transform_cache.misses,
+            self.tilemap.chunk_surfaces.misses,
+            self.grass_layer.bakes,
+            GrassPrototype.rendered_frames,
+            self.hud.renders,
+            self.render_targets.allocations
+        )
+
+    def check_allocations(self, cache_work: tuple[int, ...]) -> None:
+        allocations = self.allocation_counter.count
+        sites = list(self.allocation_counter.sites)
+        self.allocation_counter.reset()
+
+        if self.in_level_transition or cache_work != self.cache_work(): return
+
+        assert allocations == 0, f"{allocations} surfaces allocated in a steady-state frame: {sites}"
+
     def run(self) -> None:
+
+        if self.debug_allocations:
+            self.allocation_counter = AllocationCounter()
+            self.allocation_counter.install()
+
+        if self.threaded_rendering:
+            self.render_thread = RenderThread()
         
         while self.game_loop:
 
+            frame_start = time.perf_counter()
+
+            if self.allocation_counter is not None:
+                cache_work = self.cache_work()
+                self.allocation_counter.reset()
+
             all_events: list[pygame.event.Event] = pygame.event.get()
             key_pressed = pygame.key.get_pressed()
 
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self.window_to_display(pygame.mouse.get_pos())
 
             for event in all_events:
                 if event.type == pygame.QUIT:
@@ -502,16 +674,9 @@ class Game:
 
             self.manage_player_controls(key_pressed, all_events)
 
-            self.display.fill((100, 200, 255))
             self.update_clouds()
-            
-            shade_surf = pygame.Surface(self.window.get_size())
-            shade_surf.set_alpha(int(255 * (1 - self.game_shade)))
-
-            self.display.blit(shade_surf, (0, 0))
 
             self.player.update()
-            self.player.draw()
 
             self.manage_enemies()
             self.manage_bullets()
@@ -519,29 +684,41 @@ class Game:
 
             self.manage_grasses()
             self.manage_pickup()
-            self.draw_grasses()
-            self.draw_pickups()
 
-            self.tilemap.draw_tiles()
+            self.tilemap.update_streaming()
             self.manage_game_over()
-            
-            # Draw cursor
-            pygame.draw.circle(
-                self.display,
-                (150, 0, 0),
-                (int(mouse_pos[0] / 2), int(mouse_pos[1] / 2)),
-                3
-            )
-            
-            self.window.blit(
-                pygame.transform.scale(self.display, (self.disp_size[0] * 2, self.disp_size[1] * 2)), 
-                (0, 0)
-            )
+
+            self.render(mouse_pos)
+
             Camera.update_shake()
             self.manage_game_speed()
             self.manage_game_shade()
             self.manage_and_draw_level_transition()
-            pygame.display.update()
+            self.render_frame()
+
+            if self.allocation_counter is not None:
+                self.check_allocations(cache_work)
+
+            self.presenter.present()
+
+            if self.adaptive_quality:
+                self.update_quality((time.perf_counter() - frame_start) * 1000)
 
             self.clock.tick(self.fps)
 
+        if self.allocation_counter is not None:
+            self.allocation_counter.uninstall()
+            self.allocation_counter = None
+
+        if self.render_thread is not None:
+            self.render_thread.stop()
+
+            logger.info(
+                "Render thread overlap %.0f%% (render %.2f ms/frame, waited %.2f ms/frame)",
+                self.render_thread.overlap() * 100,
+                self.render_thread.render_time / max(self.render_thread.frames, 1) * 1000,
+                self.render_thread.wait_time / max(self.render_thread.frames, 1) * 1000
+            )
+
+            self.render_thread = None
+
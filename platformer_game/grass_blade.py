@@ -6,6 +6,61 @@ import pygame
 from .camera import Camera
 
 
+class GrassPrototype:
+
+    # Blades bend at most that many degrees either way
+    max_angle: int = 40
+
+    rendered_frames: int = 0
+
+    def __init__(self, tilesize: int, color: tuple[int, int, int], tip: tuple[int, int]):
+        self.tilesize = tilesize
+
+        original_surf = pygame.Surface((tilesize, tilesize))
+
+        pygame.draw.polygon(
+            original_surf,
+            color,
+            [
+                (tilesize // 2 - 3, tilesize // 2 + 3),
+                (tilesize // 2 + 3, tilesize // 2 + 3),
+                tip,
+            ]
+        )
+
+        original_surf.set_colorkey("black")
+        self.original_surf = original_surf
+
+        # One frame per reachable angle, from fully bent left to fully bent right, rendered on first use.
+        # Frames are cropped to the blade, with their offset from the blade center.
+        self.frames: list[tuple[pygame.Surface, tuple[int, int]] | None] = [None] * (2 * tilesize + 1)
+
+    def get_frame(self, frame_index: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        frame = self.frames[frame_index]
+
+        if frame is None:
+            if frame_index == self.tilesize:
+                surf = self.original_surf
+            else:
+                surf = pygame.transform.rotate(self.original_surf, self.get_angle(frame_index))
+                surf.set_colorkey("black")
+
+            bounding_rect = surf.get_bounding_rect()
+
+            frame = (
+                surf.subsurface(bounding_rect).copy(),
+                (bounding_rect.x - surf.get_width() // 2, bounding_rect.y - surf.get_height() // 2)
+            )
+            self.frames[frame_index] = frame
+            GrassPrototype.rendered_frames += 1
+
+        return frame
+
+    def get_angle(self, frame_index: int) -> float:
+        bend = frame_index - self.tilesize
+        return self.max_angle * abs(bend) / self.tilesize * (-1 if bend < 0 else 1)
+
+
 class GrassBlade(Camera):
 
     grass_colors: list[tuple[int, int, int]] = [
@@ -14,6 +69,10 @@ class GrassBlade(Camera):
         (0, 200, 0)
     ]
 
+    # Shared by every blade, one prototype per blade shape
+    prototypes: list[GrassPrototype] = []
+    prototype_indexes: dict[tuple, int] = {}
+
     def __init__(self, surface: pygame.Surface, game, pos: tuple[int, int]):
         super().__init__()
 
@@ -24,40 +83,44 @@ class GrassBlade(Camera):
 
         self.angle = 0
 
-        self.original_surf = pygame.Surface((self.game.tilemap.tilesize, self.game.tilemap.tilesize))
-        
+        tilesize = self.game.tilemap.tilesize
 
-        pygame.draw.polygon(
-            self.original_surf,
+        self.prototype: int = self.get_prototype(
+            tilesize,
             random.choice(self.grass_colors),
-            [
-                (self.game.tilemap.tilesize // 2 - 3, self.game.tilemap.tilesize // 2 + 3),
-                (self.game.tilemap.tilesize // 2 + 3, self.game.tilemap.tilesize // 2 + 3),
-                (self.game.tilemap.tilesize // 2 + random.randint(-3, 3), random.randint(0, 5)),
-            ]
+            (tilesize // 2 + random.randint(-3, 3), random.randint(0, 5))
         )
+        self.frame: int = tilesize
+
+    @classmethod
+    def get_prototype(cls, tilesize: int, color: tuple[int, int, int], tip: tuple[int, int]) -> int:
+        key = (tilesize, color, tip)
+        prototype_index = cls.prototype_indexes.get(key, None)
 
-        self.original_surf.set_colorkey("black")
-        self.surf = self.original_surf.copy()
+        if prototype_index is None:
+            prototype_index = len(cls.prototypes)
+            cls.prototypes.append(GrassPrototype(tilesize, color, tip))
+            cls.prototype_indexes[key] = prototype_index
 
-        self.rect = self.surf.get_rect(center=(self.x, self.y))
+        return prototype_index
+
+    def reset(self) -> None:
+        self.angle = 0
+        self.frame = self.game.tilemap.tilesize
+
+    def sprite(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        surf, offset = self.prototypes[self.prototype].get_frame(self.frame)
+        return surf, (self.x + offset[0], self.y + offset[1])
 
     def draw(self) -> None:
-        # print(self.convert_pos(self.rect.topleft))
-        self.surface.blit(self.surf, self.convert_pos(self.rect.topleft))
+        surf, pos = self.sprite()
+        self.surface.blit(surf, self.convert_pos(pos))
 
     def update_angle(self, source_pos: tuple[int, int]) -> None:
-        dist = math.dist(source_pos, self.rect.center)
-
-        self.angle = 40 * int(max((self.game.tilemap.tilesize - dist), 0)) / self.game.tilemap.tilesize * (-1 if source_pos[0] < self.rect.centerx else 1)
-        
-        self.surf = pygame.transform.rotate(self.original_surf, self.angle)
-        self.surf.set_colorkey("black")
-        self.rect = self.surf.get_rect(center=(self.x, self.y))
-
-        # pygame.draw.circle(
-        #     self.surface,
-        #     "red",
-        #     self.convert_pos((self.rect.center)),
-        #     2
-        # )
\ No newline at end of file
+        tilesize = self.game.tilemap.tilesize
+        dist = math.dist(source_pos, (self.x, self.y))
+
+        bend = int(max((tilesize - dist), 0))
+        self.frame = tilesize + (-bend if source_pos[0] < self.x else bend)
+
+        self.angle = self.prototypes[self.prototype].get_angle(self.frame)
@@ -0,0 +1,123 @@
+import pygame
+
+from .camera import Camera
+from .grass_blade import GrassBlade
+from .sprite_batch import SpriteBatch
+from .tilemap import TileMap
+from .tile_store import CHUNK_SIZE, chunk_key
+
+
+class GrassLayer(Camera):
+
+    # Tiles around the bending source, relative to its tile, whose blades can move
+    bend_offsets: list[tuple[int, int]] = TileMap.offset_corners + [(0, 0)] + [(-1, -2), (0, -2), (1, -2)]
+
+    def __init__(self, surface: pygame.Surface, tilesize: int):
+        super().__init__()
+
+        self.surface = surface
+        self.batch: SpriteBatch = SpriteBatch(surface)
+        self.tilesize = tilesize
+
+        self.tiles: dict[tuple[int, int], list[GrassBlade]] = {}
+        self.chunk_tiles: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+        # Static blades of a chunk, blitted once into a surface placed at its world position
+        self.baked: dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]] | None] = {}
+        self.dirty: set[tuple[int, int]] = set()
+
+        # Tiles whose blades are bent right now, drawn one by one on top of the baked layer
+        self.dynamic: list[tuple[int, int]] = []
+
+        self.bakes: int = 0
+
+    def clear(self) -> None:
+        self.tiles.clear()
+        self.chunk_tiles.clear()
+        self.baked.clear()
+        self.dirty.clear()
+        self.dynamic.clear()
+
+    def add_tile(self, indexes: tuple[int, int], blades: list[GrassBlade]) -> None:
+        self.tiles[indexes] = blades
+
+        key = chunk_key(*indexes)
+        self.chunk_tiles.setdefault(key, []).append(indexes)
+        self.dirty.add(key)
+
+    def reset(self) -> None:
+        for blades in self.tiles.values():
+            for grass_blade in blades:
+                grass_blade.reset()
+
+        self.dynamic.clear()
+        self.dirty.update(self.chunk_tiles)
+
+    def bake_chunk(self, key: tuple[int, int]) -> tuple[pygame.Surface, tuple[int, int]] | None:
+        dynamic = set(self.dynamic)
+        placed: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        for indexes in self.chunk_tiles[key]:
+            if indexes in dynamic:
+                continue
+
+            for grass_blade in self.tiles[indexes]:
+                surf, offset = GrassBlade.prototypes[grass_blade.prototype].get_frame(grass_blade.frame)
+                placed.append((surf, (grass_blade.x + offset[0], grass_blade.y + offset[1])))
+
+        self.bakes += 1
+
+        if not placed:
+            return None
+
+        bounds = pygame.Rect(placed[0][1], placed[0][0].get_size()).unionall(
+            [pygame.Rect(pos, surf.get_size()) for surf, pos in placed[1:]]
+        )
+
+        baked_surf = pygame.Surface(bounds.size)
+        baked_surf.blits([(surf, (pos[0] - bounds.x, pos[1] - bounds.y)) for surf, pos in placed], doreturn=False)
+        baked_surf.set_colorkey("black", pygame.RLEACCEL)
+
+        return baked_surf, bounds.topleft
+
+    def update(self, current_index: tuple[int, int], source_pos: tuple[int, int]) -> None:
+        dynamic = [
+            (current_index[0] + index_offset[0], current_index[1] + index_offset[1])
+            for index_offset in self.bend_offsets
+        ]
+        dynamic = [indexes for indexes in dynamic if indexes in self.tiles]
+
+        if dynamic != self.dynamic:
+            # Tiles entering or leaving the dynamic set get their chunk baked again
+            for indexes in set(dynamic).symmetric_difference(self.dynamic):
+                self.dirty.add(chunk_key(*indexes))
+
+            self.dynamic = dynamic
+
+        for indexes in dynamic:
+            for grass_blade in self.tiles[indexes]:
+                grass_blade.update_angle(source_pos)
+
+    def draw(self) -> None:
+        chunk_pixels = CHUNK_SIZE * self.tilesize
+
+        left = Camera.offset_x - Camera.shake_x
+        top = Camera.offset_y - Camera.shake_y
+
+        # Blades hang over their chunk border, so one more chunk is checked on each side
+        for ci in range(int(left // chunk_pixels) - 1, int((left + self.surface.get_width()) // chunk_pixels) + 2):
+            for cj in range(int(top // chunk_pixels) - 1, int((top + self.surface.get_height()) // chunk_pixels) + 2):
+                if (ci, cj) in self.dirty:
+                    self.baked[(ci, cj)] = self.bake_chunk((ci, cj))
+                    self.dirty.discard((ci, cj))
+
+                baked = self.baked.get((ci, cj), None)
+
+                if baked is None:
+                    continue
+
+                self.batch.add(*baked)
+
+        self.batch.extend(grass_blade.sprite() for indexes in self.dynamic for grass_blade in self.tiles[indexes])
+
+        self.batch.flush()
@@ -0,0 +1,85 @@
+import pygame
+
+from .camera import Camera
+from .colors import ColorGradient
+
+
+class HUD(Camera):
+
+    lifebar_lenght: int = 50
+    aim_lenght: int = 100
+
+    aim_color = "red"
+    cursor_color = (150, 0, 0)
+    cursor_radius: int = 3
+
+    def __init__(self, surface: pygame.Surface, lifebar_gradient: ColorGradient):
+        super().__init__()
+
+        self.surface = surface
+        self.lifebar_gradient = lifebar_gradient
+
+        self.lifebars: dict[tuple[int, int], pygame.Surface] = {}
+        self.renders: int = 0
+
+        self.aim_comps: tuple[float, float] | None = None
+        self.aim_surf: pygame.Surface | None = None
+        self.aim_offset: tuple[int, int] = (0, 0)
+
+        self.cursor_surf = pygame.Surface((self.cursor_radius * 2 + 1, self.cursor_radius * 2 + 1))
+        self.cursor_surf.fill("black")
+        pygame.draw.circle(self.cursor_surf, self.cursor_color, (self.cursor_radius, self.cursor_radius), self.cursor_radius)
+        self.cursor_surf.set_colorkey("black")
+
+        # Sprites to blit this frame, in screen coordinates
+        self.queue: list[tuple[pygame.Surface, tuple[float, float]]] = []
+
+    def get_lifebar(self, hp: int, max_hp: int) -> pygame.Surface:
+        background_surf = self.lifebars.get((hp, max_hp), None)
+
+        if background_surf is None:
+            hp_ratio = hp / max_hp
+
+            background_surf = pygame.Surface((self.lifebar_lenght, 10))
+            background_surf.fill((100, 100, 100))
+
+            ratio_surf = pygame.Surface(((self.lifebar_lenght - 4) * hp_ratio, 6))
+            ratio_surf.fill(self.lifebar_gradient(hp_ratio))
+
+            background_surf.blit(ratio_surf, (2, 2))
+
+            self.lifebars[(hp, max_hp)] = background_surf
+            self.renders += 1
+
+        return background_surf
+
+    def add_lifebar(self, rect: pygame.Rect, hp: int, max_hp: int) -> None:
+        pos = (rect.centerx - self.lifebar_lenght // 2, rect.top - 20)
+        self.queue.append((self.get_lifebar(hp, max_hp), self.convert_pos(pos)))
+
+    def add_aim(self, start_pos: tuple[float, float], x_comp: float, y_comp: float) -> None:
+        if (x_comp, y_comp) != self.aim_comps:
+            self.aim_comps = (x_comp, y_comp)
+
+            # The line is drawn once per aim direction, in a sprite just big enough to hold it
+            end = (x_comp * self.aim_lenght, y_comp * self.aim_lenght)
+            left = int(min(0, end[0])) - 1
+            top = int(min(0, end[1])) - 1
+
+            self.aim_surf = pygame.Surface((int(abs(end[0])) + 3, int(abs(end[1])) + 3))
+            self.aim_surf.fill("black")
+            pygame.draw.line(self.aim_surf, self.aim_color, (-left, -top), (end[0] - left, end[1] - top))
+            self.aim_surf.set_colorkey("black")
+
+            self.aim_offset = (left, top)
+            self.renders += 1
+
+        screen_pos = self.convert_pos(start_pos)
+        self.queue.append((self.aim_surf, (screen_pos[0] + self.aim_offset[0], screen_pos[1] + self.aim_offset[1])))
+
+    def add_cursor(self, pos: tuple[int, int]) -> None:
+        self.queue.append((self.cursor_surf, (pos[0] - self.cursor_radius, pos[1] - self.cursor_radius)))
+
+    def draw(self) -> None:
+        self.surface.blits(self.queue, doreturn=False)
+        self.queue.clear()
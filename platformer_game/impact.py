@@ -1,71 +1,154 @@
-import math
-
+import numpy as np
 import pygame
 
 from .camera import Camera
 
 
-class Impact(Camera):
+class ImpactSystem(Camera):
 
-    def __init__(
-            self, 
-            surface: pygame.Surface,
-            pos: tuple[float, float], 
-            size: float, 
-            base_size: float, 
-            angle: float,
-            game,
-            speed: float = 0,
-            dissipation: float = 0.2, 
-            color="white"
-        ):
+    # Hard budget, the oldest impacts are recycled first once it is reached
+    max_impacts: int = 1024
+
+    def __init__(self, surface: pygame.Surface, game, max_impacts: int | None = None):
         super().__init__()
         self.surface = surface
 
-        self.x, self.y = pos
-        self.size = size
-        self.base_size = base_size
-        self.angle = angle
+        self.game = game
 
-        self.color = color
+        if max_impacts is not None:
+            self.max_impacts = max_impacts
 
-        self.speed = speed
-        self.dissipation = dissipation
+        self.count: int = 0
+        self.recycled: int = 0
 
-        self.x_comp = math.cos(self.angle)
-        self.y_comp = math.sin(self.angle)
+        # Slots are kept in spawn order, oldest first
+        self.x = np.zeros(self.max_impacts, dtype=np.float64)
+        self.y = np.zeros(self.max_impacts, dtype=np.float64)
+        self.size = np.zeros(self.max_impacts, dtype=np.float64)
+        self.base_size = np.zeros(self.max_impacts, dtype=np.float64)
+        self.speed = np.zeros(self.max_impacts, dtype=np.float64)
+        self.dissipation = np.zeros(self.max_impacts, dtype=np.float64)
 
-        self.base_x_comp = math.cos(self.angle + math.pi / 2)
-        self.base_y_comp = math.sin(self.angle + math.pi / 2)
+        self.x_comp = np.zeros(self.max_impacts, dtype=np.float64)
+        self.y_comp = np.zeros(self.max_impacts, dtype=np.float64)
+        self.base_x_comp = np.zeros(self.max_impacts, dtype=np.float64)
+        self.base_y_comp = np.zeros(self.max_impacts, dtype=np.float64)
 
-        self.game = game
+        self.colors = np.zeros((self.max_impacts, 3), dtype=np.uint8)
+
+        self.arrays: tuple[np.ndarray, ...] = (
+            self.x, self.y, self.size, self.base_size, self.speed, self.dissipation,
+            self.x_comp, self.y_comp, self.base_x_comp, self.base_y_comp, self.colors
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def recycle(self, n: int) -> None:
+        # Drops the n oldest impacts to make room for new ones
+        n = min(n, self.count)
+
+        for array in self.arrays:
+            array[:self.count - n] = array[n:self.count]
+
+        self.count -= n
+        self.recycled += n
+
+    def spawn(
+            self,
+            pos: tuple[float, float],
+            sizes: list[float],
+            base_sizes: list[float],
+            angles: list[float],
+            speeds: list[float],
+            dissipation: float = 0.2,
+            color="white"
+        ) -> None:
+        n = min(len(sizes), self.max_impacts)
+
+        if n == 0: return
+
+        # Keep the most recent impacts of a burst larger than the whole budget
+        sizes, base_sizes, angles, speeds = sizes[-n:], base_sizes[-n:], angles[-n:], speeds[-n:]
+
+        if self.count + n > self.max_impacts:
+            self.recycle(self.count + n - self.max_impacts)
 
-    @property
-    def active(self) -> None:
-        return self.base_size > 0
+        start, end = self.count, self.count + n
+        angles = np.asarray(angles, dtype=np.float64)
+
+        self.x[start:end] = pos[0]
+        self.y[start:end] = pos[1]
+        self.size[start:end] = sizes
+        self.base_size[start:end] = base_sizes
+        self.speed[start:end] = speeds
+        self.dissipation[start:end] = dissipation
+
+        self.x_comp[start:end] = np.cos(angles)
+        self.y_comp[start:end] = np.sin(angles)
+        self.base_x_comp[start:end] = np.cos(angles + np.pi / 2)
+        self.base_y_comp[start:end] = np.sin(angles + np.pi / 2)
+
+        self.colors[start:end] = tuple(pygame.Color(color))[:3]
+
+        self.count = end
+
+    def update(self, game_speed: float) -> None:
+        n = self.count
+
+        self.x[:n] += self.x_comp[:n] * self.speed[:n] * game_speed
+        self.y[:n] += self.y_comp[:n] * self.speed[:n] * game_speed
+        np.maximum(self.base_size[:n] - self.dissipation[:n], 0, out=self.base_size[:n])
+        self.size[:n] += self.dissipation[:n]
+
+    def vertices(self) -> np.ndarray:
+        # Screen space triangles, shape (count, 3, 2): tip, then both base corners
+        n = self.count
+
+        x = self.x[:n] - Camera.offset_x + Camera.shake_x
+        y = self.y[:n] - Camera.offset_y + Camera.shake_y
+
+        base_x = self.base_x_comp[:n] * self.base_size[:n]
+        base_y = self.base_y_comp[:n] * self.base_size[:n]
+
+        vertices = np.empty((n, 3, 2), dtype=np.float64)
+        vertices[:, 0, 0] = x + self.x_comp[:n] * self.size[:n]
+        vertices[:, 0, 1] = y + self.y_comp[:n] * self.size[:n]
+        vertices[:, 1, 0] = x + base_x
+        vertices[:, 1, 1] = y + base_y
+        vertices[:, 2, 0] = x - base_x
+        vertices[:, 2, 1] = y - base_y
+
+        return vertices
 
     def draw(self) -> None:
-        
-
-        end_pos = (self.x + self.x_comp * (self.size), self.y + self.y_comp * (self.size))
-        base_1 = (self.x + self.base_x_comp * (self.base_size), self.y + self.base_y_comp * (self.base_size))
-        base_2 = (self.x - self.base_x_comp * (self.base_size), self.y - self.base_y_comp * (self.base_size))
-
-        pygame.draw.polygon(
-            self.surface,
-            self.color,
-            [
-                self.convert_pos(end_pos),
-                self.convert_pos(base_1),
-                self.convert_pos(base_2)
-            ]
+        if self.count == 0: return
+
+        vertices = self.vertices()
+
+        # Triangles entirely off the surface are skipped before any per-impact work
+        width, height = self.surface.get_size()
+        visible = np.flatnonzero(
+            (vertices[:, :, 0].max(axis=1) > -1) & (vertices[:, :, 0].min(axis=1) < width + 1) &
+            (vertices[:, :, 1].max(axis=1) > -1) & (vertices[:, :, 1].min(axis=1) < height + 1)
         )
 
-    def update(self) -> None:
-        if self.active:
-            self.x += self.x_comp * self.speed * self.game.game_speed
-            self.y += self.y_comp * self.speed * self.game.game_speed
-            self.base_size = max(self.base_size - self.dissipation, 0)
-            self.size += self.dissipation
+        vertices = vertices[visible]
+        points = [zip(vertices[:, k, 0].tolist(), vertices[:, k, 1].tolist()) for k in range(3)]
+
+        self.surface.polygons(list(zip(self.colors[visible].tolist(), zip(*points))))
+
+    def compact(self) -> None:
+        n = self.count
+        keep = np.flatnonzero(self.base_size[:n] > 0)
+        m = len(keep)
+
+        if m == n: return
 
+        for array in self.arrays:
+            array[:m] = array[keep]
 
+        self.count = m
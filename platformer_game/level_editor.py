@@ -4,9 +4,10 @@ import datetime
 import pygame
 
 from .tilemap import TileMap
-from .utils import load_tile_assets
+from .assets import AssetRegistry
 from .camera import Camera
 from .popup import get_text_input
+from .presentation import get_presenter
 
 
 class LevelEditor(Camera):
@@ -55,6 +56,8 @@ class LevelEditor(Camera):
         self.window: pygame.Surface = window
         self.display: pygame.Surface = pygame.Surface(self.window.get_size())
 
+        self.presenter = get_presenter()
+
         self.clock = pygame.time.Clock()
 
         self.game_loop: bool = True
@@ -99,16 +102,14 @@ class LevelEditor(Camera):
         self.player_surf.fill("green")
         self.player_surf.set_alpha(50)
 
-        self.grass_surf = pygame.image.load("Assets/Other/grass.png").convert()
+        # The shared surface is copied, the alpha is only for the editor
+        self.grass_surf = AssetRegistry.get().image(os.path.join("Assets", "Other", "grass.png"), colorkey="black").copy()
         self.grass_surf.set_alpha(150)
-        self.grass_surf.set_colorkey("black")
 
-        self.cursor_surf: pygame.Surface = pygame.image.load(
-            os.path.join("Assets", "Other", "cursor.png")
+        self.cursor_surf: pygame.Surface = AssetRegistry.get().image(
+            os.path.join("Assets", "Other", "cursor.png"), colorkey="black", convert=False
         )
 
-        self.cursor_surf.set_colorkey("black")
-
 
     def switch_selection_mode(self) -> None:
 
@@ -160,7 +161,7 @@ class LevelEditor(Camera):
     def load_assets(self, asset_path: str) -> None:
         self.assets = {}
 
-        self.assets["tiles"] = load_tile_assets(os.path.join(asset_path, "Tile_assets"))
+        self.assets["tiles"] = AssetRegistry.get(asset_path).tile_assets()
 
 
     def manage_camera(self) -> None:
@@ -269,10 +270,10 @@ class LevelEditor(Camera):
 
                         for i, j in self.get_selected_indexes():
 
-                            tile_key = self.tilemap.get_tile_key((i, j))
+                            tile = self.tilemap.get_tile((i, j))
 
-                            if tile_key in self.tilemap.tiles:
-                                self.selected_tiles.append(self.tilemap.get_tile((i, j)))
+                            if tile is not None:
+                                self.selected_tiles.append(tile)
 
                         # print(self.selected_tiles)
 
@@ -427,6 +428,8 @@ class LevelEditor(Camera):
 
             tile["variant"] = self.autotile_map.get(automap_key, 8)
 
+            self.tilemap.set_tile(indexes, tile["tile_type"], tile["variant"], tile["layer"])
+
 
     def get_surrounding_indexes(self, indexes: tuple[int, int], corners: bool = False) -> list[tuple[int, int]]:
         surrounding_tiles: list[tuple[int, int]] = []
@@ -549,6 +552,7 @@ class LevelEditor(Camera):
             #     width=3
             # )
 
+            self.tilemap.update_streaming()
             self.tilemap.draw_tiles()
 
             for grass in self.tilemap.grasses.values():
@@ -582,6 +586,6 @@ class LevelEditor(Camera):
 
             self.window.blit(self.display, (0, 0))
 
-            pygame.display.update()
+            self.presenter.present_window()
 
             self.clock.tick(60)
\ No newline at end of file
@@ -0,0 +1,263 @@
+import json
+import struct
+from array import array
+
+from .tile_store import TileStore, TileChunk, CHUNK_SIZE, CHUNK_CELLS
+
+
+BINARY_LEVEL_EXTENSION: str = ".plvl"
+
+MAGIC: bytes = b"PLVL"
+VERSION: int = 1
+
+HEADER = struct.Struct("<4sHH")
+SECTION_HEADER = struct.Struct("<4sI")
+CHUNK_HEADER = struct.Struct("<IH")
+CHUNK_KEY = struct.Struct("<ii")
+CHUNK_RECORD_SIZE: int = 3 * CHUNK_CELLS
+
+ENTRY = struct.Struct("<iiii")
+ENEMY = struct.Struct("<iiiiB")
+METADATA = struct.Struct("<iiH")
+COUNT = struct.Struct("<I")
+BOUND = struct.Struct("<i")
+
+
+def is_binary_level(filepath: str) -> bool:
+    return filepath.lower().endswith(BINARY_LEVEL_EXTENSION)
+
+
+def get_key(indexes) -> str:
+    return ";".join(map(str, indexes))
+
+
+def pack_palette(tiles: TileStore) -> bytes:
+    data = bytearray(COUNT.pack(len(tiles.palette)))
+
+    for tile_type in tiles.palette:
+        encoded = tile_type.encode("utf-8")
+        data += struct.pack("<B", len(encoded)) + encoded
+
+    return bytes(data)
+
+
+def pack_chunks(tiles: TileStore) -> bytes:
+    keys = sorted(tiles.chunks)
+
+    data = bytearray(CHUNK_HEADER.pack(len(keys), CHUNK_SIZE))
+
+    for ci, cj in keys:
+        data += CHUNK_KEY.pack(ci, cj)
+
+    for key in keys:
+        chunk = tiles.chunks[key]
+        data += chunk.types
+        data += chunk.variants
+        data += chunk.layers.tobytes()
+
+    return bytes(data)
+
+
+def pack_entries(entries: dict[str, dict]) -> bytes:
+    data = bytearray(COUNT.pack(len(entries)))
+
+    for entry in entries.values():
+        data += ENTRY.pack(*entry["indexes"], *entry["coord"])
+
+    return bytes(data)
+
+
+def pack_enemies(enemies: dict[str, dict]) -> bytes:
+    data = bytearray(COUNT.pack(len(enemies)))
+
+    for enemy in enemies.values():
+        data += ENEMY.pack(*enemy["indexes"], *enemy["coord"], enemy.get("variant", 0))
+
+    return bytes(data)
+
+
+def pack_metadata(tile_metadata: dict[str, dict]) -> bytes:
+    data = bytearray(COUNT.pack(len(tile_metadata)))
+
+    for metadata in tile_metadata.values():
+        encoded = metadata["text"].encode("utf-8")
+        data += METADATA.pack(*metadata["indexes"], len(encoded)) + encoded
+
+    return bytes(data)
+
+
+def pack_binary_level(map_obj: dict) -> bytes:
+    tiles: TileStore = map_obj["tiles"]
+    player: dict = map_obj["player"]
+
+    sections: list[tuple[bytes, bytes]] = [
+        (b"PALT", pack_palette(tiles)),
+        (b"CHNK", pack_chunks(tiles)),
+        (b"ENMY", pack_enemies(map_obj["enemies"])),
+        (b"GRAS", pack_entries(map_obj["grasses"])),
+        (b"META", pack_metadata(map_obj["tile_metadata"])),
+        (b"PLYR", ENTRY.pack(*player["indexes"], *player["coord"])),
+        (b"BNDS", BOUND.pack(map_obj["bottom_bound"])),
+        (b"OFFG", json.dumps(map_obj["offgrid_elements"]).encode("utf-8")),
+    ]
+
+    if "assets" in map_obj:
+        sections.append((b"ASET", json.dumps(map_obj["assets"]).encode("utf-8")))
+
+    data = bytearray(HEADER.pack(MAGIC, VERSION, len(sections)))
+
+    for tag, payload in sections:
+        data += SECTION_HEADER.pack(tag, len(payload))
+        data += payload
+
+    return bytes(data)
+
+
+def save_binary_level(filepath: str, map_obj: dict) -> None:
+    data = pack_binary_level(map_obj)
+
+    with open(filepath, "wb") as f:
+        f.write(data)
+
+
+def read_sections(data) -> dict[bytes, tuple[int, int]]:
+    magic, version, section_count = HEADER.unpack_from(data, 0)
+
+    if magic != MAGIC:
+        raise ValueError(f"Not a binary level file, got magic {magic!r}")
+
+    if version > VERSION:
+        raise ValueError(f"Unsupported binary level version {version}, expected at most {VERSION}")
+
+    sections: dict[bytes, tuple[int, int]] = {}
+    offset = HEADER.size
+
+    for _ in range(section_count):
+        tag, length = SECTION_HEADER.unpack_from(data, offset)
+        offset += SECTION_HEADER.size
+        sections[tag] = (offset, length)
+        offset += length
+
+    return sections
+
+
+def unpack_palette(data, offset: int) -> list[str]:
+    (count,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+
+    palette: list[str] = []
+    for _ in range(count):
+        length = data[offset]
+        palette.append(bytes(data[offset + 1:offset + 1 + length]).decode("utf-8"))
+        offset += 1 + length
+
+    return palette
+
+
+def unpack_chunk_directory(data, offset: int) -> tuple[list[tuple[int, int]], int]:
+    count, chunk_size = CHUNK_HEADER.unpack_from(data, offset)
+
+    if chunk_size != CHUNK_SIZE:
+        raise ValueError(f"Level chunk size {chunk_size} does not match engine chunk size {CHUNK_SIZE}")
+
+    offset += CHUNK_HEADER.size
+    keys = list(CHUNK_KEY.iter_unpack(data[offset:offset + count * CHUNK_KEY.size]))
+
+    return keys, offset + count * CHUNK_KEY.size
+
+
+def unpack_chunk(data, offset: int) -> TileChunk:
+    chunk = TileChunk()
+    chunk.types[:] = data[offset:offset + CHUNK_CELLS]
+    chunk.variants[:] = data[offset + CHUNK_CELLS:offset + 2 * CHUNK_CELLS]
+    chunk.layers = array("b", bytes(data[offset + 2 * CHUNK_CELLS:offset + CHUNK_RECORD_SIZE]))
+    chunk.count = CHUNK_CELLS - chunk.types.count(0)
+
+    return chunk
+
+
+def unpack_entries(data, offset: int, struct_format: struct.Struct = ENTRY) -> list[tuple]:
+    (count,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+
+    return [struct_format.unpack_from(data, offset + n * struct_format.size) for n in range(count)]
+
+
+def unpack_metadata(data, offset: int) -> dict[str, dict]:
+    (count,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+
+    tile_metadata: dict[str, dict] = {}
+    for _ in range(count):
+        i, j, length = METADATA.unpack_from(data, offset)
+        offset += METADATA.size
+        tile_metadata[get_key((i, j))] = {
+            "indexes": [i, j],
+            "text": bytes(data[offset:offset + length]).decode("utf-8")
+        }
+        offset += length
+
+    return tile_metadata
+
+
+def unpack_tiles(data, sections: dict[bytes, tuple[int, int]]) -> TileStore:
+    tiles = TileStore()
+
+    if b"PALT" in sections:
+        for tile_type in unpack_palette(data, sections[b"PALT"][0]):
+            tiles.intern(tile_type)
+
+    if b"CHNK" in sections:
+        keys, offset = unpack_chunk_directory(data, sections[b"CHNK"][0])
+
+        for n, key in enumerate(keys):
+            tiles.chunks[key] = unpack_chunk(data, offset + n * CHUNK_RECORD_SIZE)
+
+    return tiles
+
+
+def parse_binary_level(data, with_tiles: bool = True) -> dict:
+    sections = read_sections(data)
+    map_obj: dict = {}
+
+    if with_tiles:
+        map_obj["tiles"] = unpack_tiles(data, sections)
+
+    if b"ENMY" in sections:
+        map_obj["enemies"] = {
+            get_key((i, j)): {"indexes": [i, j], "coord": [x, y], "variant": variant}
+            for i, j, x, y, variant in unpack_entries(data, sections[b"ENMY"][0], ENEMY)
+        }
+
+    if b"GRAS" in sections:
+        map_obj["grasses"] = {
+            get_key((i, j)): {"indexes": [i, j], "coord": [x, y]}
+            for i, j, x, y in unpack_entries(data, sections[b"GRAS"][0])
+        }
+
+    if b"META" in sections:
+        map_obj["tile_metadata"] = unpack_metadata(data, sections[b"META"][0])
+
+    if b"PLYR" in sections:
+        i, j, x, y = ENTRY.unpack_from(data, sections[b"PLYR"][0])
+        map_obj["player"] = {"indexes": [i, j], "coord": [x, y]}
+
+    if b"BNDS" in sections:
+        map_obj["bottom_bound"] = BOUND.unpack_from(data, sections[b"BNDS"][0])[0]
+
+    if b"OFFG" in sections:
+        offset, length = sections[b"OFFG"]
+        map_obj["offgrid_elements"] = json.loads(bytes(data[offset:offset + length]).decode("utf-8"))
+
+    if b"ASET" in sections:
+        offset, length = sections[b"ASET"]
+        map_obj["assets"] = json.loads(bytes(data[offset:offset + length]).decode("utf-8"))
+
+    return map_obj
+
+
+def load_binary_level(filepath: str) -> dict:
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    return parse_binary_level(data)
@@ -5,19 +5,24 @@ import pygame
 
 from .game import Game
 from .level_editor import LevelEditor
+from .tilemap import TileMap
+from .assets import AssetRegistry
+from .asset_loader import AssetLoader
 from .button import Button
 from .camera import Camera
 from .popup import get_text_input
+from .presentation import set_presenter
 
 
 class LevelSelection:
 
-    def __init__(self, folderpath: str):
+    def __init__(self, folderpath: str, presentation: str = "software", pixel_cache_path: str | None = None):
         pygame.init()
         
         self.folderpath = folderpath
 
-        self.window = pygame.display.set_mode()
+        self.presenter = set_presenter(presentation)
+        self.window = self.presenter.window
 
         self.level_sets: list[str] = os.listdir(self.folderpath)
 
@@ -49,11 +54,21 @@ class LevelSelection:
             (self.window.get_width() // 2 - 20, self.window.get_height() - 60)
         )
 
-        self.cursor_surf: pygame.Surface = pygame.image.load(
-            os.path.join("Assets", "Other", "cursor.png")
+        self.cursor_surf: pygame.Surface = AssetRegistry.get().image(
+            os.path.join("Assets", "Other", "cursor.png"), colorkey="black", convert=False
         )
 
-        self.cursor_surf.set_colorkey("black")
+        # Assets are decoded in the background while the menu is idle
+        self.loading_progress: float = 1
+
+        # Decoded pixels are read back from pixel_cache_path on the next launches when it is given
+        if pixel_cache_path is not None:
+            AssetRegistry.get().enable_pixel_cache(pixel_cache_path)
+
+        self.asset_loader = AssetLoader()
+        self.asset_loader.progress_callbacks.append(self.set_loading_progress)
+        self.assets_preloaded: bool = False
+        AssetRegistry.get().prefetch(self.asset_loader)
 
         self.game_loop: bool = True
 
@@ -126,6 +141,10 @@ class LevelSelection:
 
             for _, rect, level_name in self.level_surf_rects:
                 if rect.collidepoint(mouse_pos):
+                    if left_clicked:
+                        # Assets edited on disk since they were decoded are picked up by the next session
+                        AssetRegistry.get().invalidate_changed()
+
                     if ctrl_pressed and left_clicked:
                         self.level_editor = LevelEditor(self, self.window, os.path.join(self.folderpath, self.selected_level_set, level_name))
                     elif ctrl_pressed and right_clicked:
@@ -174,7 +193,8 @@ class LevelSelection:
     def create_level(self, level_set: str, level_name: str) -> None:
         level_path = os.path.join(self.folderpath, level_set, level_name + ".json")
         if not os.path.exists(level_path):
-            LevelEditor(self, self.window, level_path).save_map()
+            # An empty map, no need for an editor and its assets to write it
+            TileMap(None, assets={}).save_tiles(level_path)
             self.set_level_set(self.selected_level_set)
 
         
@@ -194,7 +214,30 @@ class LevelSelection:
 
             self.level_surf_rects.append((surf, rect, level_name))
 
+    def set_loading_progress(self, done: int, total: int) -> None:
+        self.loading_progress = done / total
+
+    def draw_loading_bar(self) -> None:
+        if self.asset_loader.idle: return
+
+        pygame.draw.rect(
+            self.window,
+            "gray",
+            (0, self.window.get_height() - 4, int(self.window.get_width() * self.loading_progress), 4)
+        )
+
+    def prefetch_assets(self) -> None:
+        # Files edited during a session are decoded again before the next one
+        registry = AssetRegistry.get()
+        registry.invalidate_changed()
+        registry.prefetch(self.asset_loader)
+        self.assets_preloaded = False
+
     def update(self, all_events: list[pygame.event.Event]) -> None:
+        if self.asset_loader.update() and not self.assets_preloaded:
+            AssetRegistry.get().preload()
+            self.assets_preloaded = True
+
         if self.selected_level_set is not None:
             self.return_button.update()
 
@@ -202,6 +245,7 @@ class LevelSelection:
 
         self.manage_level_selection(all_events)
         self.draw_level_menu()
+        self.draw_loading_bar()
         self.window.blit(
             self.cursor_surf,
             pygame.mouse.get_pos()
@@ -228,17 +272,20 @@ class LevelSelection:
                 self.level_editor.run()
                 self.level_editor = None
                 Camera.reset_camera()
+                self.prefetch_assets()
 
             if self.game is not None:
                 self.game.run()
                 self.game = None
                 Camera.reset_camera()
+                self.prefetch_assets()
 
             self.update(all_events)
 
-            pygame.display.update()
+            self.presenter.present_window()
 
             self.clock.tick(60)
 
+        self.asset_loader.shutdown()
         
         pygame.quit()
@@ -0,0 +1,60 @@
+from typing import NamedTuple
+
+from .tilemap import TileMap
+
+
+class EnemySpawn(NamedTuple):
+    coord: tuple[int, int]
+    weapon_name: str | None
+
+
+class PickUpSpawn(NamedTuple):
+    kind: str
+    name: str
+    pos: tuple[int, int]
+
+
+class GrassSpawn(NamedTuple):
+    tile_key: str
+    coord: tuple[int, int]
+
+
+class LevelSnapshot(NamedTuple):
+    level_path: str
+    player_coord: tuple[int, int]
+    enemies: tuple[EnemySpawn, ...]
+    grasses: tuple[GrassSpawn, ...]
+    pickups: tuple[PickUpSpawn, ...]
+
+    @classmethod
+    def from_tilemap(cls, level_path: str, tilemap: TileMap) -> "LevelSnapshot":
+        enemies: list[EnemySpawn] = []
+
+        for tile_key, enemy in tilemap.enemies.items():
+            weapon_name = None
+            metadata = tilemap.tile_metadata.get(tile_key, None)
+
+            if metadata is not None:
+                if metadata["text"].startswith("enemy_weapon"):
+                    weapon_name = metadata["text"].split("___")[-1]
+
+            enemies.append(EnemySpawn(tuple(enemy["coord"]), weapon_name))
+
+        pickups: list[PickUpSpawn] = []
+
+        for metadata in tilemap.tile_metadata.values():
+            pos = (metadata["indexes"][0] * tilemap.tilesize, metadata["indexes"][1] * tilemap.tilesize)
+
+            if metadata["text"].startswith("weapon___"):
+                pickups.append(PickUpSpawn("weapon", metadata["text"].split("___")[-1], pos))
+
+            if metadata["text"].startswith("pickup___"):
+                pickups.append(PickUpSpawn("pickup", metadata["text"].split("___")[-1], pos))
+
+        return cls(
+            level_path,
+            tuple(tilemap.player["coord"]),
+            tuple(enemies),
+            tuple(GrassSpawn(tile_key, tuple(grass["coord"])) for tile_key, grass in tilemap.grasses.items()),
+            tuple(pickups)
+        )
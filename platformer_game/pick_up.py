@@ -1,6 +1,7 @@
 import pygame
 
 from .camera import Camera
+from .render_queue import LAYER_PICKUPS
 
 
 class PickUp(Camera):
@@ -25,26 +26,14 @@ class PickUp(Camera):
 
         self.pickup_frame: int = 0
 
-    def get_surrounding_tiles(self) -> list[dict]:
-        current_index = self.get_current_index()
-        tiles: list[dict] = []
-        for index_offset in self.game.tilemap.offset_corners + [(0, 0)] + [(-1, -2), (0, -2), (1, -2)]:
-            neighbors_indexes = (current_index[0] + index_offset[0], current_index[1] + index_offset[1])
-            tile = self.game.tilemap.get_tile(neighbors_indexes)
-            if tile is not None:
-                tiles.append(tile)
-
-        return tiles
-
     def get_current_index(self) -> tuple[int, int]:
         return int(self.x // self.game.tilemap.tilesize), int((self.y) // self.game.tilemap.tilesize)
 
-    def check_collision(self) -> dict | None:
-        current_inndexes: tuple[int, int] = self.get_current_index()
+    def check_collision(self) -> tuple[int, int] | None:
+        current_indexes: tuple[int, int] = self.get_current_index()
 
-        for surrouding_tile in self.get_surrounding_tiles():
-            if tuple(surrouding_tile["indexes"]) == current_inndexes:
-                return surrouding_tile
+        if self.game.tilemap.collision_grid.is_solid(current_indexes):
+            return current_indexes
             
         return None
 
@@ -54,12 +43,12 @@ class PickUp(Camera):
 
         self.y += self.y_vel
 
-        collided_tile: dict | None = self.check_collision()
+        collided_indexes: tuple[int, int] | None = self.check_collision()
 
-        if collided_tile is not None and self.y_vel:
+        if collided_indexes is not None and self.y_vel:
             tile_rect = pygame.Rect(
-                collided_tile["indexes"][0] * self.game.tilemap.tilesize,
-                collided_tile["indexes"][1] * self.game.tilemap.tilesize,
+                collided_indexes[0] * self.game.tilemap.tilesize,
+                collided_indexes[1] * self.game.tilemap.tilesize,
                 self.game.tilemap.tilesize,
                 self.game.tilemap.tilesize,
             )
@@ -87,12 +76,12 @@ class PickUp(Camera):
 
         self.x += self.x_vel
 
-        collided_tile: dict | None = self.check_collision()
+        collided_indexes: tuple[int, int] | None = self.check_collision()
 
-        if collided_tile is not None and self.x_vel:
+        if collided_indexes is not None and self.x_vel:
             tile_rect = pygame.Rect(
-                collided_tile["indexes"][0] * self.game.tilemap.tilesize,
-                collided_tile["indexes"][1] * self.game.tilemap.tilesize,
+                collided_indexes[0] * self.game.tilemap.tilesize,
+                collided_indexes[1] * self.game.tilemap.tilesize,
                 self.game.tilemap.tilesize,
                 self.game.tilemap.tilesize,
             )
@@ -107,7 +96,7 @@ class PickUp(Camera):
             
 
     def draw(self) -> None:
-        self.game.display.blit(
+        self.game.render_queue.layer(LAYER_PICKUPS).blit(
             self.surf,
             self.convert_pos(self.rect.topleft)
         )
@@ -119,7 +108,6 @@ class PickUp(Camera):
     def update(self) -> None:
         self.pickup_frame = max(self.pickup_frame - 1, 0)
         self.update_pos()
-        self.draw()
             
         
 
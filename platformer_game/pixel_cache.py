@@ -0,0 +1,98 @@
+import os
+import mmap
+import struct
+import hashlib
+import logging
+
+import pygame
+
+
+logger = logging.getLogger(__name__)
+
+# Magic, source mtime, width, height and display pixel format, the RGBX pixels follow
+HEADER = struct.Struct("<8sqII40s")
+MAGIC: bytes = b"PIXCACH1"
+
+
+class PixelCache:
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+
+        # Entries written for another display format are decoded again, convert() would not give the same pixels
+        display = pygame.display.get_surface()
+        self.pixel_format: bytes = f"{display.get_bitsize()}:{display.get_masks()}".encode()[:40]
+
+        # Paths whose entry was fresh, they do not need to be written again
+        self.fresh: set[str] = set()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        os.makedirs(cache_path, exist_ok=True)
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_path, hashlib.sha1(key.encode()).hexdigest() + ".pix")
+
+    def load(self, path: str) -> pygame.Surface | None:
+        # Safe to call from decoding threads, the surface still has to be converted on the main thread
+        key = os.path.abspath(path)
+
+        try:
+            mtime = os.stat(key).st_mtime_ns
+            f = open(self.entry_path(key), "rb")
+        except OSError:
+            return self.miss(key)
+
+        with f:
+            try:
+                pixels = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # An empty file can not be mapped
+                return self.miss(key)
+
+        if len(pixels) < HEADER.size:
+            return self.miss(key)
+
+        magic, entry_mtime, width, height, pixel_format = HEADER.unpack_from(pixels)
+
+        if (
+            magic != MAGIC or entry_mtime != mtime or pixel_format.rstrip(b"\0") != self.pixel_format
+            or len(pixels) != HEADER.size + width * height * 4
+        ):
+            return self.miss(key)
+
+        self.hits += 1
+        self.fresh.add(key)
+
+        # The surface keeps the mapping alive, nothing is copied until convert()
+        return pygame.image.frombuffer(memoryview(pixels)[HEADER.size:], (width, height), "RGBX")
+
+    def miss(self, key: str) -> None:
+        # A stale entry is rewritten by the next store, even within the same session
+        self.misses += 1
+        self.fresh.discard(key)
+
+    def store(self, path: str, surf: pygame.Surface) -> None:
+        # Keyed by absolute path, the loader threads decode absolute paths and the registry relative ones
+        key = os.path.abspath(path)
+
+        if key in self.fresh: return
+
+        entry_path = self.entry_path(key)
+        tmp_path = entry_path + ".tmp"
+
+        try:
+            header = HEADER.pack(MAGIC, os.stat(key).st_mtime_ns, surf.get_width(), surf.get_height(), self.pixel_format)
+
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(pygame.image.tobytes(surf, "RGBX"))
+
+            os.replace(tmp_path, entry_path)
+
+        except OSError as e:
+            logger.warning("Could not write the pixel cache entry of %s: %s", path, e)
+            return
+
+        self.fresh.add(key)
@@ -4,7 +4,6 @@ import pygame
 
 from .entity import Entity
 from .camera import Camera
-from .bullet import Bullet
 from .weapon import Pistol, AR
 
 
@@ -54,12 +53,12 @@ class Player(Entity):
             super().move_sideway(x_vel)        
 
     def update_camera_pos(self) -> None:
-        Camera.offset_x += ((self.rect.centerx - self.game.tilemap.surface.get_width() // 4) - Camera.offset_x) * 0.1
-        Camera.offset_y += ((self.rect.centery - self.game.tilemap.surface.get_height() // 4) - Camera.offset_y) * 0.1
+        Camera.offset_x += ((self.rect.centerx - self.game.tilemap.surface.get_width() // 2) - Camera.offset_x) * 0.1
+        Camera.offset_y += ((self.rect.centery - self.game.tilemap.surface.get_height() // 2) - Camera.offset_y) * 0.1
         Camera.offset_x = int(Camera.offset_x)
         Camera.offset_y = int(Camera.offset_y)
-        # Camera.offset_x = (self.rect.centerx - self.game.tilemap.surface.get_width() // 4)
-        # Camera.offset_y = (self.rect.centery - self.game.tilemap.surface.get_height() // 4)
+        # Camera.offset_x = (self.rect.centerx - self.game.tilemap.surface.get_width() // 2)
+        # Camera.offset_y = (self.rect.centery - self.game.tilemap.surface.get_height() // 2)
     
 
     def set_status(self, status: str) -> None:
@@ -91,19 +90,16 @@ class Player(Entity):
 
             start_pos = self.rect.center
 
-            new_bullet = Bullet(
+            self.game.bullets.spawn(
                 (start_pos[0] + self.x_comp * 10, start_pos[1] + self.y_comp * 10),
                 self.x_comp * 5,
                 self.y_comp * 5,
-                self.game,
                 self
             )
 
-            self.game.bullets.append(new_bullet)
-
     def manage_aim(self) -> None:
-        screen_center = (self.game.window.get_width() // 2, self.game.window.get_height() // 2)
-        mouse_pos = pygame.mouse.get_pos()
+        screen_center = (self.game.disp_size[0] / 2, self.game.disp_size[1] / 2)
+        mouse_pos = self.game.window_to_display(pygame.mouse.get_pos())
 
         x_diff = mouse_pos[0] - screen_center[0]
         y_diff = mouse_pos[1] - screen_center[1]
@@ -124,15 +120,9 @@ class Player(Entity):
 
         start_pos = self.rect.center
 
-        pygame.draw.line(
-            self.surface,
-            "red",
-            self.convert_pos(start_pos),
-            self.convert_pos((start_pos[0] + self.x_comp * 100, start_pos[1] + self.y_comp * 100))
-        )
+        self.game.hud.add_aim(start_pos, self.x_comp, self.y_comp)
 
-        pygame.draw.line(
-            self.surface,
+        self.surface.line(
             "black",
             self.convert_pos(start_pos),
             self.convert_pos((start_pos[0] + self.x_comp * 10, start_pos[1] + self.y_comp * 10)),
@@ -143,19 +133,8 @@ class Player(Entity):
         if self.weapon is not None:
             angle = -math.degrees(math.atan2(self.y_comp, self.x_comp))
             surf: pygame.Surface = self.game.assets["weapons"][self.weapon.weapon_name]
-            surf = pygame.transform.flip(
-                surf,
-                self.x_comp < 0,
-                False
-            )
-            surf.set_colorkey("white")
-            surf = pygame.transform.rotozoom(
-                surf,
-                (angle + 90) % 180 - 90,
-                0.3
-            )
-            
-            surf.set_colorkey("black")
+            surf = self.game.transform_cache.flipped(surf, self.x_comp < 0, colorkey="white")
+            surf = self.game.transform_cache.rotozoomed(surf, (angle + 90) % 180 - 90, 0.3, colorkey="black")
 
             self.surface.blit(
                 surf,
@@ -166,6 +145,9 @@ class Player(Entity):
         self.recovery_block = max(self.recovery_block - 1, 0)
 
     def draw(self):
+        if self.alive:
+            self.draw_aim()
+
         super().draw()
 
         if self.blocking_frame:
@@ -180,7 +162,6 @@ class Player(Entity):
             self.manage_status()
             self.manage_aim()
             self.manage_recovery_block()
-            self.draw_aim()
             super().update()
             
             self.update_camera_pos()
@@ -4,11 +4,13 @@ import pygame
 
 from .button import Button
 from .text_input import TextInput
+from .presentation import get_presenter
 
 
 def get_text_input(message: str, text_check: Callable = None) -> str | None:
 
-    window = pygame.display.get_surface()
+    presenter = get_presenter()
+    window = presenter.window
 
     text: str = ""
 
@@ -67,7 +69,7 @@ def get_text_input(message: str, text_check: Callable = None) -> str | None:
         text_input.draw()
 
         clock.tick(60)
-        pygame.display.update()
+        presenter.present_window()
         
     return None
 
@@ -0,0 +1,175 @@
+import weakref
+
+import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+
+
+class SoftwarePresenter:
+
+    name: str = "software"
+
+    def __init__(self, size: tuple[int, int] = (0, 0)):
+        window = pygame.display.get_surface()
+
+        self.window: pygame.Surface = window if window is not None else pygame.display.set_mode(size)
+
+        # Part of the window covered by the scaled view
+        self.view: pygame.Surface | None = None
+
+    def top_layer(self, display: pygame.Surface) -> pygame.Surface:
+        return display
+
+    def present_view(self, display: pygame.Surface, render_scale: int, layer: pygame.Surface) -> None:
+        if render_scale == 1:
+            self.window.blit(display, (0, 0))
+            return
+
+        view_size = (display.get_width() * render_scale, display.get_height() * render_scale)
+
+        if self.view is None or self.view.get_size() != view_size or self.view.get_parent().get_size() != self.window.get_size():
+            # The leftover border when the window size is not a multiple of render_scale stays black
+            self.window.fill("black")
+            self.view = self.window.subsurface((0, 0) + view_size)
+
+        pygame.transform.scale(display, view_size, self.view)
+
+    def draw_overlay(self, surf: pygame.Surface) -> None:
+        self.window.blit(surf, (0, 0))
+
+    def present(self) -> None:
+        pygame.display.update()
+
+    def present_window(self) -> None:
+        pygame.display.update()
+
+
+class TextureLayer:
+
+    def __init__(self, display: pygame.Surface):
+        self.display = display
+
+        # Sprites to draw through the renderer this frame, in display coordinates
+        self.queue: list[tuple[pygame.Surface, tuple[float, float]]] = []
+
+    def get_size(self) -> tuple[int, int]:
+        return self.display.get_size()
+
+    def get_width(self) -> int:
+        return self.display.get_width()
+
+    def get_height(self) -> int:
+        return self.display.get_height()
+
+    def blit(self, source: pygame.Surface, dest: tuple[float, float]) -> None:
+        self.queue.append((source, dest))
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> None:
+        self.queue.extend(blit_sequence)
+
+
+class RendererPresenter:
+
+    name: str = "renderer"
+
+    def __init__(self, size: tuple[int, int] = (0, 0)):
+        pygame.display.init()
+
+        if size == (0, 0):
+            size = pygame.display.get_desktop_sizes()[0]
+
+        # Surface.convert needs a display mode, a hidden one gives it the pixel format without a second window on screen
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        self.sdl_window = Window("pygame window", size)
+        self.renderer = Renderer(self.sdl_window)
+
+        # Menus and the level editor keep drawing in software, into this surface
+        self.window: pygame.Surface = pygame.Surface(size)
+
+        # Static sprites are uploaded once and dropped with their surface
+        self.textures: weakref.WeakKeyDictionary[pygame.Surface, Texture] = weakref.WeakKeyDictionary()
+        self.uploads: int = 0
+
+        # Streaming textures for surfaces redrawn every frame
+        self.streams: dict[str, Texture] = {}
+
+    def texture(self, surf: pygame.Surface) -> Texture:
+        texture = self.textures.get(surf, None)
+
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surf)
+            self.textures[surf] = texture
+            self.uploads += 1
+
+        return texture
+
+    def stream(self, name: str, surf: pygame.Surface, blend: bool = False) -> Texture:
+        texture = self.streams.get(name, None)
+
+        if texture is None or (texture.width, texture.height) != surf.get_size():
+            texture = Texture(self.renderer, surf.get_size(), streaming=True)
+            self.streams[name] = texture
+
+            # Blending keeps the surface colorkey transparent once uploaded
+            if blend:
+                texture.blend_mode = pygame.BLENDMODE_BLEND
+
+        texture.update(surf)
+
+        return texture
+
+    def top_layer(self, display: pygame.Surface) -> TextureLayer:
+        return TextureLayer(display)
+
+    def present_view(self, display: pygame.Surface, render_scale: int, layer: TextureLayer) -> None:
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+        self.stream("view", display).draw(
+            dstrect=(0, 0, display.get_width() * render_scale, display.get_height() * render_scale)
+        )
+
+        # Tiles and HUD sprites go over the software layer, scaled by the renderer
+        for surf, pos in layer.queue:
+            self.texture(surf).draw(dstrect=(
+                int(pos[0]) * render_scale,
+                int(pos[1]) * render_scale,
+                surf.get_width() * render_scale,
+                surf.get_height() * render_scale
+            ))
+
+        layer.queue.clear()
+
+    def draw_overlay(self, surf: pygame.Surface) -> None:
+        self.stream("overlay", surf, blend=True).draw()
+
+    def present(self) -> None:
+        self.renderer.present()
+
+    def present_window(self) -> None:
+        self.stream("window", self.window).draw()
+        self.renderer.present()
+
+
+presenters: dict[str, type] = {
+    "software": SoftwarePresenter,
+    "renderer": RendererPresenter
+}
+
+active_presenter: SoftwarePresenter | RendererPresenter | None = None
+
+
+def set_presenter(name: str, size: tuple[int, int] = (0, 0)) -> SoftwarePresenter | RendererPresenter:
+    global active_presenter
+
+    active_presenter = presenters[name](size)
+
+    return active_presenter
+
+
+def get_presenter() -> SoftwarePresenter | RendererPresenter:
+    if active_presenter is None:
+        return set_presenter("software")
+
+    return active_presenter
@@ -0,0 +1,89 @@
+import logging
+from typing import NamedTuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class QualityTier(NamedTuple):
+    name: str
+    impact_ratio: float
+    grass_density: float
+    clouds: int
+    # Added to Game.render_scale, a larger scale renders fewer pixels
+    extra_render_scale: int
+
+
+class QualityGovernor:
+
+    tiers: list[QualityTier] = [
+        QualityTier("high", 1, 1, 5, 0),
+        QualityTier("medium", 0.5, 0.75, 3, 0),
+        QualityTier("low", 0.25, 0.5, 1, 0),
+        QualityTier("lowest", 0.25, 0.5, 0, 1)
+    ]
+
+    # Weight of the newest frame in the moving average
+    smoothing: float = 0.05
+
+    # Step down above the budget, step back up only well below it, so a tier that just fits stays
+    downgrade_ratio: float = 1
+    upgrade_ratio: float = 0.6
+
+    # Frames to wait after a change before the average is trusted again
+    cooldown_frames: int = 120
+
+    # Headroom has to last this long before stepping up, doubled every time a step up did not hold
+    upgrade_frames: int = 300
+    max_upgrade_frames: int = 7200
+
+    def __init__(self, fps: int, tier: int = 0):
+        self.budget_ms: float = 1000 / fps
+        self.tier_index: int = tier
+
+        self.frame_ms: float | None = None
+
+        self.frames_since_change: int = 0
+        self.last_change: int = 0
+        self.upgrade_wait: int = self.upgrade_frames
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.tier_index]
+
+    def update(self, frame_ms: float) -> bool:
+        if self.frame_ms is None:
+            self.frame_ms = frame_ms
+        else:
+            self.frame_ms += (frame_ms - self.frame_ms) * self.smoothing
+
+        self.frames_since_change += 1
+
+        if self.frames_since_change < self.cooldown_frames:
+            return False
+
+        if self.frame_ms > self.budget_ms * self.downgrade_ratio and self.tier_index < len(self.tiers) - 1:
+            if self.last_change > 0 and self.frames_since_change < self.upgrade_wait:
+                self.upgrade_wait = min(self.upgrade_wait * 2, self.max_upgrade_frames)
+
+            self.set_tier(self.tier_index + 1)
+            return True
+
+        if self.frame_ms < self.budget_ms * self.upgrade_ratio and self.tier_index > 0:
+            if self.frames_since_change < self.upgrade_wait:
+                return False
+
+            self.set_tier(self.tier_index - 1)
+            return True
+
+        return False
+
+    def set_tier(self, tier: int) -> None:
+        logger.info(
+            "Quality %s -> %s (frame time %.2f ms, budget %.2f ms)",
+            self.tier.name, self.tiers[tier].name, self.frame_ms, self.budget_ms
+        )
+
+        self.last_change = self.tier_index - tier
+        self.tier_index = tier
+        self.frames_since_change = 0
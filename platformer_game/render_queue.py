@@ -0,0 +1,65 @@
+from .draw_list import DrawList
+
+
+# Draw order of a frame, lower layers first
+LAYER_SKY = 0
+LAYER_CLOUDS = 1
+LAYER_SHADE = 2
+LAYER_ENTITIES = 3
+LAYER_BULLETS = 4
+LAYER_IMPACTS = 5
+LAYER_GRASS = 6
+LAYER_PICKUPS = 7
+LAYER_TILES = 8
+LAYER_HUD = 9
+
+LAYER_COUNT = 10
+
+# Layers drawn through the presenter's top layer rather than the display
+TOP_LAYERS = {LAYER_TILES, LAYER_HUD}
+
+
+class RenderQueue:
+
+    def __init__(self, display, top_layer):
+        # One draw list per layer, sprites submitted to a layer keep their submission order
+        self.layers: list[DrawList] = [DrawList(display) for _ in range(LAYER_COUNT)]
+
+        self.set_targets(display, top_layer)
+
+    def layer(self, layer: int) -> DrawList:
+        return self.layers[layer]
+
+    def set_targets(self, display, top_layer) -> None:
+        for layer, draw_list in enumerate(self.layers):
+            draw_list.target = top_layer if layer in TOP_LAYERS else display
+
+    def swap(self) -> list[tuple[DrawList, list[tuple]]]:
+        # Layers are flushed in order, neighbouring layers with the same target are replayed as one list
+        # so their blits end up in the same Surface.blits batch
+        job: list[tuple[DrawList, list[tuple]]] = []
+
+        for draw_list in self.layers:
+            commands = draw_list.swap()
+
+            if not commands:
+                continue
+
+            if not job or job[-1][0].target is not draw_list.target:
+                job.append((draw_list, list(commands)))
+                continue
+
+            merged = job[-1][1]
+
+            if merged[-1][0] == "blits" and commands[0][0] == "blits":
+                merged[-1] = ("blits", merged[-1][1] + commands[0][1])
+                merged.extend(commands[1:])
+            else:
+                merged.extend(commands)
+
+        return job
+
+    @staticmethod
+    def execute(job: list[tuple[DrawList, list[tuple]]]) -> None:
+        for draw_list, commands in job:
+            draw_list.execute(commands)
@@ -0,0 +1,103 @@
+import sys
+
+import pygame
+
+
+class RenderTargetPool:
+
+    def __init__(self):
+        self.targets: dict[str, pygame.Surface] = {}
+        self.allocations: int = 0
+
+    def get(self, name: str, size: tuple[int, int]) -> pygame.Surface:
+        # Same surface every frame, only allocated again when the requested size changes
+        target = self.targets.get(name, None)
+
+        if target is None or target.get_size() != tuple(size):
+            target = pygame.Surface(size)
+            self.targets[name] = target
+            self.allocations += 1
+
+        return target
+
+    def clear(self) -> None:
+        self.targets.clear()
+
+
+class AllocationCounter:
+
+    # pygame.transform functions that return a new surface unless given a destination
+    transform_functions: dict[str, int] = {
+        "flip": -1,
+        "rotate": -1,
+        "rotozoom": -1,
+        "scale": 2,
+        "smoothscale": 2,
+        "scale_by": 2,
+        "smoothscale_by": 2,
+        "scale2x": 1
+    }
+
+    def __init__(self):
+        self.count: int = 0
+        self.sites: list[str] = []
+
+        self.original_surface = None
+        self.original_transforms: dict = {}
+
+    def record(self, depth: int) -> None:
+        frame = sys._getframe(depth)
+
+        self.count += 1
+        self.sites.append(f"{frame.f_code.co_filename}:{frame.f_lineno}")
+
+    def reset(self) -> int:
+        count = self.count
+
+        self.count = 0
+        self.sites.clear()
+
+        return count
+
+    def install(self) -> None:
+        if self.original_surface is not None: return
+
+        counter = self
+
+        class CountingSurface(pygame.Surface):
+
+            def __init__(self, *args, **kwargs):
+                counter.record(2)
+                super().__init__(*args, **kwargs)
+
+        self.original_surface = pygame.Surface
+        pygame.Surface = CountingSurface
+
+        for name, dest_index in self.transform_functions.items():
+            function = getattr(pygame.transform, name, None)
+
+            if function is None:
+                continue
+
+            self.original_transforms[name] = function
+            setattr(pygame.transform, name, self.wrap_transform(function, dest_index))
+
+    def wrap_transform(self, function, dest_index: int):
+        def counted(*args, **kwargs):
+            if dest_index < 0 or (len(args) <= dest_index and kwargs.get("dest_surface", None) is None):
+                self.record(2)
+
+            return function(*args, **kwargs)
+
+        return counted
+
+    def uninstall(self) -> None:
+        if self.original_surface is None: return
+
+        pygame.Surface = self.original_surface
+        self.original_surface = None
+
+        for name, function in self.original_transforms.items():
+            setattr(pygame.transform, name, function)
+
+        self.original_transforms.clear()
@@ -0,0 +1,83 @@
+import pygame
+
+
+class SpatialHash:
+
+    def __init__(self, cell_size: int = 72):
+        self.cell_size = cell_size
+
+        self.cells: dict[tuple[int, int], list[tuple[int, object, pygame.Rect]]] = {}
+        self.count: int = 0
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.count = 0
+
+    def cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        return (
+            rect.left // self.cell_size,
+            (rect.right - 1) // self.cell_size,
+            rect.top // self.cell_size,
+            (rect.bottom - 1) // self.cell_size
+        )
+
+    def insert(self, obj, rect: pygame.Rect) -> None:
+        entry = (self.count, obj, rect)
+        self.count += 1
+
+        start_x, end_x, start_y, end_y = self.cell_range(rect)
+
+        for cell_x in range(start_x, end_x + 1):
+            for cell_y in range(start_y, end_y + 1):
+                cell = self.cells.get((cell_x, cell_y), None)
+
+                if cell is None:
+                    self.cells[(cell_x, cell_y)] = [entry]
+                else:
+                    cell.append(entry)
+
+    def query_point(self, pos: tuple[float, float]) -> list:
+        cell = self.cells.get((int(pos[0] // self.cell_size), int(pos[1] // self.cell_size)), None)
+
+        if cell is None:
+            return []
+
+        return [obj for _, obj, rect in cell if rect.collidepoint(pos)]
+
+    def query_rect(self, query_rect: pygame.Rect) -> list:
+        found: dict[int, object] = {}
+
+        start_x, end_x, start_y, end_y = self.cell_range(query_rect)
+
+        for cell_x in range(start_x, end_x + 1):
+            for cell_y in range(start_y, end_y + 1):
+                for order, obj, rect in self.cells.get((cell_x, cell_y), ()):
+                    if order not in found and rect.colliderect(query_rect):
+                        found[order] = obj
+
+        # Objects come back in insertion order, whatever cells they span
+        return [found[order] for order in sorted(found)]
+
+    def query_radius(self, pos: tuple[float, float], radius: float) -> list:
+        found: dict[int, object] = {}
+        squared_radius = radius * radius
+
+        start_x = int((pos[0] - radius) // self.cell_size)
+        end_x = int((pos[0] + radius) // self.cell_size)
+        start_y = int((pos[1] - radius) // self.cell_size)
+        end_y = int((pos[1] + radius) // self.cell_size)
+
+        for cell_x in range(start_x, end_x + 1):
+            for cell_y in range(start_y, end_y + 1):
+                for order, obj, rect in self.cells.get((cell_x, cell_y), ()):
+                    if order in found:
+                        continue
+
+                    # Distance from the circle center to the closest point of the rect
+                    closest_x = min(max(pos[0], rect.left), rect.right)
+                    closest_y = min(max(pos[1], rect.top), rect.bottom)
+
+                    if pow(pos[0] - closest_x, 2) + pow(pos[1] - closest_y, 2) <= squared_radius:
+                        found[order] = obj
+
+        return [found[order] for order in sorted(found)]
@@ -0,0 +1,50 @@
+import pygame
+
+from .camera import Camera
+
+
+class SpriteBatch:
+
+    def __init__(self, surface):
+        # A surface or a draw list, anything with blits (or fblits)
+        self.surface = surface
+
+        # (surface, position) pairs of the current batch, in world coordinates
+        self.sprites: list[tuple[pygame.Surface, tuple[float, float]]] = []
+
+        # Sprites flushed and blits calls made, for benchmarks
+        self.submitted: int = 0
+        self.flushes: int = 0
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def add(self, surf: pygame.Surface, pos: tuple[float, float]) -> None:
+        self.sprites.append((surf, pos))
+
+    def extend(self, sprites) -> None:
+        self.sprites.extend(sprites)
+
+    def flush(self, camera: bool = True) -> None:
+        if not self.sprites: return
+
+        # The camera offset is applied to the whole batch at once, in the same order as
+        # Camera.convert_pos so positions round the same way
+        if camera:
+            ox, oy = Camera.offset_x, Camera.offset_y
+            sx, sy = Camera.shake_x, Camera.shake_y
+            blit_sequence = [(surf, (pos[0] - ox + sx, pos[1] - oy + sy)) for surf, pos in self.sprites]
+        else:
+            blit_sequence = self.sprites.copy()
+
+        fblits = getattr(self.surface, "fblits", None)
+
+        if fblits is not None:
+            fblits(blit_sequence)
+        else:
+            self.surface.blits(blit_sequence, doreturn=False)
+
+        self.submitted += len(self.sprites)
+        self.flushes += 1
+
+        self.sprites.clear()
@@ -1,10 +1,12 @@
 import pygame
 
+from .presentation import get_presenter
+
 
 class TextInput:
 
     def __init__(self, pos: tuple[int, int], width: int, height: int, max_chars: int = 20):
-        self.window = pygame.display.get_surface()
+        self.window = get_presenter().window
         self.x, self.y = pos
         self.width, self.height = width, height
 
@@ -0,0 +1,157 @@
+from array import array
+from typing import Iterator
+
+
+CHUNK_SHIFT: int = 4
+CHUNK_SIZE: int = 1 << CHUNK_SHIFT
+CHUNK_MASK: int = CHUNK_SIZE - 1
+CHUNK_CELLS: int = CHUNK_SIZE * CHUNK_SIZE
+
+
+def chunk_key(i: int, j: int) -> tuple[int, int]:
+    return i >> CHUNK_SHIFT, j >> CHUNK_SHIFT
+
+
+def cell_index(i: int, j: int) -> int:
+    return ((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)
+
+
+class TileChunk:
+
+    def __init__(self):
+        # 0 means empty, otherwise palette index + 1
+        self.types = bytearray(CHUNK_CELLS)
+        self.variants = bytearray(CHUNK_CELLS)
+        self.layers = array("b", bytes(CHUNK_CELLS))
+
+        self.count: int = 0
+
+    def cells(self) -> Iterator[tuple[int, int, int, int, int]]:
+        types = self.types
+        for cell in range(CHUNK_CELLS):
+            if types[cell]:
+                yield cell & CHUNK_MASK, cell >> CHUNK_SHIFT, types[cell] - 1, self.variants[cell], self.layers[cell]
+
+
+class TileStore:
+
+    streamed: bool = False
+
+    def __init__(self):
+        self.chunks: dict[tuple[int, int], TileChunk] = {}
+
+        self.palette: list[str] = []
+        self.palette_indexes: dict[str, int] = {}
+
+    def intern(self, tile_type: str) -> int:
+        palette_index = self.palette_indexes.get(tile_type, None)
+
+        if palette_index is None:
+            if len(self.palette) >= 255:
+                raise ValueError(f"Too many tile types in palette, cannot add {tile_type}")
+
+            palette_index = len(self.palette)
+            self.palette.append(tile_type)
+            self.palette_indexes[tile_type] = palette_index
+
+        return palette_index
+
+    def set(self, i: int, j: int, tile_type: str, variant: int, layer: int = 0) -> None:
+        key = (i >> CHUNK_SHIFT, j >> CHUNK_SHIFT)
+        chunk = self.chunks.get(key, None)
+
+        if chunk is None:
+            chunk = TileChunk()
+            self.chunks[key] = chunk
+
+        cell = ((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)
+
+        if not chunk.types[cell]:
+            chunk.count += 1
+
+        chunk.types[cell] = self.intern(tile_type) + 1
+        chunk.variants[cell] = variant
+        chunk.layers[cell] = layer
+
+    def get(self, i: int, j: int) -> dict | None:
+        chunk = self.chunks.get((i >> CHUNK_SHIFT, j >> CHUNK_SHIFT), None)
+
+        if chunk is None:
+            return None
+
+        cell = ((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)
+        type_index = chunk.types[cell]
+
+        if not type_index:
+            return None
+
+        return {
+            "indexes": (i, j),
+            "tile_type": self.palette[type_index - 1],
+            "variant": chunk.variants[cell],
+            "layer": chunk.layers[cell]
+        }
+
+    def get_type(self, i: int, j: int) -> str | None:
+        chunk = self.chunks.get((i >> CHUNK_SHIFT, j >> CHUNK_SHIFT), None)
+
+        if chunk is None:
+            return None
+
+        type_index = chunk.types[((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)]
+
+        return self.palette[type_index - 1] if type_index else None
+
+    def delete(self, i: int, j: int) -> None:
+        key = (i >> CHUNK_SHIFT, j >> CHUNK_SHIFT)
+        chunk = self.chunks.get(key, None)
+
+        if chunk is None:
+            return
+
+        cell = ((j & CHUNK_MASK) << CHUNK_SHIFT) | (i & CHUNK_MASK)
+
+        if chunk.types[cell]:
+            chunk.types[cell] = 0
+            chunk.variants[cell] = 0
+            chunk.layers[cell] = 0
+            chunk.count -= 1
+
+            if chunk.count == 0:
+                del self.chunks[key]
+
+    def clear(self) -> None:
+        self.chunks.clear()
+
+    def __len__(self) -> int:
+        return sum(chunk.count for chunk in self.chunks.values())
+
+    def __iter__(self) -> Iterator[dict]:
+        for (ci, cj), chunk in self.chunks.items():
+            for x, y, type_index, variant, layer in chunk.cells():
+                yield {
+                    "indexes": ((ci << CHUNK_SHIFT) + x, (cj << CHUNK_SHIFT) + y),
+                    "tile_type": self.palette[type_index],
+                    "variant": variant,
+                    "layer": layer
+                }
+
+    @classmethod
+    def from_dict(cls, tiles: dict[str, dict]) -> "TileStore":
+        store = cls()
+
+        for tile in tiles.values():
+            indexes = tile["indexes"]
+            store.set(indexes[0], indexes[1], tile["tile_type"], tile["variant"], tile.get("layer", 0))
+
+        return store
+
+    def to_dict(self) -> dict[str, dict]:
+        tiles: dict[str, dict] = {}
+
+        for tile in self:
+            indexes = tile["indexes"]
+            tile["indexes"] = list(indexes)
+            tiles[f"{indexes[0]};{indexes[1]}"] = tile
+
+        return tiles
@@ -0,0 +1,212 @@
+import mmap
+from collections import OrderedDict
+from typing import Callable, Iterator
+
+from .tile_store import TileStore, TileChunk, CHUNK_CELLS, chunk_key
+from .level_format import (
+    read_sections,
+    unpack_palette,
+    unpack_chunk_directory,
+    unpack_chunk,
+    parse_binary_level,
+    CHUNK_RECORD_SIZE
+)
+
+
+class StreamedChunks:
+
+    def __init__(self, max_resident: int = 1024):
+        self.max_resident = max_resident
+
+        self.data: mmap.mmap | None = None
+
+        # Chunks present in the mapped file, by their record offset
+        self.offsets: dict[tuple[int, int], int] = {}
+        # Clean chunks decoded from the file, least recently used first
+        self.resident: OrderedDict[tuple[int, int], TileChunk] = OrderedDict()
+        # Chunks edited since the file was mapped, never evicted
+        self.pinned: dict[tuple[int, int], TileChunk] = {}
+
+        self.evict_callbacks: list[Callable[[tuple[int, int]], None]] = []
+
+    def get(self, key: tuple[int, int], default: TileChunk | None = None) -> TileChunk | None:
+        chunk = self.pinned.get(key, None)
+
+        if chunk is not None:
+            return chunk
+
+        chunk = self.resident.get(key, None)
+
+        if chunk is not None:
+            self.resident.move_to_end(key)
+            return chunk
+
+        offset = self.offsets.get(key, None)
+
+        if offset is None:
+            return default
+
+        chunk = unpack_chunk(self.data, offset)
+        self.resident[key] = chunk
+        self.evict()
+
+        return chunk
+
+    def pin(self, key: tuple[int, int]) -> None:
+        if key in self.pinned: return
+
+        chunk = self.get(key)
+
+        if chunk is not None:
+            self.resident.pop(key, None)
+            self.pinned[key] = chunk
+
+    def evict(self) -> None:
+        while len(self.resident) > self.max_resident:
+            key, _ = self.resident.popitem(last=False)
+
+            for callback in self.evict_callbacks:
+                callback(key)
+
+    def __getitem__(self, key: tuple[int, int]) -> TileChunk:
+        chunk = self.get(key)
+
+        if chunk is None:
+            raise KeyError(key)
+
+        return chunk
+
+    def __setitem__(self, key: tuple[int, int], chunk: TileChunk) -> None:
+        self.resident.pop(key, None)
+        self.pinned[key] = chunk
+
+    def __delitem__(self, key: tuple[int, int]) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self.pinned.pop(key, None)
+        self.resident.pop(key, None)
+        self.offsets.pop(key, None)
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        return key in self.pinned or key in self.offsets
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        yield from list(self.offsets)
+        yield from [key for key in self.pinned if key not in self.offsets]
+
+    def __len__(self) -> int:
+        return len(self.offsets) + sum(1 for key in self.pinned if key not in self.offsets)
+
+    def keys(self) -> Iterator[tuple[int, int]]:
+        return iter(self)
+
+    def items(self) -> Iterator[tuple[tuple[int, int], TileChunk]]:
+        for key in self:
+            chunk = self.get(key)
+            if chunk is not None:
+                yield key, chunk
+
+    def values(self) -> Iterator[TileChunk]:
+        for _, chunk in self.items():
+            yield chunk
+
+    def clear(self) -> None:
+        self.offsets.clear()
+        self.resident.clear()
+        self.pinned.clear()
+
+
+class StreamedTileStore(TileStore):
+
+    streamed: bool = True
+
+    def __init__(self, filepath: str, max_resident_chunks: int = 1024):
+        super().__init__()
+
+        self.filepath = filepath
+        self.file = None
+
+        self.chunks: StreamedChunks = StreamedChunks(max_resident_chunks)
+
+        # Counting the tiles of the file means reading all of it, so it only happens when asked
+        self.file_tile_count: int | None = None
+        self.tile_count_delta: int = 0
+
+        self.open()
+
+    def open(self) -> None:
+        self.file = open(self.filepath, "rb")
+        self.chunks.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        sections = read_sections(self.chunks.data)
+
+        if b"PALT" in sections:
+            for tile_type in unpack_palette(self.chunks.data, sections[b"PALT"][0]):
+                self.intern(tile_type)
+
+        self.chunks.offsets.clear()
+
+        if b"CHNK" in sections:
+            keys, offset = unpack_chunk_directory(self.chunks.data, sections[b"CHNK"][0])
+
+            for n, key in enumerate(keys):
+                self.chunks.offsets[key] = offset + n * CHUNK_RECORD_SIZE
+
+    def close(self) -> None:
+        if self.chunks.data is not None:
+            self.chunks.data.close()
+            self.chunks.data = None
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def reopen(self) -> None:
+        # The file now holds every edit, so edited chunks become clean, evictable chunks
+        self.close()
+        self.open()
+
+        if self.file_tile_count is not None:
+            self.file_tile_count += self.tile_count_delta
+        self.tile_count_delta = 0
+
+        self.chunks.resident.update(self.chunks.pinned)
+        self.chunks.pinned.clear()
+        self.chunks.evict()
+
+    def read_level(self) -> dict:
+        map_obj = parse_binary_level(self.chunks.data, with_tiles=False)
+        map_obj["tiles"] = self
+
+        return map_obj
+
+    def set(self, i: int, j: int, tile_type: str, variant: int, layer: int = 0) -> None:
+        self.chunks.pin(chunk_key(i, j))
+
+        if self.get_type(i, j) is None:
+            self.tile_count_delta += 1
+
+        super().set(i, j, tile_type, variant, layer)
+
+    def delete(self, i: int, j: int) -> None:
+        self.chunks.pin(chunk_key(i, j))
+
+        if self.get_type(i, j) is not None:
+            self.tile_count_delta -= 1
+
+        super().delete(i, j)
+
+    def clear(self) -> None:
+        super().clear()
+        self.file_tile_count = 0
+        self.tile_count_delta = 0
+
+    def __len__(self) -> int:
+        if self.file_tile_count is None:
+            self.file_tile_count = sum(
+                CHUNK_CELLS - self.chunks.data[offset:offset + CHUNK_CELLS].count(0)
+                for offset in self.chunks.offsets.values()
+            )
+
+        return self.file_tile_count + self.tile_count_delta
@@ -1,47 +1,76 @@
+import os
 import json
 
 import pygame
 
 from .camera import Camera
+from .tile_store import TileStore, TileChunk, CHUNK_SHIFT, CHUNK_SIZE, chunk_key
+from .chunk_cache import ChunkSurfaceCache
+from .collision_grid import CollisionGrid
+from .level_format import is_binary_level, load_binary_level, save_binary_level, pack_binary_level
+from .tile_stream import StreamedTileStore
+from .sprite_batch import SpriteBatch
+from .asset_manifest import AssetManifest
 
 
 class TileMap(Camera):
 
     offset_corners = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
     offset_without_corners = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+    # Binary levels at least this big are memory-mapped and decoded chunk by chunk
+    stream_threshold: int = 8 * 1024 * 1024
+    max_resident_chunks: int = 1024
+    stream_margin: int = 2
     
     def __init__(self, surface: pygame.Surface, assets: dict, tilesize: int = 36):
         self.surface = surface
+        self.batch: SpriteBatch = SpriteBatch(surface)
         self.assets = assets
         self.tilesize = tilesize
 
-        self.tiles: dict[str, dict] = {}
+        self.tiles: TileStore = TileStore()
+        self.chunk_surfaces = ChunkSurfaceCache()
+        self.collision_grid: CollisionGrid | None = None
         self.offgrid_elements: list[dict] = []
         self.enemies: dict[str, dict] = {}
         self.grasses: dict[str, dict] = {}
         self.bottom_bound: int = 500
         self.tile_metadata: dict[str, dict] = {}
+        self.asset_manifest: AssetManifest = AssetManifest()
 
         self.player: dict = {"indexes": (0, 0), "coord": (self.tilesize // 2, self.tilesize)}
 
     def set_tile(self, indexes: tuple[int, int], tile_type: str, tile_variant: int, layer: int=0) -> None:
-        tile_obj = {
-            "indexes": indexes,
-            "tile_type": tile_type,
-            "variant": tile_variant, 
-            "layer": layer
-        }
+        self.tiles.set(indexes[0], indexes[1], tile_type, tile_variant, layer)
+        self.chunk_surfaces.invalidate(chunk_key(indexes[0], indexes[1]))
 
-        self.tiles[self.get_tile_key(indexes)] = tile_obj
+        if self.collision_grid is not None:
+            self.collision_grid.update_tile(indexes)
 
     def get_tile(self, indexes: tuple[int, int]) -> dict | None:
-        return self.tiles.get(self.get_tile_key(indexes), None)
+        return self.tiles.get(indexes[0], indexes[1])
+
+    def get_tile_type(self, indexes: tuple[int, int]) -> str | None:
+        return self.tiles.get_type(indexes[0], indexes[1])
 
     def delete_tile(self, indexes: tuple[int, int]) -> None:
-        tile_key = self.get_tile_key(indexes)
+        self.tiles.delete(indexes[0], indexes[1])
+        self.chunk_surfaces.invalidate(chunk_key(indexes[0], indexes[1]))
+
+        if self.collision_grid is not None:
+            self.collision_grid.update_tile(indexes)
+
+    def forget_chunk(self, key: tuple[int, int]) -> None:
+        self.chunk_surfaces.invalidate(key)
 
-        if tile_key in self.tiles:
-            del self.tiles[tile_key]
+        if self.collision_grid is not None:
+            self.collision_grid.forget_chunk(key)
+
+    def build_collision_grid(self, solid_types: set[str]) -> CollisionGrid:
+        self.collision_grid = CollisionGrid(self.tiles, solid_types, self.tilesize)
+
+        return self.collision_grid
 
     def set_tile_metadata(self, indexes: tuple[int, int], text: str) -> None:
         tile_obj = {
@@ -99,33 +128,91 @@ class TileMap(Camera):
         if tile_key in self.grasses:
             del self.grasses[tile_key]
 
+    def render_chunk(self, chunk: TileChunk) -> pygame.Surface:
+        chunk_surf = pygame.Surface((CHUNK_SIZE * self.tilesize, CHUNK_SIZE * self.tilesize))
+        chunk_surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+
+        for x, y, type_index, variant, _ in chunk.cells():
+            chunk_surf.blit(
+                self.assets["tiles"][self.tiles.palette[type_index]][variant - 1],
+                (x * self.tilesize, y * self.tilesize)
+            )
+
+        return chunk_surf
+
+    def visible_chunks(self) -> tuple[int, int, int, int]:
+        chunk_pixels = CHUNK_SIZE * self.tilesize
+
+        left = Camera.offset_x - Camera.shake_x
+        top = Camera.offset_y - Camera.shake_y
+
+        return (
+            int(left // chunk_pixels),
+            int((left + self.surface.get_width()) // chunk_pixels),
+            int(top // chunk_pixels),
+            int((top + self.surface.get_height()) // chunk_pixels)
+        )
+
+    def update_streaming(self) -> None:
+        # Chunks are paged in during the update, drawing only reads what is resident
+        if self.tiles.streamed:
+            self.stream_chunks(*self.visible_chunks())
+
     def draw_tiles(self) -> None:
+        chunk_pixels = CHUNK_SIZE * self.tilesize
+
+        start_ci, end_ci, start_cj, end_cj = self.visible_chunks()
+
+        for ci in range(start_ci, end_ci + 1):
+            for cj in range(start_cj, end_cj + 1):
+                chunk = self.tiles.chunks.get((ci, cj), None)
+
+                if chunk is None:
+                    continue
 
-        start_x_index = int(Camera.offset_x // self.tilesize)
-        end_x_index = int(start_x_index + self.surface.get_width() // self.tilesize)
+                chunk_surf = self.chunk_surfaces.get((ci, cj))
 
-        start_y_index = int(Camera.offset_y // self.tilesize)
-        end_y_index = int(start_y_index + self.surface.get_height() // self.tilesize)
+                if chunk_surf is None:
+                    chunk_surf = self.render_chunk(chunk)
+                    self.chunk_surfaces.put((ci, cj), chunk_surf)
 
-        for i in range(start_x_index - 1, end_x_index + 2):
-            for j in range(start_y_index - 1, end_y_index + 2):
-                tile = self.get_tile((i, j))
+                self.batch.add(chunk_surf, (ci * chunk_pixels, cj * chunk_pixels))
 
-                if tile is not None:
-                    indexes = tile["indexes"]
-                    tile_type = tile["tile_type"]
-                    variant = tile["variant"]
-                    self.surface.blit(
-                        self.assets["tiles"][tile_type][variant - 1],
-                        self.convert_pos((indexes[0] * self.tilesize, indexes[1] * self.tilesize))
-                    )
+        self.batch.flush()
+
+    def stream_chunks(self, start_ci: int, end_ci: int, start_cj: int, end_cj: int) -> None:
+        margin = self.stream_margin
+        chunks = self.tiles.chunks
+
+        # The resident budget can never be smaller than what is around the camera
+        chunks.max_resident = max(
+            self.max_resident_chunks,
+            (end_ci - start_ci + 1 + 2 * margin) * (end_cj - start_cj + 1 + 2 * margin)
+        )
+
+        for ci in range(start_ci - margin, end_ci + margin + 1):
+            for cj in range(start_cj - margin, end_cj + margin + 1):
+                chunks.get((ci, cj))
 
     def load_tiles(self, filepath: str) -> None:
-        
-        with open(filepath) as f:
-            map_obj: dict = json.load(f)
 
-        self.tiles = map_obj.get("tiles", {})
+        if self.tiles.streamed:
+            self.tiles.close()
+        
+        if is_binary_level(filepath) and os.path.getsize(filepath) >= self.stream_threshold:
+            tiles = StreamedTileStore(filepath, self.max_resident_chunks)
+            tiles.chunks.evict_callbacks.append(self.forget_chunk)
+            map_obj: dict = tiles.read_level()
+        elif is_binary_level(filepath):
+            map_obj: dict = load_binary_level(filepath)
+        else:
+            with open(filepath) as f:
+                map_obj: dict = json.load(f)
+
+        tiles = map_obj.get("tiles", {})
+        self.tiles = tiles if isinstance(tiles, TileStore) else TileStore.from_dict(tiles)
+        self.chunk_surfaces.clear()
+        self.collision_grid = None
         self.offgrid_elements = map_obj.get("offgrid_elements", [])
         self.enemies = map_obj.get("enemies", {})
         self.grasses = map_obj.get("grasses", {})
@@ -137,6 +224,10 @@ class TileMap(Camera):
         if player is not None:
             self.player = player
 
+        # Levels saved before manifests were written get theirs from what they contain
+        manifest_obj = map_obj.get("assets", None)
+        self.asset_manifest = AssetManifest.from_dict(manifest_obj) if manifest_obj is not None else AssetManifest.from_tilemap(self)
+
     def save_tiles(self, filepath: str) -> None:
 
         map_obj = {
@@ -146,9 +237,27 @@ class TileMap(Camera):
             "grasses": self.grasses,
             "bottom_bound": self.bottom_bound,
             "tile_metadata": self.tile_metadata,
-            "player": self.player
+            "player": self.player,
+            "assets": AssetManifest.from_tilemap(self).to_dict()
         }
 
+        if is_binary_level(filepath):
+            if self.tiles.streamed and os.path.abspath(filepath) == os.path.abspath(self.tiles.filepath):
+                # The mapped file cannot be rewritten while it is still being read from
+                data = pack_binary_level(map_obj)
+                self.tiles.close()
+
+                with open(filepath, "wb") as f:
+                    f.write(data)
+
+                self.tiles.reopen()
+            else:
+                save_binary_level(filepath, map_obj)
+
+            return
+
+        map_obj["tiles"] = self.tiles.to_dict()
+
         with open(filepath, "w") as f:
             json.dump(map_obj, f)
 
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TransformCache:
+
+    # Rotations are snapped to this many degrees, so nearby aim angles share one sprite
+    angle_step: float = 1
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+
+        self.surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.used_bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def surface_bytes(surf: pygame.Surface) -> int:
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def quantize_angle(self, angle: float) -> float:
+        return round(angle / self.angle_step) * self.angle_step
+
+    def get(self, key: tuple) -> pygame.Surface | None:
+        surf = self.surfaces.get(key, None)
+
+        if surf is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.surfaces.move_to_end(key)
+
+        return surf
+
+    def put(self, key: tuple, surf: pygame.Surface) -> None:
+        self.surfaces[key] = surf
+        self.used_bytes += self.surface_bytes(surf)
+
+        # Evict least recently used sprites, but always keep the one just made
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted_surf = self.surfaces.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(evicted_surf)
+            self.evictions += 1
+
+    def flipped(self, surf: pygame.Surface, flip_x: bool, flip_y: bool = False, colorkey=None) -> pygame.Surface:
+        key = (surf, bool(flip_x), bool(flip_y), 0, 1, colorkey)
+        transformed = self.get(key)
+
+        if transformed is None:
+            transformed = pygame.transform.flip(surf, flip_x, flip_y)
+            transformed.set_colorkey(colorkey)
+            self.put(key, transformed)
+
+        return transformed
+
+    def rotozoomed(self, surf: pygame.Surface, angle: float, scale: float, colorkey=None) -> pygame.Surface:
+        angle = self.quantize_angle(angle)
+
+        key = (surf, False, False, angle, scale, colorkey)
+        transformed = self.get(key)
+
+        if transformed is None:
+            transformed = pygame.transform.rotozoom(surf, angle, scale)
+            transformed.set_colorkey(colorkey)
+            self.put(key, transformed)
+
+        return transformed
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "entries": len(self.surfaces),
+            "used_bytes": self.used_bytes
+        }
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self.used_bytes = 0
@@ -0,0 +1,47 @@
+import pygame
+
+from platformer_game.tile_store import TileStore
+from platformer_game.collision_grid import CollisionGrid
+
+
+TILESIZE = 36
+
+
+def make_grid(cells: list[tuple[int, int]]) -> CollisionGrid:
+    tiles = TileStore()
+
+    for i, j in cells:
+        tiles.set(i, j, "Dirt", 1)
+
+    return CollisionGrid(tiles, {"Dirt"}, TILESIZE)
+
+
+def test_falling_snaps_to_top_most_solid_row():
+    grid = make_grid([(0, 2), (0, 3)])
+
+    assert grid.resolve_vertical(pygame.Rect(0, 60, 20, 64), 1) == 2 * TILESIZE
+
+
+def test_rising_snaps_to_bottom_most_solid_row():
+    grid = make_grid([(0, 2), (0, 3)])
+
+    assert grid.resolve_vertical(pygame.Rect(0, 80, 20, 64), -1) == 4 * TILESIZE
+
+
+def test_moving_right_snaps_to_left_most_solid_column():
+    grid = make_grid([(2, 0), (3, 0)])
+
+    assert grid.resolve_horizontal(pygame.Rect(60, 0, 64, 20), 1) == 2 * TILESIZE
+
+
+def test_moving_left_snaps_to_right_most_solid_column():
+    grid = make_grid([(2, 0), (3, 0)])
+
+    assert grid.resolve_horizontal(pygame.Rect(80, 0, 64, 20), -1) == 4 * TILESIZE
+
+
+def test_no_solid_cells():
+    grid = make_grid([])
+
+    assert grid.resolve_vertical(pygame.Rect(0, 0, 20, 64), 1) is None
+    assert grid.resolve_horizontal(pygame.Rect(0, 0, 64, 20), 1) is None
@@ -0,0 +1,62 @@
+import threading
+
+import pygame
+import pytest
+
+from platformer_game.draw_list import DrawList, RenderThread
+
+
+class FailingTarget:
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> None:
+        raise pygame.error("render failed")
+
+
+def wait_for(render_thread: RenderThread, method) -> list[BaseException]:
+    # Waited on from a helper thread so a render thread that never goes idle fails the test instead of hanging it
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            method()
+        except BaseException as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=call, daemon=True)
+    waiter.start()
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+
+    return errors
+
+
+def test_wait_raises_the_error_of_a_failed_job():
+    draw_list = DrawList(FailingTarget())
+    draw_list.blit(pygame.Surface((1, 1)), (0, 0))
+
+    render_thread = RenderThread()
+    render_thread.submit([(draw_list, draw_list.commands)])
+
+    errors = wait_for(render_thread, render_thread.wait)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], pygame.error)
+
+    # Later frames and shutdown raise as well rather than waiting on the dead thread
+    render_thread.submit([(draw_list, draw_list.commands)])
+
+    assert len(wait_for(render_thread, render_thread.wait)) == 1
+    assert len(wait_for(render_thread, render_thread.stop)) == 1
+
+
+def test_stop_after_successful_jobs():
+    target = pygame.Surface((4, 4))
+    draw_list = DrawList(target)
+    draw_list.blit(pygame.Surface((1, 1)), (0, 0))
+
+    render_thread = RenderThread()
+    render_thread.submit([(draw_list, draw_list.commands)])
+
+    assert wait_for(render_thread, render_thread.stop) == []
+    assert render_thread.frames == 1
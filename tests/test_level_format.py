@@ -0,0 +1,55 @@
+import os
+import glob
+import json
+
+import pytest
+
+from platformer_game.tilemap import TileMap
+from platformer_game.level_format import load_binary_level
+
+
+LEVELS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Levels")
+LEVEL_PATHS = sorted(glob.glob(os.path.join(LEVELS_PATH, "*", "*.json")))
+
+
+def resave(level_path: str, filepath: str) -> None:
+    tilemap = TileMap(None, assets={})
+    tilemap.load_tiles(level_path)
+    tilemap.save_tiles(filepath)
+
+
+@pytest.mark.parametrize("level_path", LEVEL_PATHS, ids=os.path.basename)
+def test_json_binary_json_round_trip(level_path, tmp_path):
+    resave(level_path, str(tmp_path / "direct.json"))
+    resave(level_path, str(tmp_path / "level.plvl"))
+    resave(str(tmp_path / "level.plvl"), str(tmp_path / "through_binary.json"))
+
+    with open(tmp_path / "direct.json") as f:
+        direct = json.load(f)
+
+    with open(tmp_path / "through_binary.json") as f:
+        through_binary = json.load(f)
+
+    assert through_binary == direct
+
+
+@pytest.mark.parametrize("level_path", LEVEL_PATHS, ids=os.path.basename)
+def test_binary_level_keeps_every_tile(level_path, tmp_path):
+    with open(level_path) as f:
+        level = json.load(f)
+
+    resave(level_path, str(tmp_path / "level.plvl"))
+    map_obj = load_binary_level(str(tmp_path / "level.plvl"))
+
+    tiles = {
+        tile_key: (list(tile["indexes"]), tile["tile_type"], tile["variant"], tile.get("layer", 0))
+        for tile_key, tile in level["tiles"].items()
+    }
+
+    assert {
+        tile_key: (tile["indexes"], tile["tile_type"], tile["variant"], tile["layer"])
+        for tile_key, tile in map_obj["tiles"].to_dict().items()
+    } == tiles
+    assert map_obj["player"]["coord"] == list(level["player"]["coord"])
+    assert map_obj["tile_metadata"].keys() == level.get("tile_metadata", {}).keys()
+    assert "assets" in map_obj
@@ -0,0 +1,66 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from platformer_game.pixel_cache import PixelCache
+
+
+@pytest.fixture
+def image_path(tmp_path, monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+
+    surf = pygame.Surface((5, 3))
+    surf.fill((200, 100, 50))
+    pygame.image.save(surf, str(tmp_path / "image.png"))
+
+    # Relative paths, as AssetRegistry asks for them
+    monkeypatch.chdir(tmp_path)
+
+    yield "image.png"
+
+    pygame.display.quit()
+
+
+def test_hit_matches_decoded_pixels(image_path, tmp_path):
+    cache = PixelCache(str(tmp_path / "pixels"))
+    decoded = pygame.image.load(image_path).convert()
+    cache.store(image_path, decoded)
+
+    surf = PixelCache(str(tmp_path / "pixels")).load(os.path.abspath(image_path))
+
+    assert surf is not None
+    assert pygame.image.tobytes(surf.convert(), "RGBX") == pygame.image.tobytes(decoded, "RGBX")
+
+
+def test_hit_is_not_written_again(image_path, tmp_path):
+    PixelCache(str(tmp_path / "pixels")).store(image_path, pygame.image.load(image_path).convert())
+
+    cache = PixelCache(str(tmp_path / "pixels"))
+    entry_path = cache.entry_path(os.path.abspath(image_path))
+    os.utime(entry_path, ns=(0, 0))
+
+    # Loaded by absolute path like the loader threads, stored by relative path like the registry
+    surf = cache.load(os.path.abspath(image_path)).convert()
+    cache.store(image_path, surf)
+
+    assert os.stat(entry_path).st_mtime_ns == 0
+
+
+def test_stale_entry_is_rebuilt_in_the_same_session(image_path, tmp_path):
+    cache = PixelCache(str(tmp_path / "pixels"))
+    cache.store(image_path, pygame.image.load(image_path).convert())
+    assert cache.load(image_path) is not None
+
+    stat = os.stat(image_path)
+    os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert cache.load(image_path) is None
+
+    cache.store(image_path, pygame.image.load(image_path).convert())
+
+    assert cache.load(image_path) is not None
+    assert cache.misses == 1
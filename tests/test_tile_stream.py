@@ -0,0 +1,62 @@
+import os
+import glob
+
+import pytest
+
+from platformer_game.tilemap import TileMap
+from platformer_game.tile_stream import StreamedTileStore
+from platformer_game.level_format import load_binary_level
+
+
+LEVELS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Levels")
+LEVEL_PATHS = sorted(glob.glob(os.path.join(LEVELS_PATH, "*", "*.json")))
+
+
+@pytest.mark.parametrize("level_path", LEVEL_PATHS, ids=os.path.basename)
+def test_streamed_store_reads_the_same_tiles(level_path, tmp_path):
+    tilemap = TileMap(None, assets={})
+    tilemap.load_tiles(level_path)
+    tilemap.save_tiles(str(tmp_path / "level.plvl"))
+
+    map_obj = load_binary_level(str(tmp_path / "level.plvl"))
+
+    # A single resident chunk makes every other chunk go through eviction and decoding again
+    tiles = StreamedTileStore(str(tmp_path / "level.plvl"), max_resident_chunks=1)
+
+    try:
+        streamed_obj = tiles.read_level()
+
+        assert tiles.to_dict() == tilemap.tiles.to_dict()
+        assert len(tiles) == len(tilemap.tiles)
+        assert tiles.palette == map_obj["tiles"].palette
+
+        del streamed_obj["tiles"]
+        del map_obj["tiles"]
+        assert streamed_obj == map_obj
+    finally:
+        tiles.close()
+
+
+def test_streamed_store_after_save_and_reopen(tmp_path):
+    level_path = os.path.join(LEVELS_PATH, "Demo levels", "lvl3.json")
+
+    tilemap = TileMap(None, assets={})
+    tilemap.load_tiles(level_path)
+    tilemap.save_tiles(str(tmp_path / "level.plvl"))
+
+    # Saving over the mapped file the store streams from
+    tilemap.stream_threshold = 0
+    tilemap.load_tiles(str(tmp_path / "level.plvl"))
+    tilemap.set_tile((-500, -500), "Dirt", 1)
+    tilemap.save_tiles(str(tmp_path / "level.plvl"))
+
+    try:
+        assert tilemap.tiles.streamed
+        assert tilemap.get_tile_type((-500, -500)) == "Dirt"
+
+        reloaded = TileMap(None, assets={})
+        reloaded.load_tiles(str(tmp_path / "level.plvl"))
+
+        assert reloaded.tiles.to_dict() == tilemap.tiles.to_dict()
+    finally:
+        tilemap.tiles.close()